@@ -94,12 +94,14 @@ class HexAdmin(admin.ModelAdmin):
     list_filter = ('maturity', 'create_time')
 
 
-# 注册其他模型
-admin.site.register(A2LModuleParameter)
-admin.site.register(Asap2Version)
-admin.site.register(AxisPts)
-admin.site.register(AxisDescr)
-admin.site.register(AxisPtsRef)
-admin.site.register(RecordLayout)
-admin.site.register(AxisPtsX)
+# 注册其他模型（均使用默认 ModelAdmin，一次性批量注册）
+admin.site.register((
+    A2LModuleParameter,
+    Asap2Version,
+    AxisPts,
+    AxisDescr,
+    AxisPtsRef,
+    RecordLayout,
+    AxisPtsX,
+))
 
@@ -1,3 +1,460 @@
-from django.test import TestCase
+import datetime
+import os
+import struct
+import tempfile
+from unittest import skipIf, skipUnless
+from unittest.mock import patch
+
+import openpyxl
+import pya2l.model as pya2l_model
+from django.test import SimpleTestCase, TestCase
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from hexparser.models import A2LFile, AxisDescr, AxisPts, AxisPtsRef, Characteristic, Measurement
+from hexparser.utils import excel_to_cfg_converter
+from hexparser.utils.a2l_client import _SECTION_READERS, _iter_measurements, _read_section_in_own_session
+from hexparser.utils.a2l_importer import A2LDataImporter
+from hexparser.utils.excel_to_cfg_converter import LXML_AVAILABLE, ExcelToCfgConverter
+from hexparser.utils.hex_client import HexParseError, IntelHexFile, RecordLayoutDecoder
 
 # Create your tests here.
+
+
+class ExcelXmlExternalEntityTests(SimpleTestCase):
+    """SpreadsheetML 中声明的外部实体不能被展开到解析结果里（XXE）"""
+
+    SECRET = 'XXE_SECRET_CONTENT'
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        secret_path = os.path.join(self.tmp_dir.name, 'secret.txt')
+        with open(secret_path, 'w', encoding='utf-8') as f:
+            f.write(self.SECRET)
+        self.excel_path = os.path.join(self.tmp_dir.name, 'signals.xls')
+        with open(self.excel_path, 'w', encoding='utf-8') as f:
+            f.write(
+                '<?xml version="1.0"?>\n'
+                f'<!DOCTYPE Workbook [<!ENTITY xxe SYSTEM "file://{secret_path}">]>\n'
+                '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"'
+                ' xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">'
+                '<Worksheet ss:Name="Sheet1"><Table>'
+                '<Row><Cell><Data ss:Type="String">名称</Data></Cell>'
+                '<Cell><Data ss:Type="String">10msRStr</Data></Cell></Row>'
+                '<Row><Cell><Data ss:Type="String">sig_&xxe;</Data></Cell>'
+                '<Cell><Data ss:Type="String">X</Data></Cell></Row>'
+                '</Table></Worksheet></Workbook>'
+            )
+
+    @skipUnless(LXML_AVAILABLE, "需要lxml")
+    def test_external_entity_not_expanded_with_lxml(self):
+        # lxml 关闭实体解析后实体引用保持未展开，解析本身成功
+        signals, total = ExcelToCfgConverter(self.excel_path).parse_excel()
+        self.assertEqual(total, 1)
+        for name, _ in signals:
+            self.assertNotIn(self.SECRET, name)
+
+    @skipIf(LXML_AVAILABLE, "已安装lxml")
+    def test_external_entity_rejected_without_lxml(self):
+        # 标准库 ElementTree 不加载外部实体，遇到实体引用直接报错
+        with self.assertRaisesRegex(ValueError, "undefined entity"):
+            ExcelToCfgConverter(self.excel_path).parse_excel()
+
+
+class ExcelXmlMalformedTests(SimpleTestCase):
+    """结构或语法有误的 SpreadsheetML 文件不能只读出部分行"""
+
+    HEADER = (
+        '<?xml version="1.0"?>\n'
+        '<Workbook xmlns="urn:schemas-microsoft-com:office:spreadsheet"'
+        ' xmlns:ss="urn:schemas-microsoft-com:office:spreadsheet">'
+        '<Worksheet ss:Name="Sheet1">'
+    )
+    ROWS = (
+        '<Row><Cell><Data ss:Type="String">名称</Data></Cell>'
+        '<Cell><Data ss:Type="String">10msRStr</Data></Cell></Row>'
+        '<Row><Cell><Data ss:Type="String">sig_a</Data></Cell>'
+        '<Cell><Data ss:Type="String">X</Data></Cell></Row>'
+    )
+
+    def _write(self, content):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        path = os.path.join(tmp_dir.name, 'signals.xls')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_well_formed(self):
+        path = self._write(self.HEADER + '<Table>' + self.ROWS + '</Table></Worksheet></Workbook>')
+        self.assertEqual(ExcelToCfgConverter(path).parse_excel(), ([('sig_a', 0)], 1))
+
+    def test_missing_table_rejected_before_rows(self):
+        # 缺少Table时在产出第一行之前就报错，从而仍会依次尝试openpyxl/xlrd
+        path = self._write(self.HEADER + self.ROWS + '</Worksheet></Workbook>')
+        with self.assertLogs('hexparser.utils.excel_to_cfg_converter', level='WARNING') as logs:
+            with self.assertRaises(Exception):
+                ExcelToCfgConverter(path).parse_excel()
+        self.assertIn('未找到Table元素', logs.output[0])
+
+    def test_truncated_after_rows(self):
+        # 已产出若干行后解析失败，回退读取同样失败时给出明确错误而不是返回部分结果
+        path = self._write(self.HEADER + '<Table>' + self.ROWS + '<Row><Cell>')
+        with self.assertLogs('hexparser.utils.excel_to_cfg_converter', level='WARNING'):
+            with self.assertRaisesRegex(ValueError, '无法读取Excel文件: XML解析失败'):
+                ExcelToCfgConverter(path).parse_excel()
+
+
+@skipUnless(excel_to_cfg_converter.CALAMINE_AVAILABLE, "需要python-calamine")
+class ExcelCalamineBackendTests(SimpleTestCase):
+    """calamine 与 openpyxl 读取同一个 xlsx 文件的结果一致"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        wb = openpyxl.Workbook()
+        wb.active.append(["不是活动工作表"])
+        ws = wb.create_sheet("signals")
+        ws.append(["名称", "10msRStr", "100msRStr"])
+        ws.append(["sig_a", "X", None])
+        ws.append([123, None, "x"])
+        ws.append([1.5, "X", None])
+        ws.append([datetime.date(2024, 1, 2), None, "X"])
+        ws.append([None, "X", None])
+        wb.active = 1
+        self.excel_path = os.path.join(tmp_dir.name, "signals.xlsx")
+        wb.save(self.excel_path)
+
+    def test_matches_openpyxl(self):
+        with patch.object(excel_to_cfg_converter, "CALAMINE_AVAILABLE", False):
+            expected = ExcelToCfgConverter(self.excel_path).parse_excel()
+        self.assertEqual(expected, ([("sig_a", 0), ("123", 1), ("1.5", 0), ("2024-01-02 00:00:00", 1)], 4))
+        self.assertEqual(ExcelToCfgConverter(self.excel_path).parse_excel(), expected)
+
+
+def _importer_parsed_data():
+    """与 parse_all_a2l_data 输出结构一致的最小 A2L 解析结果"""
+    return {
+        "project": {"name": "P", "long_identifier": "proj"},
+        "module": {"name": "M", "long_identifier": "mod", "project_name": "P"},
+        "module_parameters": None,
+        "asap2_version": {"version_no": 1, "upgrade_no": 61},
+        "compu_methods": [
+            {"name": "CM.IDENT", "long_identifier": "identity", "conversion_type": "IDENTICAL", "format_str": "%3.0"},
+            {"name": "CM.LIN", "long_identifier": "linear", "conversion_type": "RAT_FUNC", "format_str": "%6.2",
+             "units": "rpm", "coeffs": {"a": 0, "b": 2, "c": 0, "d": 0, "e": 0, "f": 1}},
+        ],
+        "characteristics": [
+            {"name": "C.VALUE", "long_identifier": "value", "characteristic_type": "VALUE", "ecu_address": 0x1000,
+             "record_layout": "RL.VALUE", "conversion_method": "CM.IDENT", "max_diff": 0.0,
+             "lower_limit": 0.0, "upper_limit": 255.0, "number": 0, "axis_pts_refs": []},
+            {"name": "C.CURVE", "long_identifier": "curve", "characteristic_type": "CURVE", "ecu_address": 0x2000,
+             "record_layout": "RL.VALUE", "conversion_method": "CM.LIN", "max_diff": 1.0,
+             "lower_limit": -10.0, "upper_limit": 10.0, "number": 4, "axis_pts_refs": ["AX.PTS"]},
+        ],
+        "measurements": [
+            {"name": "M.SPEED", "long_identifier": "speed", "datatype": "UWORD", "conversion_method": "CM.LIN",
+             "resolution": 1, "accuracy": 0.5, "lower_limit": 0.0, "upper_limit": 8000.0, "ecu_address": 0x3000},
+        ],
+        "axis_pts": [
+            {"name": "AX.PTS", "long_identifier": "axis", "ecu_address": 0x4000, "input_quantity": "M.SPEED",
+             "record_layout": "RL.AXIS", "max_diff": 0.0, "conversion_method": "CM.IDENT", "max_axis_points": 4,
+             "lower_limit": 0.0, "upper_limit": 100.0},
+        ],
+        "axis_descrs": [
+            {"characteristic_name": "C.CURVE", "attribute": "COM_AXIS", "input_quantity": "M.SPEED",
+             "conversion_method": "CM.IDENT", "max_axis_points": 4, "lower_limit": 0.0, "upper_limit": 100.0,
+             "axis_pts_ref_name": "AX.PTS"},
+        ],
+        "axis_pts_refs": [
+            {"characteristic_name": "C.CURVE", "attribute": "COM_AXIS", "conversion_method": "CM.IDENT",
+             "axis_points": "AX.PTS"},
+        ],
+        "record_layouts": [{"module_name": "M", "name": "RL.VALUE"}, {"module_name": "M", "name": "RL.AXIS"}],
+        "axis_pts_x": [
+            {"record_layout_name": "RL.AXIS", "position": 1, "datatype": "UBYTE", "index_incr": "INDEX_INCR",
+             "addressing": "DIRECT"},
+        ],
+    }
+
+
+class A2LDataImporterTests(TestCase):
+    """A2L 解析结果入库：首次导入、重复导入与修改后重新导入"""
+
+    def setUp(self):
+        self.a2l_file = A2LFile.objects.create(name='test.a2l', file_path='/tmp/test.a2l')
+
+    def _save(self, parsed_data, updater='tester'):
+        return A2LDataImporter(self.a2l_file, updater=updater).save(parsed_data)
+
+    def _characteristics(self):
+        return {c.name: c for c in Characteristic.objects.filter(a2l_file=self.a2l_file)}
+
+    def test_first_import(self):
+        stats = self._save(_importer_parsed_data())
+
+        self.assertEqual(stats['characteristics'], 2)
+        self.assertEqual(stats['measurements'], 1)
+        self.assertEqual(stats['compu_methods'], 2)
+        self.assertEqual(stats['coeffs'], 1)
+        self.assertEqual(stats['axis_pts'], 1)
+        self.assertEqual(stats['axis_descrs'], 1)
+        self.assertEqual(stats['axis_pts_refs'], 1)
+        self.assertEqual(stats['record_layouts'], 2)
+        self.assertEqual(stats['axis_pts_x'], 1)
+
+        curve = self._characteristics()['C.CURVE']
+        self.assertEqual(curve.ecu_address, 0x2000)
+        self.assertEqual(curve.characteristic_type, 'CURVE')
+        self.assertEqual(curve.number, 4)
+        self.assertEqual(curve.upper_limit, 10.0)
+        self.assertEqual(curve.conversion_method.name, 'CM.LIN')
+        self.assertEqual(curve.conversion_method.coefficient.b, 2)
+        self.assertEqual(curve.updater, 'tester')
+        measurement = Measurement.objects.get(a2l_file=self.a2l_file, name='M.SPEED')
+        self.assertEqual(measurement.ecu_address, 0x3000)
+        self.assertEqual(measurement.datatype, 'UWORD')
+        self.assertEqual(measurement.accuracy, 0.5)
+        self.assertEqual(
+            list(AxisPtsRef.objects.values_list('axis_descr__characteristic__name', 'axis_points')),
+            [('C.CURVE', 'AX.PTS')],
+        )
+
+    def test_reimport_unchanged(self):
+        self._save(_importer_parsed_data())
+        ids_before = {name: c.id for name, c in self._characteristics().items()}
+
+        stats = self._save(_importer_parsed_data())
+
+        self.assertEqual(stats['characteristics'], 0)
+        self.assertEqual(stats['measurements'], 0)
+        self.assertEqual(stats['axis_pts'], 0)
+        self.assertEqual(stats['coeffs'], 0)
+        self.assertEqual({name: c.id for name, c in self._characteristics().items()}, ids_before)
+        self.assertEqual(Measurement.objects.filter(a2l_file=self.a2l_file).count(), 1)
+        self.assertEqual(AxisPts.objects.filter(a2l_file=self.a2l_file).count(), 1)
+        # AxisDescr / AxisPtsRef 每次导入先删除再重建
+        self.assertEqual(AxisDescr.objects.count(), 1)
+        self.assertEqual(AxisPtsRef.objects.count(), 1)
+
+    def test_reimport_changed(self):
+        self._save(_importer_parsed_data())
+        ids_before = {name: c.id for name, c in self._characteristics().items()}
+
+        parsed_data = _importer_parsed_data()
+        parsed_data['characteristics'][0]['long_identifier'] = 'value v2'
+        parsed_data['characteristics'][0]['upper_limit'] = 1000.0
+        parsed_data['characteristics'].append(
+            dict(parsed_data['characteristics'][0], name='C.NEW', ecu_address=0x1100)
+        )
+        parsed_data['measurements'] = [
+            {"name": "M.TEMP", "long_identifier": "temp", "datatype": "SBYTE", "conversion_method": "CM.IDENT",
+             "resolution": 1, "accuracy": 0.0, "lower_limit": -40.0, "upper_limit": 120.0, "ecu_address": 0x3100},
+        ]
+        parsed_data['axis_pts'][0]['long_identifier'] = 'axis v2'
+        parsed_data['compu_methods'][1]['coeffs']['b'] = 3
+        parsed_data['axis_descrs'] = []
+        parsed_data['axis_pts_refs'] = []
+        stats = self._save(parsed_data, updater='tester2')
+
+        self.assertEqual(stats['characteristics'], 1)
+        self.assertEqual(stats['measurements'], 1)
+        self.assertEqual(stats['axis_pts'], 0)
+        self.assertEqual(stats['coeffs'], 1)
+        self.assertEqual(stats['axis_descrs'], 0)
+
+        characteristics = self._characteristics()
+        self.assertEqual(set(characteristics), {'C.VALUE', 'C.CURVE', 'C.NEW'})
+        # 已有记录原地更新，主键不变
+        value = characteristics['C.VALUE']
+        self.assertEqual(value.id, ids_before['C.VALUE'])
+        self.assertEqual(value.long_identifier, 'value v2')
+        self.assertEqual(value.upper_limit, 1000.0)
+        self.assertEqual(value.updater, 'tester2')
+        self.assertEqual(value.conversion_method.name, 'CM.IDENT')
+        curve = characteristics['C.CURVE']
+        self.assertEqual(curve.id, ids_before['C.CURVE'])
+        self.assertEqual(curve.long_identifier, 'curve')
+        self.assertEqual(curve.conversion_method.coefficient.b, 3)
+        self.assertEqual(characteristics['C.NEW'].ecu_address, 0x1100)
+        # 新文件中不存在的测量量不会被删除
+        self.assertEqual(
+            set(Measurement.objects.filter(a2l_file=self.a2l_file).values_list('name', flat=True)),
+            {'M.SPEED', 'M.TEMP'},
+        )
+        self.assertEqual(AxisPts.objects.get(a2l_file=self.a2l_file).long_identifier, 'axis v2')
+        self.assertFalse(AxisDescr.objects.exists())
+        self.assertFalse(AxisPtsRef.objects.exists())
+
+
+class SectionReaderSessionTests(SimpleTestCase):
+    """工作线程使用独立会话读取的分段结果应与在主会话上串行读取一致"""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.a2l_path = os.path.join(tmp_dir.name, 'sections.a2l')
+        db_url = 'sqlite:///' + os.path.join(tmp_dir.name, 'sections.a2ldb')
+
+        engine = create_engine(db_url)
+        pya2l_model.Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            module = pya2l_model.Module(name='M', longIdentifier='mod')
+            record_layout = pya2l_model.RecordLayout(name='RL.AXIS')
+            record_layout.module = module
+            axis_pts_x = pya2l_model.AxisPtsX(
+                position=1, datatype='UBYTE', indexIncr='INDEX_INCR', addressing='DIRECT',
+            )
+            axis_pts_x.record_layout = record_layout
+            measurement = pya2l_model.Measurement(
+                name='M.SPEED', longIdentifier='speed', datatype='UWORD', conversion='CM.IDENT',
+                resolution=1, accuracy=0.5, lowerLimit=0, upperLimit=8000,
+            )
+            measurement.ecu_address = pya2l_model.EcuAddress(address=0x3000)
+            session.add_all([
+                module,
+                record_layout,
+                axis_pts_x,
+                measurement,
+                pya2l_model.CompuMethod(
+                    name='CM.IDENT', longIdentifier='identity', conversionType='IDENTICAL', format='%3.0', unit='',
+                ),
+                pya2l_model.AxisPts(
+                    name='AX.PTS', longIdentifier='axis', address=0x4000, inputQuantity='M.SPEED',
+                    depositAttr='RL.AXIS', maxDiff=0, conversion='CM.IDENT', maxAxisPoints=4,
+                    lowerLimit=0, upperLimit=100,
+                ),
+            ])
+            session.commit()
+        # pya2l 以 LOCKING_MODE=EXCLUSIVE 打开连接，写入完成后释放，其他连接才能读取
+        engine.dispose()
+
+        engine = create_engine(db_url)
+        self.addCleanup(engine.dispose)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+
+    def test_own_session_matches_serial_read(self):
+        for section, reader in _SECTION_READERS.items():
+            with self.subTest(section=section):
+                expected = list(reader(self.session))
+                self.assertTrue(expected)
+                self.assertEqual(_read_section_in_own_session(self.a2l_path, reader), expected)
+
+
+class MeasurementEcuAddressTests(TestCase):
+    """MEASUREMENT 的 ECU_ADDRESS 在 pya2l 中是关联对象，解析和入库后应为整数地址"""
+
+    def setUp(self):
+        # 直接在内存中建立 pya2l 的表结构，只验证行读取逻辑，不依赖 A2L 文件导入
+        engine = create_engine('sqlite://')
+        self.addCleanup(engine.dispose)
+        pya2l_model.Base.metadata.create_all(engine)
+        self.session = Session(engine)
+        self.addCleanup(self.session.close)
+        with_address = pya2l_model.Measurement(
+            name='M.SPEED', longIdentifier='speed', datatype='UWORD', conversion='CM.LIN',
+            resolution=1, accuracy=0.5, lowerLimit=0, upperLimit=8000,
+        )
+        with_address.ecu_address = pya2l_model.EcuAddress(address=0x3000)
+        without_address = pya2l_model.Measurement(
+            name='M.NOADDR', longIdentifier='no address', datatype='UBYTE', conversion='CM.IDENT',
+            resolution=1, accuracy=0.0, lowerLimit=0, upperLimit=255,
+        )
+        self.session.add_all([with_address, without_address])
+        self.session.commit()
+
+    def test_parsed_address_is_int(self):
+        addresses = {item['name']: item['ecu_address'] for item in _iter_measurements(self.session)}
+
+        self.assertEqual(addresses, {'M.SPEED': 0x3000, 'M.NOADDR': 0})
+        self.assertIs(type(addresses['M.SPEED']), int)
+
+    def test_imported_address(self):
+        a2l_file = A2LFile.objects.create(name='test.a2l', file_path='/tmp/test.a2l')
+        parsed_data = _importer_parsed_data()
+        parsed_data['measurements'] = list(_iter_measurements(self.session))
+        A2LDataImporter(a2l_file).save(parsed_data)
+
+        self.assertEqual(
+            dict(Measurement.objects.filter(a2l_file=a2l_file).values_list('name', 'ecu_address')),
+            {'M.SPEED': 0x3000, 'M.NOADDR': 0},
+        )
+
+
+def _hex_line(record_type, offset, data):
+    """生成一条带校验和的 Intel HEX 记录"""
+    body = bytes((len(data), offset >> 8, offset & 0xFF, record_type)) + data
+    return ":" + (body + bytes(((-sum(body)) & 0xFF,))).hex().upper()
+
+
+class IntelHexFileTests(SimpleTestCase):
+    """Intel HEX 读取：跨记录读取、地址空洞、扩展线性地址"""
+
+    FLOATS = (1.5, -2.25, 100.0, 0.125)
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        lines = [
+            _hex_line(0x04, 0, b"\x80\x00"),               # 第1行：高16位 0x8000
+            _hex_line(0x00, 0x0000, bytes(range(0, 4))),    # 第2行：0x80000000-0x80000003
+            _hex_line(0x00, 0x0004, bytes(range(4, 8))),    # 第3行：0x80000004-0x80000007
+            _hex_line(0x00, 0x0010, bytes(range(16, 20))),  # 第4行：0x80000010 起，中间有空洞
+            _hex_line(0x04, 0, b"\x00\x01"),               # 第5行：高16位 0x0001
+            _hex_line(0x00, 0x0000, struct.pack("<4f", *self.FLOATS)),  # 第6行：0x00010000
+            ":00000001FF",
+        ]
+        self.hex_path = os.path.join(tmp_dir.name, "sample.hex")
+        with open(self.hex_path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+
+    def test_read_spanning_records(self):
+        hex_file = IntelHexFile(self.hex_path)
+        self.assertEqual(hex_file.fetch_bytes(0x80000002, 4), (bytes((2, 3, 4, 5)), 2))
+        self.assertEqual(hex_file.fetch_bytes(0x80000000, 8), (bytes(range(8)), 2))
+        self.assertEqual(hex_file.fetch_bytes(0x80000011, 2), (bytes((17, 18)), 4))
+
+    def test_gap_raises_key_error(self):
+        hex_file = IntelHexFile(self.hex_path)
+        with self.assertRaises(KeyError):
+            hex_file.fetch_bytes(0x80000006, 4)
+        with self.assertRaises(KeyError):
+            hex_file.fetch_bytes(0x80000008, 1)
+        with self.assertRaises(KeyError):
+            hex_file.fetch_bytes(0x80000012, 4)
+
+    def test_extended_linear_address(self):
+        hex_file = IntelHexFile(self.hex_path)
+        self.assertEqual(
+            [(record.base_address, record.line_no) for record in hex_file.iter_records()],
+            [(0x00010000, 6), (0x80000000, 2), (0x80000004, 3), (0x80000010, 4)],
+        )
+        data, line_no = hex_file.fetch_bytes(0x00010000, 16)
+        self.assertEqual(line_no, 6)
+        self.assertEqual(RecordLayoutDecoder("Lookup1D_FLOAT32_IEEE").decode_many(data, 4), list(self.FLOATS))
+
+    def test_invalid_hex_digit(self):
+        with open(self.hex_path, "a") as f:
+            f.write(":02000000ZZ11AA\n")
+        with self.assertRaisesRegex(HexParseError, "第 8 行"):
+            IntelHexFile(self.hex_path)
+
+
+class RecordLayoutDecoderTests(SimpleTestCase):
+    """decode_many 与逐个 decode 的结果一致"""
+
+    def test_decode_many_matches_decode(self):
+        data = bytes(range(48))
+        for layout in ("Scalar_FLOAT32_IEEE", "UWORD", "SLONG", "FLOAT64_IEEE", "SBYTE"):
+            decoder = RecordLayoutDecoder(layout)
+            size = decoder.element_size
+            count = len(data) // size
+            expected = [decoder.decode(data[i * size:(i + 1) * size]) for i in range(count)]
+            with self.subTest(layout=layout):
+                self.assertEqual(decoder.decode_many(data, count), expected)
+
+    def test_decode_many_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            RecordLayoutDecoder("UWORD").decode_many(b"\x00\x01\x02", 2)
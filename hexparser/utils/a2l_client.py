@@ -1,12 +1,105 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
-from collections import Counter
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, OrderedDict, defaultdict
 from contextlib import contextmanager
-from typing import Dict, List
+from operator import attrgetter
+from typing import Dict, Iterator, List, Tuple
 import pya2l.model as model
-from pya2l import DB
+from pya2l import DB, path_components
+from sqlalchemy import create_engine
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, Session, joinedload, load_only, selectinload
+
+
+def _primary_key_getter(mapped_class) -> attrgetter:
+    """Return a getter for the primary key attribute ('id' or 'rid') used by a pya2l model."""
+    return attrgetter("id" if hasattr(mapped_class, "id") else "rid")
+
+
+_get_axis_descr_id = _primary_key_getter(model.AxisDescr)
+
+
+# 需要解析坐标轴（AXIS_DESCR / AXIS_PTS）的 Characteristic 类型
+_AXIS_SUPPORTED_TYPES = frozenset({"CURVE", "MAP", "CUBOID"})
+
+def _resolve_address_attr(mapped_class) -> str:
+    """Return the ECU address attribute name used by the installed pya2l version."""
+    for name in ("address", "ecuAddress", "ecu_address"):
+        if hasattr(mapped_class, name):
+            return name
+    return "address"
+
+
+_MEAS_ADDR = _resolve_address_attr(model.Measurement)
+_AXIS_PTS_ADDR = _resolve_address_attr(model.AxisPts)
+
+
+def _scalar_value(value, attr: str):
+    """pya2l models optional keywords such as ECU_ADDRESS / NUMBER as related rows; return the plain value."""
+    return getattr(value, attr, value)
+
+
+# 热循环中需要的列：同时用于 load_only（只查这些列）和 attrgetter（一次 C 级调用批量取值）
+_COMPU_METHOD_COLUMNS = ("name", "longIdentifier", "conversionType", "format")
+_CHARACTERISTIC_COLUMNS = (
+    "name", "longIdentifier", "type", "address", "deposit", "conversion", "maxDiff", "lowerLimit", "upperLimit",
+)
+_MEASUREMENT_COLUMNS = (
+    "name", "longIdentifier", "datatype", "conversion", "resolution", "accuracy", "lowerLimit", "upperLimit",
+)
+_AXIS_PTS_COLUMNS = (
+    "name", "longIdentifier", "inputQuantity", "depositAttr", "maxDiff", "conversion", "maxAxisPoints",
+    "lowerLimit", "upperLimit",
+)
+
+_get_compu_method_fields = attrgetter(*_COMPU_METHOD_COLUMNS)
+_get_characteristic_fields = attrgetter(*_CHARACTERISTIC_COLUMNS)
+_get_measurement_fields = attrgetter(*_MEASUREMENT_COLUMNS)
+_get_axis_pts_fields = attrgetter(*_AXIS_PTS_COLUMNS)
+
+
+def _mapped_property(mapped_class, name: str):
+    return getattr(getattr(mapped_class, name, None), "property", None)
+
+
+def _row_load_options(mapped_class, columns, extra_attrs=()) -> List:
+    """Build query options loading only the given columns; relationships read per row are selectin-loaded."""
+    column_attrs = [getattr(mapped_class, name) for name in columns]
+    options = []
+    for name in extra_attrs:
+        prop = _mapped_property(mapped_class, name)
+        if isinstance(prop, ColumnProperty):
+            column_attrs.append(getattr(mapped_class, name))
+        elif isinstance(prop, RelationshipProperty):
+            options.append(selectinload(getattr(mapped_class, name)))
+    options.append(load_only(*column_attrs))
+    return options
+
+
+# 单条 IN 查询的参数上限，兼容 SQLite 默认 999 个绑定变量
+_IN_QUERY_CHUNK = 500
+
+
+def _query_axis_pts_max_points(session, names) -> Dict[str, int]:
+    """Look up AXIS_PTS maxAxisPoints for the given names with batched IN queries."""
+    names = sorted(names)
+    max_points_by_name: Dict[str, int] = {}
+    for start in range(0, len(names), _IN_QUERY_CHUNK):
+        rows = (
+            session.query(model.AxisPts.name, model.AxisPts.maxAxisPoints)
+            .filter(model.AxisPts.name.in_(names[start:start + _IN_QUERY_CHUNK]))
+            .order_by(model.AxisPts.rid)
+        )
+        for name, max_points in rows:
+            # 同名时与逐条查询 .first() 一致，取最早定义的一条
+            max_points_by_name.setdefault(name, max_points)
+    return max_points_by_name
+
 
 def _get_a2l_cache_files(file_path: str) -> List[str]:
     """Collect pya2l cache files generated next to the original A2L file."""
@@ -21,35 +114,123 @@ def _get_a2l_cache_files(file_path: str) -> List[str]:
     return [candidate for candidate in candidates if os.path.exists(candidate)]
 
 
+# 已打开的 pya2l 会话池：abspath -> ((st_mtime_ns, st_size), session)，按 LRU 淘汰
+_SESSION_POOL_SIZE = 4
+_SESSION_POOL: "OrderedDict[str, Tuple[Tuple[int, int], object]]" = OrderedDict()
+_SESSION_POOL_LOCK = threading.Lock()
+
+
+def _file_signature(file_path: str) -> Tuple[int, int]:
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _open_a2l_session(file_path: str):
+    """Open the pya2l database for the file, importing the A2L first if no cache exists."""
+    db = DB()
+    try:
+        session = db.open_existing(file_path)
+        logging.info("复用已有 A2L 数据库: %s", f"{file_path}")
+    except Exception:
+        db.import_a2l(file_path)
+        session = db.open_existing(file_path)
+        logging.info("首次导入 A2L 文件并生成缓存: %s", file_path)
+    return session
+
+
+def _close_session_quietly(session) -> None:
+    try:
+        session.close()
+    except Exception:
+        pass
+
+
+def _checkout_pooled_session(file_path: str, signature: Tuple[int, int]):
+    """Take the pooled session for the file out of the pool, opening a new one on miss or change."""
+    with _SESSION_POOL_LOCK:
+        entry = _SESSION_POOL.pop(file_path, None)
+    if entry is not None:
+        pooled_signature, session = entry
+        if pooled_signature == signature:
+            return session
+        # 文件已变化，旧会话作废
+        _close_session_quietly(session)
+    return _open_a2l_session(file_path)
+
+
+def _release_pooled_session(file_path: str, signature: Tuple[int, int], session) -> None:
+    """Return a session to the pool; surplus or evicted sessions are closed."""
+    # 先 expunge 再 rollback：释放身份映射与连接，同时不让已返回给调用方的对象过期
+    session.expunge_all()
+    session.rollback()
+    to_close = []
+    with _SESSION_POOL_LOCK:
+        if file_path in _SESSION_POOL:
+            # 并发使用时其他线程已归还同一文件的会话
+            to_close.append(session)
+        else:
+            _SESSION_POOL[file_path] = (signature, session)
+            while len(_SESSION_POOL) > _SESSION_POOL_SIZE:
+                _, (_, evicted) = _SESSION_POOL.popitem(last=False)
+                to_close.append(evicted)
+    for stale in to_close:
+        _close_session_quietly(stale)
+
+
+def _discard_pooled_session(file_path: str) -> None:
+    with _SESSION_POOL_LOCK:
+        entry = _SESSION_POOL.pop(file_path, None)
+    if entry is not None:
+        _close_session_quietly(entry[1])
+
+
+def close_all_a2l_sessions() -> None:
+    """Close every pooled pya2l session (e.g. on worker shutdown)."""
+    with _SESSION_POOL_LOCK:
+        sessions = [session for _, session in _SESSION_POOL.values()]
+        _SESSION_POOL.clear()
+    for session in sessions:
+        _close_session_quietly(session)
+
+
 @contextmanager
 def _a2l_session(file_path: str, cleanup_cache: bool = False):
-    """Provide a pya2l session for the given file and optionally cleanup cache files."""
+    """Provide a pya2l session for the given file and optionally cleanup cache files.
+
+    Sessions are pooled per file and reused while the file's mtime/size are unchanged.
+    With ``cleanup_cache`` the cache files are deleted afterwards, so the session is not pooled.
+    """
     file_path = os.path.abspath(os.path.normpath(file_path))
     if not os.path.exists(file_path):
         raise RuntimeError(f"文件不存在: {file_path}")
     if not os.path.isfile(file_path):
         raise RuntimeError(f"路径不是文件: {file_path}")
 
-    db = DB()
-    session = None
-    try:
+    if cleanup_cache:
+        # 缓存文件即将被删除，先关闭池中指向它的会话
+        _discard_pooled_session(file_path)
+        session = None
         try:
-            session = db.open_existing(file_path)
-            logging.info("复用已有 A2L 数据库: %s", f"{file_path}")
-        except Exception:
-            db.import_a2l(file_path)
-            session = db.open_existing(file_path)
-            logging.info("首次导入 A2L 文件并生成缓存: %s", file_path)
-        yield session
-    finally:
-        if session:
-            session.close()
-        if cleanup_cache:
+            session = _open_a2l_session(file_path)
+            yield session
+        finally:
+            if session:
+                session.close()
             for cache_path in _get_a2l_cache_files(file_path):
                 try:
                     os.remove(cache_path)
                 except Exception:
                     pass
+        return
+
+    signature = _file_signature(file_path)
+    session = _checkout_pooled_session(file_path, signature)
+    try:
+        yield session
+    except BaseException:
+        _close_session_quietly(session)
+        raise
+    _release_pooled_session(file_path, signature, session)
 
 def _decode_text(text: object) -> str:
     """Attempt to fix garbled strings that were interpreted as latin1."""
@@ -59,28 +240,244 @@ def _decode_text(text: object) -> str:
         text = str(text)
     if not text:
         return ""
-    if any(ord(ch) > 127 for ch in text):
-        try:
-            return text.encode("latin1").decode("gbk")
-        except UnicodeError:
-            return text
-    return text
+    return _decode_text_str(text)
+
+
+@functools.lru_cache(maxsize=65536)
+def _decode_text_str(text: str) -> str:
+    """Cached core of `_decode_text`; A2L names and descriptions repeat heavily."""
+    if text.isascii():
+        return text
+    # 存在 >0xFF 的码位说明已是正常 Unicode 文本，不是 latin1 误解码的乱码，也无法 latin1 编码
+    if max(text) > "\xff":
+        return text
+    # 此时 latin1 编码必然成功；gbk 解码保持 strict，非 GBK 文本原样返回而不是混入替换字符
+    try:
+        return text.encode("latin1").decode("gbk")
+    except UnicodeDecodeError:
+        return text
 
 
 def _ensure_list(value) -> List:
     """Normalize ORM relationship results (single object or iterable) into a list."""
-    if not value:
-        return []
     if isinstance(value, list):
         return value
+    if not value:
+        return []
     if isinstance(value, tuple):
         return list(value)
     return [value]
 
 
+# 大表按批次流式读取，避免 .all() 一次性物化全部 ORM 对象
+_YIELD_PER = 1000
+
+# ------------------------------------------------------------------
+# Section readers: stream one dict per row from an open pya2l session
+# ------------------------------------------------------------------
+def _iter_compu_methods(session) -> Iterator[Dict[str, object]]:
+    compu_method_query = session.query(model.CompuMethod).options(
+        load_only(*(getattr(model.CompuMethod, name) for name in _COMPU_METHOD_COLUMNS))
+    )
+    for compu_method in compu_method_query.yield_per(_YIELD_PER):
+        name, long_identifier, conversion_type, format_str = _get_compu_method_fields(compu_method)
+        yield {
+            "name": _decode_text(name),
+            "long_identifier": _decode_text(long_identifier),
+            "conversion_type": conversion_type,
+            "format_str": format_str,
+            # "units": getattr(compu_method, "units", ""),
+            # "coeffs": coeffs,
+        }
+
+
+def _iter_measurements(session) -> Iterator[Dict[str, object]]:
+    measurement_query = session.query(model.Measurement).options(
+        *_row_load_options(model.Measurement, _MEASUREMENT_COLUMNS, (_MEAS_ADDR,))
+    )
+    for measurement in measurement_query.yield_per(_YIELD_PER):
+        (
+            name, long_identifier, datatype, conversion_method,
+            resolution, accuracy, lower_limit, upper_limit,
+        ) = _get_measurement_fields(measurement)
+        yield {
+            "name": _decode_text(name),
+            "long_identifier": _decode_text(long_identifier),
+            "datatype": datatype,
+            "conversion_method": conversion_method,
+            "resolution": resolution,
+            "accuracy": accuracy,
+            "lower_limit": lower_limit,
+            "upper_limit": upper_limit,
+            "ecu_address": _scalar_value(getattr(measurement, _MEAS_ADDR, None), "address") or 0,
+        }
+
+
+def _iter_axis_pts(session) -> Iterator[Dict[str, object]]:
+    axis_pts_query = session.query(model.AxisPts).options(
+        *_row_load_options(model.AxisPts, _AXIS_PTS_COLUMNS, (_AXIS_PTS_ADDR,))
+    )
+    for axis_pts in axis_pts_query.yield_per(_YIELD_PER):
+        (
+            name, long_identifier, input_quantity, record_layout, max_diff,
+            conversion_method, max_axis_points, lower_limit, upper_limit,
+        ) = _get_axis_pts_fields(axis_pts)
+        yield {
+            "name": _decode_text(name),
+            "long_identifier": _decode_text(long_identifier),
+            "ecu_address": getattr(axis_pts, _AXIS_PTS_ADDR, 0) or 0,
+            "input_quantity": input_quantity,
+            "record_layout": record_layout,
+            "max_diff": max_diff,
+            "conversion_method": conversion_method,
+            "max_axis_points": max_axis_points,
+            "lower_limit": lower_limit,
+            "upper_limit": upper_limit,
+        }
+
+
+def _iter_axis_pts_x(session) -> Iterator[Dict[str, object]]:
+    axis_pts_x_query = session.query(model.AxisPtsX).options(joinedload(model.AxisPtsX.record_layout))
+    for axis_pts_x in axis_pts_x_query.yield_per(_YIELD_PER):
+        record_layout = axis_pts_x.record_layout
+        yield {
+            "record_layout_name": getattr(record_layout, "name", None),
+            "position": axis_pts_x.position,
+            "datatype": axis_pts_x.datatype,
+            "index_incr": axis_pts_x.indexIncr,
+            "addressing": axis_pts_x.addressing,
+        }
+
+
+def _iter_record_layouts(session) -> Iterator[Dict[str, object]]:
+    # 一次 JOIN 取出全部 (module, record_layout) 组合，避免逐个 module 再查询
+    record_layout_query = (
+        session.query(model.Module.name, model.RecordLayout.name)
+        .join(model.RecordLayout, model.RecordLayout._module_rid == model.Module.rid)
+        .order_by(model.Module.rid, model.RecordLayout.rid)
+    )
+    for module_name, layout_name in record_layout_query:
+        yield {
+            "module_name": _decode_text(module_name),
+            "name": _decode_text(layout_name),
+        }
+
+
+# 可独立流式读取的分段，键与 parse_all_a2l_data 结果中的键一致
+_SECTION_READERS = {
+    "compu_methods": _iter_compu_methods,
+    "measurements": _iter_measurements,
+    "axis_pts": _iter_axis_pts,
+    "axis_pts_x": _iter_axis_pts_x,
+    "record_layouts": _iter_record_layouts,
+}
+
+
+def iter_a2l_records(file_path: str, section: str) -> Iterator[Dict[str, object]]:
+    """Stream the records of one A2L section without building the full result dict.
+
+    Useful for consumers that only need a single pass over a large section.
+    """
+    reader = _SECTION_READERS.get(section)
+    if reader is None:
+        raise ValueError(f"不支持的 A2L 分段: {section}，可选: {', '.join(_SECTION_READERS)}")
+    with _a2l_session(file_path) as session:
+        yield from reader(session)
+
+
+# 并行读取独立分段时的线程数；每个线程使用自己的 SQLite 会话
+_PARALLEL_WORKERS = 4
+
+
+def _read_section_in_own_session(file_path: str, reader) -> List[Dict[str, object]]:
+    """Run one section reader on a private session so it can execute on a worker thread."""
+    # 调用方已持有会话并确保 .a2ldb 存在，这里直接连接该数据库，
+    # 不经过 DB().open_existing（免去建表检查和 IF_DATA 解析器初始化）；用完立即释放连接
+    _, db_path = path_components(in_memory=False, file_name=file_path)
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        connect_args={"detect_types": sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES},
+        native_datetime=True,
+    )
+    session = Session(engine, autoflush=False)
+    try:
+        return list(reader(session))
+    finally:
+        session.close()
+        engine.dispose()
+
+
+# 解析结果缓存：(abspath, st_mtime_ns, st_size) -> result，仅保存在进程内存中（LRU）
+_PARSE_CACHE_SIZE = 8
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+
+def _copy_parsed_result(result: Dict) -> Dict:
+    """Copy a parse result: each section and row dict is copied, scalar values are immutable and shared.
+
+    Rows are flat apart from a characteristic's ``axis_pts_refs`` name list, which is copied as well.
+    """
+    copied = {}
+    for section, value in result.items():
+        if type(value) is list:
+            rows = [row.copy() for row in value]
+            for row in rows:
+                names = row.get("axis_pts_refs")
+                if names is not None:
+                    row["axis_pts_refs"] = list(names)
+            copied[section] = rows
+        elif type(value) is dict:
+            copied[section] = value.copy()
+        else:
+            copied[section] = value
+    return copied
+
+
+def _load_parsed_cache(cache_key: Tuple[str, int, int]):
+    with _PARSE_CACHE_LOCK:
+        result = _PARSE_CACHE.get(cache_key)
+        if result is None:
+            return None
+        _PARSE_CACHE.move_to_end(cache_key)
+    # 缓存中的结果只在这里读取；调用方可能会修改返回的数据（如补充系数），因此每次交出独立副本
+    return _copy_parsed_result(result)
+
+
+def _store_parsed_cache(cache_key: Tuple[str, int, int], result: Dict) -> None:
+    # 缓存持有解析出的原始结果，调用方拿到的总是 _copy_parsed_result 的副本
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[cache_key] = result
+        _PARSE_CACHE.move_to_end(cache_key)
+        while len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+
+
 def parse_all_a2l_data(file_path: str, cleanup_cache: bool = False) -> Dict:
-    """Parse primary A2L structures and return a dictionary of primary entities."""
+    """Parse primary A2L structures and return a dictionary of primary entities.
+
+    Results are cached in memory by (path, mtime, size); every call returns its own copy.
+    """
+    abs_path = os.path.abspath(os.path.normpath(file_path))
+    if not os.path.isfile(abs_path):
+        # 交给 _a2l_session 抛出统一的错误信息
+        return _parse_a2l_file(file_path, cleanup_cache)
+
+    cache_key = (abs_path, *_file_signature(abs_path))
+    result = _load_parsed_cache(cache_key)
+    if result is not None:
+        logging.info("命中 A2L 解析缓存: %s", file_path)
+        return result
+
+    result = _parse_a2l_file(file_path, cleanup_cache)
+    _store_parsed_cache(cache_key, result)
+    return _copy_parsed_result(result)
+
+
+def _parse_a2l_file(file_path: str, cleanup_cache: bool) -> Dict:
+    """Read every supported section from the pya2l database of the given file."""
 
+    file_path = os.path.abspath(os.path.normpath(file_path))
     logging.info("开始解析 A2L 文件: %s", file_path)
 
     result: Dict[str, object] = {
@@ -100,21 +497,26 @@ def parse_all_a2l_data(file_path: str, cleanup_cache: bool = False) -> Dict:
 
     with _a2l_session(file_path, cleanup_cache=cleanup_cache) as session:
         # 读取 PROJECT 信息（仅取第一个）
-        project = session.query(model.Project).first()
+        # 仅查询所需列，不加载完整 ORM 对象及其关系
+        project = session.query(model.Project.name, model.Project.longIdentifier).first()
         if project:
             result["project"] = {
-                "name": _decode_text(getattr(project, "name", "")),
-                "long_identifier": _decode_text(getattr(project, "longIdentifier", "")),
+                "name": _decode_text(project.name),
+                "long_identifier": _decode_text(project.longIdentifier),
             }
 
-        # 读取 MODULE 信息（仅取第一个）
-        module = session.query(model.Module).first()
+        # 读取 MODULE 信息（仅取第一个），JOIN PROJECT 一次取得所属工程名
+        module = (
+            session.query(model.Module.name, model.Module.longIdentifier, model.Project.name.label("project_name"))
+            .outerjoin(model.Project, model.Module._project_rid == model.Project.rid)
+            .order_by(model.Module.rid)
+            .first()
+        )
         if module:
-            project_obj = getattr(module, "project", None)
             result["module"] = {
-                "name": _decode_text(getattr(module, "name", "")),
-                "long_identifier": _decode_text(getattr(module, "longIdentifier", "")),
-                "project_name": _decode_text(getattr(project_obj, "name", None)),
+                "name": _decode_text(module.name),
+                "long_identifier": _decode_text(module.longIdentifier),
+                "project_name": _decode_text(module.project_name),
             }
 
         # # 读取 MODULE_PARAMETER 信息（仅取第一个）
@@ -135,240 +537,132 @@ def parse_all_a2l_data(file_path: str, cleanup_cache: bool = False) -> Dict:
         #     }
 
         # 读取 ASAP2_VERSION 信息
-        version = session.query(model.Asap2Version).first()
+        version = session.query(model.Asap2Version.versionNo, model.Asap2Version.upgradeNo).first()
         if version:
             result["asap2_version"] = {
-                "version_no": getattr(version, "versionNo", 1),
-                "upgrade_no": getattr(version, "upgradeNo", 0),
+                "version_no": version.versionNo,
+                "upgrade_no": version.upgradeNo,
             }
 
-        # 读取 COMPU_METHOD 信息
-        compu_methods = []
-        for compu_method in session.query(model.CompuMethod).all():
-            compu_methods.append({
-                "name": _decode_text(getattr(compu_method, "name", "")),
-                "long_identifier": _decode_text(getattr(compu_method, "longIdentifier", "")),
-                "conversion_type": getattr(compu_method, "conversionType", ""),
-                "format_str": getattr(compu_method, "format", ""),
-                # "units": getattr(compu_method, "units", ""),
-                # "coeffs": coeffs,
-            })
-        result["compu_methods"] = compu_methods
-
-        # 读取 CHARACTERISTIC 信息（先于 Measurement）
-        characteristics = []
-        axis_descr_records: List[Dict[str, object]] = []
-        axis_pts_ref_records: List[Dict[str, object]] = []
-        axis_supported_types = {"CURVE", "MAP", "CUBOID"}
-
-        for characteristic in session.query(model.Characteristic).all():
-            char_name = _decode_text(getattr(characteristic, "name"))
-            long_identifier = _decode_text(getattr(characteristic, "longIdentifier", ""))
-            char_type = getattr(characteristic, "type")
-            number = getattr(characteristic, "number", 0) or 0
-            axis_names: List[str] = []
-
-            axis_descrs: List = []
-
-            # 对于需要坐标轴的类型（CURVE/MAP/CUBOID），解析 AXIS_DESCR / AXIS_PTS 信息
-            if char_type in axis_supported_types:
-                axis_descrs = _ensure_list(getattr(characteristic, "axis_descrs", []))
-
-                char_id = getattr(characteristic, "id", None) or getattr(characteristic, "rid", None)
-                # pya2l 有时只返回第一个 AxisDescr，这里额外查询并合并
-                if char_id and hasattr(model.AxisDescr, "_characteristic_rid"):
-                    extra_axis_descrs = list(
-                        session.query(model.AxisDescr)
-                        .filter(model.AxisDescr._characteristic_rid == char_id)
-                        .all()
-                    )
-                    if extra_axis_descrs:
-                        existing_ids = {
-                            getattr(axis_descr, "id", None)
-                            or getattr(axis_descr, "rid", None)
-                            for axis_descr in axis_descrs
-                        }
-                        for axis_descr in extra_axis_descrs:
-                            axis_id = getattr(axis_descr, "id", None) or getattr(axis_descr, "rid", None)
-                            if axis_id not in existing_ids:
-                                axis_descrs.append(axis_descr)
-                                existing_ids.add(axis_id)
-
-                if not axis_descrs and char_id:
-                    axis_descrs = list(
-                        session.query(model.AxisDescr)
-                        .filter(model.AxisDescr._characteristic_rid == char_id)
-                        .all()
-                    )
-
-                if axis_descrs and char_type == "CURVE":
-                    axis_descr = axis_descrs[0]
-                    number = (
-                        getattr(axis_descr, "maxAxisPoints", None)
-                        or getattr(axis_descr, "numberOfAxisPts", None)
-                        or getattr(axis_descr, "number", None)
-                        or number
-                    )
-
-                    if not number:
+        # COMPU_METHOD / MEASUREMENT / AXIS_PTS / AXIS_PTS_X / RECORD_LAYOUT 互相独立，
+        # 交给线程池用各自的会话并行读取，主线程同时处理 CHARACTERISTIC
+        executor = ThreadPoolExecutor(max_workers=_PARALLEL_WORKERS, thread_name_prefix="a2l-section")
+        try:
+            section_futures = {
+                section: executor.submit(_read_section_in_own_session, file_path, reader)
+                for section, reader in _SECTION_READERS.items()
+            }
+
+            # 读取 CHARACTERISTIC 信息（先于 Measurement）
+            # 按总数预分配结果列表，循环内按下标写入，避免逐行 append 扩容
+            characteristics: List[Dict[str, object]] = [None] * session.query(model.Characteristic).count()
+            axis_descr_records: List[Dict[str, object]] = []
+            axis_pts_ref_records: List[Dict[str, object]] = []
+
+            # 一次性预取 AXIS_PTS_REF / AXIS_PTS，避免在逐个 Characteristic 循环内反复查询（N+1）
+            axis_pts_refs_by_descr: Dict[int, List] = defaultdict(list)
+            for axis_pts_ref in session.query(model.AxisPtsRef).yield_per(_YIELD_PER):
+                axis_pts_refs_by_descr[axis_pts_ref._axis_descr_rid].append(axis_pts_ref)
+            # 需通过 AXIS_PTS 反查点数的 CURVE：(characteristics 下标, axis_pts 名称)，循环结束后统一 IN 查询
+            pending_axis_pts: List[Tuple[int, str]] = []
+
+            # 一对多关系使用 selectinload（而非 joinedload），避免 JOIN 造成的行膨胀
+            characteristic_query = session.query(model.Characteristic).options(
+                selectinload(model.Characteristic.axis_descr).selectinload(model.AxisDescr.axis_pts_ref),
+                *_row_load_options(model.Characteristic, _CHARACTERISTIC_COLUMNS, ("number",)),
+            )
+            for index, characteristic in enumerate(characteristic_query.yield_per(_YIELD_PER)):
+                (
+                    char_name, long_identifier, char_type, ecu_address, record_layout,
+                    conversion_method, max_diff, lower_limit, upper_limit,
+                ) = _get_characteristic_fields(characteristic)
+                char_name = _decode_text(char_name)
+                long_identifier = _decode_text(long_identifier)
+                number = _scalar_value(characteristic.number, "number") or 0
+                axis_names: List[str] = []
+
+                axis_descrs: List = []
+
+                # 对于需要坐标轴的类型（CURVE/MAP/CUBOID），解析 AXIS_DESCR / AXIS_PTS 信息
+                if char_type in _AXIS_SUPPORTED_TYPES:
+                    axis_descrs = characteristic.axis_descr
+
+                    if axis_descrs and char_type == "CURVE":
+                        axis_descr = axis_descrs[0]
+                        number = axis_descr.maxAxisPoints or number
+
+                        if not number:
+                            axis_pts_refs = _ensure_list(getattr(axis_descr, "axis_pts_ref", []))
+                            if not axis_pts_refs:
+                                axis_descr_id = _get_axis_descr_id(axis_descr)
+                                if axis_descr_id:
+                                    axis_pts_refs = axis_pts_refs_by_descr.get(axis_descr_id, [])
+
+                            if axis_pts_refs:
+                                axis_pts_ref = axis_pts_refs[0]
+                                axis_pts_name = axis_pts_ref.axisPoints
+                                if axis_pts_name:
+                                    pending_axis_pts.append((index, axis_pts_name))
+
+                    for axis_descr in axis_descrs:
                         axis_pts_refs = _ensure_list(getattr(axis_descr, "axis_pts_ref", []))
                         if not axis_pts_refs:
-                            axis_descr_id = getattr(axis_descr, "id", None) or getattr(axis_descr, "rid", None)
-                            if axis_descr_id and hasattr(model.AxisPtsRef, "_axis_descr_rid"):
-                                axis_pts_refs = list(
-                                    session.query(model.AxisPtsRef)
-                                    .filter(model.AxisPtsRef._axis_descr_rid == axis_descr_id)
-                                    .all()
-                                )
-
-                        if axis_pts_refs:
-                            axis_pts_ref = axis_pts_refs[0]
-                            axis_pts_name = (
-                                getattr(axis_pts_ref, "axisPoints", None)
-                                or getattr(axis_pts_ref, "axis_pts", None)
-                                or getattr(axis_pts_ref, "name", None)
-                            )
+                            axis_descr_id = _get_axis_descr_id(axis_descr)
+                            if axis_descr_id:
+                                axis_pts_refs = axis_pts_refs_by_descr.get(axis_descr_id, [])
+                        axis_pts_ref_names_local: List[str] = []
+                        for axis_pts_ref in axis_pts_refs:
+                            axis_pts_name = axis_pts_ref.axisPoints
                             if axis_pts_name:
-                                axis_pts = session.query(model.AxisPts).filter_by(name=axis_pts_name).first()
-                                if axis_pts:
-                                    number = (
-                                        getattr(axis_pts, "maxAxisPoints", None)
-                                        or getattr(axis_pts, "max_axis_points", None)
-                                        or getattr(axis_pts, "number", None)
-                                        or number
-                                    )
-
-                axis_descrs_list = _ensure_list(axis_descrs)
-                for axis_descr in axis_descrs_list:
-                    axis_pts_refs = _ensure_list(getattr(axis_descr, "axis_pts_ref", []))
-                    if not axis_pts_refs:
-                        axis_descr_id = getattr(axis_descr, "id", None) or getattr(axis_descr, "rid", None)
-                        if axis_descr_id and hasattr(model.AxisPtsRef, "_axis_descr_rid"):
-                            axis_pts_refs = list(
-                                session.query(model.AxisPtsRef)
-                                .filter(model.AxisPtsRef._axis_descr_rid == axis_descr_id)
-                                .all()
-                            )
-                    axis_pts_ref_names_local: List[str] = []
-                    for axis_pts_ref in axis_pts_refs:
-                        axis_pts_name = (
-                            getattr(axis_pts_ref, "axisPoints", None)
-                            or getattr(axis_pts_ref, "axis_pts", None)
-                            or getattr(axis_pts_ref, "name", None)
-                        )
-                        if axis_pts_name:
-                            axis_pts_ref_names_local.append(axis_pts_name)
-                            axis_names.append(axis_pts_name)
-                            axis_pts_ref_records.append({
-                                "characteristic_name": char_name,
-                                "attribute": getattr(axis_descr, "attribute", ""),
-                                "conversion_method": getattr(axis_descr, "conversion", ""),
-                                "axis_points": axis_pts_name,
-                            })
-                    axis_descr_data = {
-                        "characteristic_name": char_name,
-                        "attribute": getattr(axis_descr, "attribute", ""),
-                        "input_quantity": getattr(axis_descr, "inputQuantity", ""),
-                        "conversion_method": getattr(axis_descr, "conversion", ""),
-                        "max_axis_points": (
-                            getattr(axis_descr, "maxAxisPoints", None)
-                            or getattr(axis_descr, "numberOfAxisPts", None)
-                            or getattr(axis_descr, "number", None)
-                            or 0
-                        ),
-                        "lower_limit": getattr(axis_descr, "lowerLimit", 0.0) or 0.0,
-                        "upper_limit": getattr(axis_descr, "upperLimit", 0.0) or 0.0,
-                        "axis_pts_ref_name": axis_pts_ref_names_local[0] if axis_pts_ref_names_local else "",
-                    }
-                    axis_descr_records.append(axis_descr_data)
-
-            characteristics.append({
-                "name": char_name,
-                "long_identifier": long_identifier,
-                "characteristic_type": char_type,
-                "ecu_address": getattr(characteristic, "address"),
-                "record_layout": getattr(characteristic, "deposit"),
-                "conversion_method": getattr(characteristic, "conversion"),
-                "max_diff": getattr(characteristic, "maxDiff"),
-                "lower_limit": getattr(characteristic, "lowerLimit"),
-                "upper_limit": getattr(characteristic, "upperLimit"),
-                "number": number,
-                "axis_pts_refs": axis_names,
-            })
-        result["characteristics"] = characteristics
-        result["axis_descrs"] = axis_descr_records
-        result["axis_pts_refs"] = axis_pts_ref_records
-
-        # 读取 MEASUREMENT 信息
-        measurements = []
-        for measurement in session.query(model.Measurement).all():
-            meas_address = (
-                getattr(measurement, "address", None)
-                or getattr(measurement, "ecuAddress", None)
-                or getattr(measurement, "ecu_address", None)
-                or 0
-            )
-            measurements.append({
-                "name": _decode_text(getattr(measurement, "name")),
-                "long_identifier": _decode_text(getattr(measurement, "longIdentifier", "")),
-                "datatype": getattr(measurement, "datatype"),
-                "conversion_method": getattr(measurement, "conversion"),
-                "resolution": getattr(measurement, "resolution"),
-                "accuracy": getattr(measurement, "accuracy"),
-                "lower_limit": getattr(measurement, "lowerLimit"),
-                "upper_limit": getattr(measurement, "upperLimit"),
-                "ecu_address": meas_address,
-            })
-        result["measurements"] = measurements
-
-        # 读取 AXIS_PTS 信息
-        axis_pts_records = []
-        for axis_pts in session.query(model.AxisPts).all():
-            axis_address = (
-                getattr(axis_pts, "address", None)
-                or getattr(axis_pts, "ecuAddress", None)
-                or getattr(axis_pts, "ecu_address", None)
-                or 0
-            )
-            axis_pts_records.append({
-                "name": _decode_text(getattr(axis_pts, "name")),
-                "long_identifier": _decode_text(getattr(axis_pts, "longIdentifier", "")),
-                "ecu_address": axis_address,
-                "input_quantity": getattr(axis_pts, "inputQuantity"),
-                "record_layout": getattr(axis_pts, "depositAttr"),
-                "max_diff": getattr(axis_pts, "maxDiff"),
-                "conversion_method": getattr(axis_pts, "conversion"),
-                "max_axis_points": getattr(axis_pts, "maxAxisPoints"),
-                "lower_limit": getattr(axis_pts, "lowerLimit"),
-                "upper_limit": getattr(axis_pts, "upperLimit"),
-            })
-        result["axis_pts"] = axis_pts_records
-
-        # 读取 AXIS_PTS_X 信息
-        axis_pts_x_records = []
-        for axis_pts_x in session.query(model.AxisPtsX).all():
-            record_layout = getattr(axis_pts_x, "record_layout", None)
-            axis_pts_x_records.append({
-                "record_layout_name": getattr(record_layout, "name", None),
-                "position": getattr(axis_pts_x, "position", 0),
-                "datatype": getattr(axis_pts_x, "datatype", ""),
-                "index_incr": getattr(axis_pts_x, "indexIncr", ""),
-                "addressing": getattr(axis_pts_x, "addressing", ""),
-            })
-        result["axis_pts_x"] = axis_pts_x_records
-
-        # 读取 RECORD_LAYOUT 信息
-        record_layouts = []
-        for module_obj in session.query(model.Module).all():
-            layouts = getattr(module_obj, "record_layouts", [])
-            if not layouts:
-                layouts = session.query(model.RecordLayout).filter_by(module=module_obj).all()
-            for layout in layouts:
-                record_layouts.append({
-                "module_name": _decode_text(getattr(module_obj, "name", "")),
-                "name": _decode_text(getattr(layout, "name", "")),
-                })
-        result["record_layouts"] = record_layouts
+                                axis_pts_ref_names_local.append(axis_pts_name)
+                                axis_names.append(axis_pts_name)
+                                axis_pts_ref_records.append({
+                                    "characteristic_name": char_name,
+                                    "attribute": axis_descr.attribute,
+                                    "conversion_method": axis_descr.conversion,
+                                    "axis_points": axis_pts_name,
+                                })
+                        axis_descr_data = {
+                            "characteristic_name": char_name,
+                            "attribute": axis_descr.attribute,
+                            "input_quantity": axis_descr.inputQuantity,
+                            "conversion_method": axis_descr.conversion,
+                            "max_axis_points": axis_descr.maxAxisPoints or 0,
+                            "lower_limit": axis_descr.lowerLimit or 0.0,
+                            "upper_limit": axis_descr.upperLimit or 0.0,
+                            "axis_pts_ref_name": axis_pts_ref_names_local[0] if axis_pts_ref_names_local else "",
+                        }
+                        axis_descr_records.append(axis_descr_data)
+
+                characteristics[index] = {
+                    "name": char_name,
+                    "long_identifier": long_identifier,
+                    "characteristic_type": char_type,
+                    "ecu_address": ecu_address,
+                    "record_layout": record_layout,
+                    "conversion_method": conversion_method,
+                    "max_diff": max_diff,
+                    "lower_limit": lower_limit,
+                    "upper_limit": upper_limit,
+                    "number": number,
+                    "axis_pts_refs": axis_names,
+                }
+
+            if pending_axis_pts:
+                max_points_by_name = _query_axis_pts_max_points(session, {name for _, name in pending_axis_pts})
+                for index, axis_pts_name in pending_axis_pts:
+                    max_points = max_points_by_name.get(axis_pts_name)
+                    if max_points:
+                        characteristics[index]["number"] = max_points
+            result["characteristics"] = characteristics
+            result["axis_descrs"] = axis_descr_records
+            result["axis_pts_refs"] = axis_pts_ref_records
+
+            # 汇总并行读取的各分段结果
+            for section, future in section_futures.items():
+                result[section] = future.result()
+        finally:
+            executor.shutdown(wait=True)
 
     return result
 
@@ -1,9 +1,11 @@
+import functools
 import logging
+import sys
+from operator import attrgetter, itemgetter
 from typing import Dict, Optional, List, Tuple
 from concurrent.futures import ThreadPoolExecutor
 
-from django.db import transaction
-from django.db import models
+from django.db import connection, transaction
 
 from hexparser.models import (
     A2LFile,
@@ -23,44 +25,132 @@ from hexparser.models import (
 )
 
 
-class A2LDataImporter:
-    """Encapsulate logic for persisting parsed A2L data into database tables."""
+# bulk_update 时需要写回的字段，同时也是判重时需要加载的字段
+# ForeignKey 一律使用 xxx_id 形式，读写时跳过关联对象描述符
+_CHARACTERISTIC_UPDATE_FIELDS = (
+    "long_identifier",
+    "characteristic_type",
+    "ecu_address",
+    "record_layout",
+    "conversion_method_id",
+    "max_diff",
+    "lower_limit",
+    "upper_limit",
+    "number",
+    "module_id",
+    "work_package_id",
+    "updater",
+)
+_MEASUREMENT_UPDATE_FIELDS = (
+    "long_identifier",
+    "datatype",
+    "conversion_method_id",
+    "resolution",
+    "accuracy",
+    "lower_limit",
+    "upper_limit",
+    "ecu_address",
+    "module_id",
+    "work_package_id",
+)
+_AXIS_PTS_UPDATE_FIELDS = (
+    "long_identifier",
+    "input_quantity",
+    "record_layout",
+    "max_diff",
+    "max_axis_points",
+    "lower_limit",
+    "upper_limit",
+    "module_id",
+)
 
-    def _safe_get_field_value(self, instance, field_name):
-        """安全地获取字段值，对于 ForeignKey 字段使用 field_id 避免访问不存在的关联对象。"""
-        try:
-            field = instance._meta.get_field(field_name)
-            if isinstance(field, models.ForeignKey):
-                # 对于 ForeignKey，使用 field_id 来获取值，避免触发数据库查询
-                field_id_name = f"{field_name}_id"
-                return getattr(instance, field_id_name, None)
-            else:
-                return getattr(instance, field_name)
-        except Exception as e:
-            logging.warning("获取字段值失败: instance=%s, field=%s, error=%s", instance, field_name, e)
-            # 如果获取失败，尝试直接获取
-            try:
-                return getattr(instance, field_name)
-            except Exception:
-                return None
 
-    def _safe_set_field_value(self, instance, field_name, value):
-        """安全地设置字段值，对于 ForeignKey 字段使用 field_id 来设置，避免需要对象实例。"""
-        try:
-            field = instance._meta.get_field(field_name)
-            if isinstance(field, models.ForeignKey):
-                # 对于 ForeignKey，使用 field_id 来设置值
-                field_id_name = f"{field_name}_id"
-                # 如果 value 是对象，获取其 ID；如果已经是 ID，直接使用
-                if hasattr(value, 'id'):
-                    value = value.id
-                setattr(instance, field_id_name, value)
-            else:
-                setattr(instance, field_name, value)
-        except Exception as e:
-            logging.warning("设置字段值失败: instance=%s, field=%s, value=%s, error=%s", instance, field_name, value, e)
-            # 如果设置失败，尝试直接设置
-            setattr(instance, field_name, value)
+def _quoted_table(model_class) -> str:
+    return connection.ops.quote_name(model_class._meta.db_table)
+
+
+def _quoted_column(model_class, field_name: str) -> str:
+    return connection.ops.quote_name(model_class._meta.get_field(field_name).column)
+
+
+# 地址与个数的文本取值在 A2L 中大量重复，解析结果按原始文本缓存
+@functools.lru_cache(maxsize=65536)
+def _parse_address_text(text: str) -> int:
+    text = text.strip().lower()
+    try:
+        return int(text, 16) if text.startswith(("0x", "-0x")) else int(text)
+    except ValueError:
+        return 0
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_number_text(text: str) -> Optional[int]:
+    """Parse a CHARACTERISTIC number given as text; None means the text is invalid."""
+    stripped = text.strip()
+    if not stripped:
+        return 0
+    try:
+        return int(float(stripped))
+    except ValueError:
+        return None
+
+
+def _intern_text(value):
+    """Intern text values so repeated strings share one object; other values pass through."""
+    # 类型、存储属性、长标识符等文本在解析数据中大量重复
+    return sys.intern(value) if type(value) is str else value
+
+
+# 循环内收集的告警在循环结束后汇总输出，每类最多列出的示例条数
+_LOG_SAMPLE_SIZE = 5
+
+
+def _log_collected(level: int, message: str, items: List, a2l_file_id) -> None:
+    """Log one summary line for problems collected inside a loop, with a few examples."""
+    if items:
+        logging.log(
+            level,
+            "%s: 共 %d 条，示例: %s (A2L文件ID: %s)",
+            message,
+            len(items),
+            items[:_LOG_SAMPLE_SIZE],
+            a2l_file_id,
+        )
+
+
+# 读取现有记录时每次从游标取出的行数
+_EXISTING_CHUNK_SIZE = 5000
+
+# 预先构造的取值器，一次取出实例（attrgetter）或字典（itemgetter）的全部更新字段，避免逐字段反射
+_UPDATE_VALUE_GETTERS = {
+    model_class: (fields, attrgetter(*fields), itemgetter(*fields))
+    for model_class, fields in (
+        (Characteristic, _CHARACTERISTIC_UPDATE_FIELDS),
+        (Measurement, _MEASUREMENT_UPDATE_FIELDS),
+        (AxisPts, _AXIS_PTS_UPDATE_FIELDS),
+    )
+}
+
+
+_get_pk = attrgetter("pk")
+# 按唯一索引的前导列（name）排序后再插入；排序稳定，同名记录保持解析顺序，
+# 同名记录之间的主键先后不变，依赖"同名取主键最小"的后续匹配逻辑不受影响
+_get_name = attrgetter("name")
+
+
+def _bulk_update_changed(model_class, buckets: Dict[Tuple[str, ...], List]) -> int:
+    """Run one update per group of instances sharing the same changed fields; return the row count."""
+    updated = 0
+    for changed_fields, instances in buckets.items():
+        # 按主键顺序更新，访问的索引页和数据页更集中
+        instances.sort(key=_get_pk)
+        model_class.objects.bulk_update(instances, list(changed_fields), batch_size=500)
+        updated += len(instances)
+    return updated
+
+
+class A2LDataImporter:
+    """Encapsulate logic for persisting parsed A2L data into database tables."""
 
     def __init__(self, a2l_file: A2LFile, module_id: Optional[str] = None, updater: str = "system") -> None:
         self.a2l_file = a2l_file
@@ -69,6 +159,8 @@ class A2LDataImporter:
         self.default_module = self._resolve_default_module()
         # 使用默认的"未绑定"工作包，后续可手工绑定
         self.default_work_package = self._resolve_default_unbound_work_package()
+        # 由 save() 在同步 MODULE 之后确定
+        self._module_fallback: Optional[A2LModule] = None
 
     def save(self, parsed_data: Dict) -> Dict[str, int]:
         """Persist parsed A2L data to the database.
@@ -93,159 +185,99 @@ class A2LDataImporter:
         }
 
         # 原子操作，要么全部成功，要么全部失败
-        with transaction.atomic():
+        # 已处于外层事务（如 ATOMIC_REQUESTS）时不再创建保存点，出错时整个外层事务回滚
+        with transaction.atomic(savepoint=False):
             logging.info("原子操作>>>开始入库 A2L 数据: %s", self.a2l_file.id)
+            # 判重所需的现有记录必须在同一事务内读取（且早于 CompuMethod 的删除重建），
+            # 否则并发导入同一文件时会基于过期快照决定新增还是更新
+            old_compu_method_id_to_name, existing_chars, existing_meas = self._load_existing_records()
             # 串行执行依赖项
             project = self._sync_project(parsed_data, stats)
             module = self._sync_module(parsed_data, project, stats)
             if module and not self.default_module:
                 self.default_module = module
+            # 默认模块只解析一次，后续各同步步骤直接复用
+            self._module_fallback = self.default_module or module or self._find_existing_module()
             # self._sync_module_parameters(parsed_data, module, stats)
             self._sync_asap_version(parsed_data, stats)
-            compu_methods, old_compu_method_id_to_name = self._sync_compu_methods(parsed_data, stats)
-            compu_method_map = self._build_compu_method_map(compu_methods)
+            # 名称 -> 新 CompuMethod id，后续只需要 conversion_method_id
+            compu_method_map = self._sync_compu_methods(parsed_data, stats)
             
             # 先删除依赖项（AxisPtsRef 和 AxisDescr），因为它们依赖 Characteristic
             # 注意：必须在更新 Characteristic 之前删除，否则会违反外键约束
-            characteristics_ids = Characteristic.objects.filter(
-                a2l_file=self.a2l_file
-            ).values_list('id', flat=True)
-            if characteristics_ids:
-                # 先删除依赖项
-                axis_descrs_ids = AxisDescr.objects.filter(
-                    characteristic_id__in=characteristics_ids
-                ).values_list('id', flat=True)
-                if axis_descrs_ids:
-                    axis_pts_ref_deleted = AxisPtsRef.objects.filter(
-                        axis_descr_id__in=axis_descrs_ids
-                    ).delete()[0]
-                    if axis_pts_ref_deleted > 0:
-                        logging.info("删除该 A2L 文件相关的旧 AxisPtsRef 记录: %d 条 (A2L文件ID: %s)", axis_pts_ref_deleted, self.a2l_file.id)
-                axis_descr_deleted = AxisDescr.objects.filter(
-                    characteristic_id__in=characteristics_ids
-                ).delete()[0]
-                if axis_descr_deleted > 0:
-                    logging.info("删除该 A2L 文件相关的旧 AxisDescr 记录: %d 条 (A2L文件ID: %s)", axis_descr_deleted, self.a2l_file.id)
+            # 用子查询在数据库端直接删除，不再把 id 列表取回 Python 再传回数据库
+            axis_pts_ref_deleted = self._delete_axis_pts_refs()
+            if axis_pts_ref_deleted > 0:
+                logging.info("删除该 A2L 文件相关的旧 AxisPtsRef 记录: %d 条 (A2L文件ID: %s)", axis_pts_ref_deleted, self.a2l_file.id)
+            axis_descr_deleted = self._delete_axis_descrs()
+            if axis_descr_deleted > 0:
+                logging.info("删除该 A2L 文件相关的旧 AxisDescr 记录: %d 条 (A2L文件ID: %s)", axis_descr_deleted, self.a2l_file.id)
             
             # 查询现有记录，用于判重（基于 unique_together: a2l_file, name, ecu_address, conversion_method）
             # 注意：使用 conversion_method.name 而不是 conversion_method_id，因为 CompuMethod 采用"先删除后创建"策略，ID 会变化
             # 由于 CompuMethod 已被删除，我们需要通过 conversion_method_id 从映射中获取名称
+            # 映射中缺失的 conversion_method_id（可能 CompuMethod 还存在，但不在当前 A2L 文件中）一次性批量查询补齐
+            self._fill_missing_compu_method_names(old_compu_method_id_to_name, existing_chars + existing_meas)
+
             existing_char_dict = {}
-            existing_char_count = Characteristic.objects.filter(a2l_file=self.a2l_file).count()
-            for item in Characteristic.objects.filter(a2l_file=self.a2l_file):
-                # 通过 conversion_method_id 从映射中获取名称，如果映射中没有则尝试查询（可能已被删除）
-                conversion_method_name = ""
-                if item.conversion_method_id:
-                    conversion_method_name = old_compu_method_id_to_name.get(item.conversion_method_id, "")
-                    # 如果映射中没有，尝试直接查询（可能 CompuMethod 还存在，但不在当前 A2L 文件中）
-                    if not conversion_method_name:
-                        try:
-                            cm = CompuMethod.objects.get(id=item.conversion_method_id)
-                            conversion_method_name = cm.name
-                        except CompuMethod.DoesNotExist:
-                            conversion_method_name = ""
-                key = (item.name, item.ecu_address, conversion_method_name)
+            for item in existing_chars:
+                # 通过 conversion_method_id 从映射中获取名称（已被删除的 CompuMethod 对应空名称）
+                conversion_method_name = old_compu_method_id_to_name.get(item["conversion_method_id"], "")
+                key = (item["name"], item["ecu_address"], conversion_method_name)
                 existing_char_dict[key] = item
-            logging.info("查询到现有 Characteristic 记录: %d 条 (A2L文件ID: %s)", existing_char_count, self.a2l_file.id)
+            logging.info("查询到现有 Characteristic 记录: %d 条 (A2L文件ID: %s)", len(existing_chars), self.a2l_file.id)
             
             existing_meas_dict = {}
-            existing_meas_count = Measurement.objects.filter(a2l_file=self.a2l_file).count()
-            for item in Measurement.objects.filter(a2l_file=self.a2l_file):
-                # 通过 conversion_method_id 从映射中获取名称，如果映射中没有则尝试查询（可能已被删除）
-                conversion_method_name = ""
-                if item.conversion_method_id:
-                    conversion_method_name = old_compu_method_id_to_name.get(item.conversion_method_id, "")
-                    # 如果映射中没有，尝试直接查询（可能 CompuMethod 还存在，但不在当前 A2L 文件中）
-                    if not conversion_method_name:
-                        try:
-                            cm = CompuMethod.objects.get(id=item.conversion_method_id)
-                            conversion_method_name = cm.name
-                        except CompuMethod.DoesNotExist:
-                            conversion_method_name = ""
-                key = (item.name, item.ecu_address, conversion_method_name)
+            for item in existing_meas:
+                # 通过 conversion_method_id 从映射中获取名称（已被删除的 CompuMethod 对应空名称）
+                conversion_method_name = old_compu_method_id_to_name.get(item["conversion_method_id"], "")
+                key = (item["name"], item["ecu_address"], conversion_method_name)
                 existing_meas_dict[key] = item
-            logging.info("查询到现有 Measurement 记录: %d 条 (A2L文件ID: %s)", existing_meas_count, self.a2l_file.id)
+            logging.info("查询到现有 Measurement 记录: %d 条 (A2L文件ID: %s)", len(existing_meas), self.a2l_file.id)
             
-            # 并行准备大数据量的数据，然后串行批量插入
-            # 使用线程池并行准备 characteristics 和 measurements 的数据
-            with ThreadPoolExecutor(max_workers=8) as executor:
-                char_future = executor.submit(
-                    self._prepare_characteristics_data_with_existing,
-                    parsed_data,
-                    compu_method_map,
-                    existing_char_dict,
-                )
-                
-                meas_future = executor.submit(
-                    self._prepare_measurements_data_with_existing,
-                    parsed_data,
-                    compu_method_map,
-                    module,
-                    existing_meas_dict,
-                )
-                
-                # 等待并行准备完成
-                char_to_create, char_to_update = char_future.result()
-                meas_to_create, meas_to_update = meas_future.result()
+            # 准备数据是纯 Python 计算，受 GIL 限制放入线程池并无收益；耗时主要在构造模型实例，
+            # 实例必须在主进程中创建，拆到进程池还要额外付出序列化开销，因此直接串行执行
+            char_to_create, char_to_update = self._prepare_characteristics_data_with_existing(
+                parsed_data,
+                compu_method_map,
+                existing_char_dict,
+            )
+            meas_to_create, meas_to_update = self._prepare_measurements_data_with_existing(
+                parsed_data,
+                compu_method_map,
+                module,
+                existing_meas_dict,
+            )
             
             # 串行执行批量插入和更新（保证事务一致性）
+            # 注意：不能改用 INSERT ... ON CONFLICT 式的 upsert。唯一约束包含 conversion_method_id，
+            # 而 CompuMethod 每次导入都会删除重建、ID 随之变化，旧记录只能按换算方法名称匹配，
+            # 冲突检测永远不会命中；此外 bulk_create(update_conflicts=...) 需要 Django 4.1+
             actual_char_created = 0
             if char_to_create:
+                char_to_create.sort(key=_get_name)
                 Characteristic.objects.bulk_create(char_to_create, batch_size=500)
                 actual_char_created = len(char_to_create)
                 stats["characteristics"] += actual_char_created
-            if char_to_update:
-                Characteristic.objects.bulk_update(
-                    char_to_update,
-                    [
-                        "long_identifier",
-                        "characteristic_type",
-                        "ecu_address",
-                        "record_layout",
-                        "conversion_method",
-                        "max_diff",
-                        "lower_limit",
-                        "upper_limit",
-                        "number",
-                        "module",
-                        "work_package",
-                        "updater",
-                    ],
-                    batch_size=500,
-                )
+            actual_char_updated = _bulk_update_changed(Characteristic, char_to_update)
             logging.info(
                 "Characteristic 入库完成: 新增 %d 条, 更新 %d 条 (A2L文件ID: %s)",
                 actual_char_created,
-                len(char_to_update),
+                actual_char_updated,
                 self.a2l_file.id,
             )
             
             actual_meas_created = 0
             if meas_to_create:
+                meas_to_create.sort(key=_get_name)
                 Measurement.objects.bulk_create(meas_to_create, batch_size=500)
                 actual_meas_created = len(meas_to_create)
                 stats["measurements"] += actual_meas_created
-            if meas_to_update:
-                Measurement.objects.bulk_update(
-                    meas_to_update,
-                    [
-                        "long_identifier",
-                        "datatype",
-                        "conversion_method",
-                        "resolution",
-                        "accuracy",
-                        "lower_limit",
-                        "upper_limit",
-                        "ecu_address",
-                        "module",
-                        "work_package",
-                    ],
-                    batch_size=500,
-                )
+            actual_meas_updated = _bulk_update_changed(Measurement, meas_to_update)
             logging.info(
                 "Measurement 入库完成: 新增 %d 条, 更新 %d 条 (A2L文件ID: %s)",
                 actual_meas_created,
-                len(meas_to_update),
+                actual_meas_updated,
                 self.a2l_file.id,
             )
             
@@ -266,6 +298,67 @@ class A2LDataImporter:
         logging.info("成功入库 A2L 数据到文件 %s: %s", self.a2l_file.id, stats)
         return stats
 
+    # 以下删除绕过 ORM 的 Collector：相关外键均为 DO_NOTHING 且没有信号处理，直接执行 DELETE 即可
+    @staticmethod
+    def _execute_delete(sql: str, params: List) -> int:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return cursor.rowcount
+
+    def _delete_axis_descrs(self) -> int:
+        """Delete the AxisDescr rows of this file's characteristics; returns the row count."""
+        return self._execute_delete(
+            "DELETE FROM {} WHERE {} IN (SELECT {} FROM {} WHERE {} = %s)".format(
+                _quoted_table(AxisDescr),
+                _quoted_column(AxisDescr, "characteristic"),
+                _quoted_column(Characteristic, "id"),
+                _quoted_table(Characteristic),
+                _quoted_column(Characteristic, "a2l_file"),
+            ),
+            [self.a2l_file.id],
+        )
+
+    def _delete_axis_pts_refs(self) -> int:
+        """Delete the AxisPtsRef rows under this file's AxisDescr rows; returns the row count."""
+        return self._execute_delete(
+            "DELETE FROM {} WHERE {} IN (SELECT {} FROM {} WHERE {} IN (SELECT {} FROM {} WHERE {} = %s))".format(
+                _quoted_table(AxisPtsRef),
+                _quoted_column(AxisPtsRef, "axis_descr"),
+                _quoted_column(AxisDescr, "id"),
+                _quoted_table(AxisDescr),
+                _quoted_column(AxisDescr, "characteristic"),
+                _quoted_column(Characteristic, "id"),
+                _quoted_table(Characteristic),
+                _quoted_column(Characteristic, "a2l_file"),
+            ),
+            [self.a2l_file.id],
+        )
+
+    def _load_existing_records(self) -> Tuple[Dict[int, str], List[Dict], List[Dict]]:
+        """Read the old CompuMethod names and existing Characteristic/Measurement rows on the current connection."""
+        return (
+            self._fetch_compu_method_names(),
+            self._fetch_existing_records(Characteristic, _CHARACTERISTIC_UPDATE_FIELDS),
+            self._fetch_existing_records(Measurement, _MEASUREMENT_UPDATE_FIELDS),
+        )
+
+    def _characteristics_by_name(self) -> Dict[str, List[Characteristic]]:
+        """Load this file's characteristics once, grouped by name in primary key order."""
+        characteristics_by_name: Dict[str, List[Characteristic]] = {}
+        for characteristic in Characteristic.objects.filter(a2l_file=self.a2l_file).order_by("id").only("id", "name"):
+            characteristics_by_name.setdefault(characteristic.name, []).append(characteristic)
+        return characteristics_by_name
+
+    def _fetch_compu_method_names(self) -> Dict[int, str]:
+        # 旧的 CompuMethod ID 到名称的映射，用于匹配现有 Characteristic 和 Measurement
+        return dict(CompuMethod.objects.filter(a2l_file=self.a2l_file).values_list("id", "name"))
+
+    def _fetch_existing_records(self, model_class, update_fields) -> List[Dict]:
+        # 单次查询，只取判重和比较所需的列；以字典返回，避免为每行实例化完整的模型对象
+        # iterator 分块读取游标且不填充 QuerySet 结果缓存，峰值内存不随表大小翻倍
+        queryset = model_class.objects.filter(a2l_file=self.a2l_file).values("id", "name", *update_fields)
+        return list(queryset.iterator(chunk_size=_EXISTING_CHUNK_SIZE))
+
     # ------------------------------------------------------------------
     # Individual sync helpers
     # ------------------------------------------------------------------
@@ -382,91 +475,96 @@ class A2LDataImporter:
         except Exception as exc:
             logging.warning("入库 ASAP2_VERSION 失败: %s", exc)
 
-    def _sync_compu_methods(self, parsed_data: Dict, stats: Dict[str, int]) -> Tuple[Dict[str, CompuMethod], Dict[int, str]]:
-        # 先保存旧的 CompuMethod ID 到名称的映射关系，用于后续查询现有 Characteristic 和 Measurement 时匹配
-        old_compu_method_id_to_name: Dict[int, str] = {}
-        for old_cm in CompuMethod.objects.filter(a2l_file=self.a2l_file):
-            old_compu_method_id_to_name[old_cm.id] = old_cm.name
-        
+    def _sync_compu_methods(self, parsed_data: Dict, stats: Dict[str, int]) -> Dict[str, int]:
+        # 旧的 CompuMethod ID 到名称的映射已在事务开始前由 _load_existing_records 取得
         # 先删除该 A2L 文件相关的所有 CompuMethod 记录，然后直接写入全部解析的数据
         # 注意：由于执行顺序是先创建 CompuMethod，再创建 Characteristic 和 Measurement，
         # 所以删除 CompuMethod 不会影响后续的创建（它们会引用新创建的 CompuMethod）
-        deleted_count = CompuMethod.objects.filter(
-            a2l_file=self.a2l_file
-        ).delete()[0]
+        deleted_count = self._execute_delete(
+            "DELETE FROM {} WHERE {} = %s".format(
+                _quoted_table(CompuMethod), _quoted_column(CompuMethod, "a2l_file")
+            ),
+            [self.a2l_file.id],
+        )
         if deleted_count > 0:
             logging.info("删除该 A2L 文件相关的旧 CompuMethod 记录: %d 条 (A2L文件ID: %s)", deleted_count, self.a2l_file.id)
         
         total = len(parsed_data.get("compu_methods", []))
-        coeffs_cache: Dict[tuple, Coeffs] = {}
-        compu_methods: Dict[str, CompuMethod] = {}
         created_count = 0
         skipped_errors = 0
+        to_create: List[CompuMethod] = []
+
+        # 先收集全部不重复的系数组合，一次查询已有记录、一次批量创建缺失记录
+        # 无系数时使用默认的恒等系数
+        cm_coeffs_keys = [
+            self._build_coeffs_key(cm_data.get("coeffs") or {})
+            for cm_data in parsed_data.get("compu_methods", [])
+        ]
+        explicit_keys = {
+            self._build_coeffs_key(cm_data["coeffs"])
+            for cm_data in parsed_data.get("compu_methods", [])
+            if cm_data.get("coeffs")
+        }
+        coeffs_cache = self._resolve_coeffs(set(cm_coeffs_keys), explicit_keys, stats)
 
-        for cm_data in parsed_data.get("compu_methods", []):
-            coeffs = None
-            if cm_data.get("coeffs"):
-                coeffs_key = self._build_coeffs_key(cm_data["coeffs"])
-                coeffs = coeffs_cache.get(coeffs_key)
-                if coeffs is None:
-                    coeffs, created = Coeffs.objects.get_or_create(
-                        a=coeffs_key[0],
-                        b=coeffs_key[1],
-                        c=coeffs_key[2],
-                        d=coeffs_key[3],
-                        e=coeffs_key[4],
-                        f=coeffs_key[5],
-                    )
-                    coeffs_cache[coeffs_key] = coeffs
-                    if created:
-                        stats["coeffs"] += 1
-            if coeffs is None:
-                coeffs, _ = Coeffs.objects.get_or_create(a=0, b=1, c=0, d=0, e=0, f=1)
+        for cm_data, coeffs_key in zip(parsed_data.get("compu_methods", []), cm_coeffs_keys):
+            coeffs = coeffs_cache[coeffs_key]
 
             # 由于已经删除了该 A2L 文件相关的所有旧记录，这里直接创建新记录
             # 不做任何去重处理，写入所有解析到的 CompuMethod
             # 注意：如果发生唯一约束冲突，整个事务会失败并回滚（要么全部成功，要么全部失败）
-            parsed_name = cm_data["name"]
-            compu_method = CompuMethod.objects.create(
-                a2l_file=self.a2l_file,
-                name=parsed_name,
-                long_identifier=cm_data.get("long_identifier", ""),
-                conversion_type=cm_data.get("conversion_type", "RAT_FUNC"),
-                format_str=cm_data.get("format_str", ""),
-                units=cm_data.get("units", ""),
-                coefficient=coeffs,
+            to_create.append(
+                CompuMethod(
+                    a2l_file=self.a2l_file,
+                    name=cm_data["name"],
+                    long_identifier=cm_data.get("long_identifier", ""),
+                    conversion_type=cm_data.get("conversion_type", "RAT_FUNC"),
+                    format_str=cm_data.get("format_str", ""),
+                    units=cm_data.get("units", ""),
+                    coefficient=coeffs,
+                )
             )
-            compu_methods[compu_method.name] = compu_method
-            stats["compu_methods"] += 1
-            created_count += 1
-            # logging.info("新增 CompuMethod: %s (A2L文件ID: %s)", parsed_name, self.a2l_file.id)
-        
+
+        if to_create:
+            CompuMethod.objects.bulk_create(to_create, batch_size=500)
+            created_count = len(to_create)
+            stats["compu_methods"] += created_count
+
+        if connection.features.can_return_rows_from_bulk_insert:
+            # PostgreSQL 上 bulk_create 会回填主键，无需再查询
+            compu_methods = {cm.name: cm.pk for cm in to_create}
+        else:
+            compu_methods = dict(
+                CompuMethod.objects.filter(a2l_file=self.a2l_file).order_by("id").values_list("name", "id")
+            )
+
         logging.info(
             "CompuMethod 入库完成: 总数=%d, 新增=%d, 错误=%d (A2L文件ID: %s)",
             total, created_count, skipped_errors, self.a2l_file.id
         )
 
-        return compu_methods, old_compu_method_id_to_name
+        return compu_methods
 
     def _sync_measurements(
         self,
         parsed_data: Dict,
-        compu_method_map: Dict[str, CompuMethod],
+        compu_method_map: Dict[str, int],
         module: Optional[A2LModule],
         stats: Dict[str, int],
     ) -> None:
-        module_fallback = self.default_module or module
-        if module_fallback is None:
-            module_fallback = self._find_existing_module()
+        module_fallback = self._module_fallback
         if module_fallback is None:
             logging.warning("未能解析到默认的 A2LModule，测量量入库被跳过")
             return
+        # 默认工作包在构造时已解析并缓存，循环内直接使用其 id
+        work_package_id = self.default_work_package.id
 
         # 使用 (name, ecu_address, conversion_method_id) 作为唯一键
         existing_measurements = {}
+        # 只加载判重键和参与比较的列；键中使用 conversion_method_id，无需 JOIN CompuMethod
         for item in Measurement.objects.filter(
             a2l_file=self.a2l_file
-        ).select_related("conversion_method"):
+        ).only("id", "name", *_MEASUREMENT_UPDATE_FIELDS).iterator(chunk_size=_EXISTING_CHUNK_SIZE):
             key = (item.name, item.ecu_address, item.conversion_method_id)
             existing_measurements[key] = item
 
@@ -476,9 +574,9 @@ class A2LDataImporter:
 
         for meas_data in parsed_data.get("measurements", []):
             name = meas_data["name"]
-            conversion_method = compu_method_map.get(meas_data.get("conversion_method"))
+            conversion_method_id = compu_method_map.get(meas_data.get("conversion_method"))
             ecu_address = self._normalize_address(meas_data.get("ecu_address"))
-            if conversion_method is None:
+            if conversion_method_id is None:
                 logging.error(
                     "Measurement 缺少转换方法: name=%s conversion_key=%s record=%s (A2L文件ID: %s)",
                     name,
@@ -489,13 +587,13 @@ class A2LDataImporter:
                 continue
             
             # 使用组合键进行判重
-            key = (name, ecu_address, conversion_method.id)
+            key = (name, ecu_address, conversion_method_id)
             if key in processed_keys:
                 logging.warning(
                     "检测到重复的 Measurement: name=%s, ecu_address=%s, conversion_method_id=%s (A2L文件ID: %s)，仅保留首次解析的记录",
                     name,
                     ecu_address,
-                    conversion_method.id,
+                    conversion_method_id,
                     self.a2l_file.id,
                 )
                 continue
@@ -503,55 +601,31 @@ class A2LDataImporter:
             defaults = {
                 "long_identifier": meas_data.get("long_identifier", ""),
                 "datatype": meas_data.get("datatype", "UBYTE"),
-                "conversion_method": conversion_method,
+                "conversion_method_id": conversion_method_id,
                 "resolution": meas_data.get("resolution", 0),
                 "accuracy": meas_data.get("accuracy", 0.0),
                 "lower_limit": meas_data.get("lower_limit") or 0.0,
                 "upper_limit": meas_data.get("upper_limit") or 0.0,
                 "ecu_address": ecu_address,
-                "module": module_fallback,
-                "work_package": self.default_work_package,  # 默认使用"未绑定"工作包，后续可手工绑定
+                "module_id": module_fallback.id,
+                "work_package_id": work_package_id,  # 默认使用"未绑定"工作包，后续可手工绑定
             }
 
             existing = existing_measurements.get(key)
             if existing:
-                changed = False
-                for field, value in defaults.items():
-                    # 对于 ForeignKey 字段，比较时使用 field_id
-                    existing_value = self._safe_get_field_value(existing, field)
-                    # 如果 value 是对象，获取其 ID 用于比较
-                    value_for_compare = value.id if hasattr(value, 'id') else value
-                    if existing_value != value_for_compare:
-                        # 使用安全设置方法，对于 ForeignKey 字段会自动使用 field_id
-                        self._safe_set_field_value(existing, field, value)
-                        changed = True
+                changed = self._assign_changed_fields(existing, defaults, Measurement)
                 if changed:
                     to_update.append(existing)
                 processed_keys.add(key)
             else:
-                to_create.append(Measurement(a2l_file=self.a2l_file, name=name, **defaults))
+                to_create.append(Measurement(a2l_file_id=self.a2l_file.id, name=name, **defaults))
                 processed_keys.add(key)
 
         if to_create:
             Measurement.objects.bulk_create(to_create, batch_size=500)
             stats["measurements"] += len(to_create)
         if to_update:
-            Measurement.objects.bulk_update(
-                to_update,
-                [
-                    "long_identifier",
-                    "datatype",
-                    "conversion_method",
-                    "resolution",
-                    "accuracy",
-                    "lower_limit",
-                    "upper_limit",
-                    "ecu_address",
-                    "module",
-                    "work_package",
-                ],
-                batch_size=500,
-            )
+            Measurement.objects.bulk_update(to_update, list(_MEASUREMENT_UPDATE_FIELDS), batch_size=500)
 
         logging.info(
             "Measurement 入库完成: 新增 %d 条, 更新 %d 条 (A2L文件ID: %s)",
@@ -563,19 +637,22 @@ class A2LDataImporter:
     def _sync_characteristics(
         self,
         parsed_data: Dict,
-        compu_method_map: Dict[str, CompuMethod],
+        compu_method_map: Dict[str, int],
         stats: Dict[str, int],
     ) -> None:
-        module_fallback = self.default_module or self._find_existing_module()
+        module_fallback = self._module_fallback
         if module_fallback is None:
             logging.warning("未能解析到默认的 A2LModule，标定量入库被跳过")
             return
+        # 默认工作包在构造时已解析并缓存，循环内直接使用其 id
+        work_package_id = self.default_work_package.id
 
         # 使用 (name, ecu_address, conversion_method_id) 作为唯一键
         existing_characteristics = {}
+        # 只加载判重键和参与比较的列；键中使用 conversion_method_id，无需 JOIN CompuMethod
         for item in Characteristic.objects.filter(
             a2l_file=self.a2l_file
-        ).select_related("conversion_method"):
+        ).only("id", "name", *_CHARACTERISTIC_UPDATE_FIELDS).iterator(chunk_size=_EXISTING_CHUNK_SIZE):
             key = (item.name, item.ecu_address, item.conversion_method_id)
             existing_characteristics[key] = item
 
@@ -585,9 +662,9 @@ class A2LDataImporter:
 
         for char_data in parsed_data.get("characteristics", []):
             name = char_data["name"]
-            conversion_method = compu_method_map.get(char_data.get("conversion_method"))
+            conversion_method_id = compu_method_map.get(char_data.get("conversion_method"))
             ecu_address = self._normalize_address(char_data.get("ecu_address"))
-            if conversion_method is None:
+            if conversion_method_id is None:
                 logging.error(
                     "Characteristic 缺少转换方法: name=%s conversion_key=%s record=%s (A2L文件ID: %s)",
                     name,
@@ -598,13 +675,13 @@ class A2LDataImporter:
                 continue
             
             # 使用组合键进行判重
-            key = (name, ecu_address, conversion_method.id)
+            key = (name, ecu_address, conversion_method_id)
             if key in processed_keys:
                 logging.warning(
                     "检测到重复的 Characteristic: name=%s, ecu_address=%s, conversion_method_id=%s (A2L文件ID: %s)，仅保留首次解析的记录",
                     name,
                     ecu_address,
-                    conversion_method.id,
+                    conversion_method_id,
                     self.a2l_file.id,
                 )
                 continue
@@ -619,57 +696,31 @@ class A2LDataImporter:
                 "characteristic_type": char_data.get("characteristic_type", "VALUE"),
                 "ecu_address": ecu_address,
                 "record_layout": char_data.get("record_layout", ""),
-                "conversion_method": conversion_method,
+                "conversion_method_id": conversion_method_id,
                 "max_diff": char_data.get("max_diff", 0.0),
                 "lower_limit": char_data.get("lower_limit") or 0.0,
                 "upper_limit": char_data.get("upper_limit") or 0.0,
                 "number": number_value,
-                "module": module_fallback,
-                "work_package": self.default_work_package,  # 默认使用"未绑定"工作包，后续可手工绑定
+                "module_id": module_fallback.id,
+                "work_package_id": work_package_id,  # 默认使用"未绑定"工作包，后续可手工绑定
                 "updater": self.updater,
             }
 
             existing = existing_characteristics.get(key)
             if existing:
-                changed = False
-                for field, value in defaults.items():
-                    # 对于 ForeignKey 字段，比较时使用 field_id
-                    existing_value = self._safe_get_field_value(existing, field)
-                    # 如果 value 是对象，获取其 ID 用于比较
-                    value_for_compare = value.id if hasattr(value, 'id') else value
-                    if existing_value != value_for_compare:
-                        # 使用安全设置方法，对于 ForeignKey 字段会自动使用 field_id
-                        self._safe_set_field_value(existing, field, value)
-                        changed = True
+                changed = self._assign_changed_fields(existing, defaults, Characteristic)
                 if changed:
                     to_update.append(existing)
                 processed_keys.add(key)
             else:
-                to_create.append(Characteristic(a2l_file=self.a2l_file, name=name, **defaults))
+                to_create.append(Characteristic(a2l_file_id=self.a2l_file.id, name=name, **defaults))
                 processed_keys.add(key)
 
         if to_create:
             Characteristic.objects.bulk_create(to_create, batch_size=500)
             stats["characteristics"] += len(to_create)
         if to_update:
-            Characteristic.objects.bulk_update(
-                to_update,
-                [
-                    "long_identifier",
-                    "characteristic_type",
-                    "ecu_address",
-                    "record_layout",
-                    "conversion_method",
-                    "max_diff",
-                    "lower_limit",
-                    "upper_limit",
-                    "number",
-                    "module",
-                    "work_package",
-                    "updater",
-                ],
-                batch_size=500,
-            )
+            Characteristic.objects.bulk_update(to_update, list(_CHARACTERISTIC_UPDATE_FIELDS), batch_size=500)
 
         logging.info(
             "Characteristic 入库完成: 新增 %d 条, 更新 %d 条, 跳过 %d 条",
@@ -681,182 +732,224 @@ class A2LDataImporter:
     def _prepare_characteristics_data_with_existing(
         self,
         parsed_data: Dict,
-        compu_method_map: Dict[str, CompuMethod],
+        compu_method_map: Dict[str, int],
         existing_characteristics: Dict,
-    ) -> tuple[List[Characteristic], List[Characteristic]]:
+    ) -> tuple[List[Characteristic], Dict[Tuple[str, ...], List[Characteristic]]]:
         """准备标定量数据（不执行数据库操作，可并行调用）
         
         基于 unique_together (a2l_file, name, ecu_address, conversion_method) 进行判重
         对于已存在的记录进行更新，对于新记录进行创建
         
         Args:
-            existing_characteristics: 已存在的记录字典，key 为 (name, ecu_address, conversion_method_name)
+            existing_characteristics: 已存在的记录字典，key 为 (name, ecu_address, conversion_method_name)，value 为 values() 取出的行字典
         """
-        module_fallback = self.default_module or self._find_existing_module()
+        module_fallback = self._module_fallback
         if module_fallback is None:
-            return [], []
-
-        to_create: List[Characteristic] = []
-        to_update: List[Characteristic] = []
-        processed_keys: set[tuple] = set()
+            return [], {}
+
+        # 第一遍：按组合键索引解析数据，顺带去重（重复时保留首次解析的记录）
+        # 值为构造实例所需的字段字典；实例只为需要写入的行创建，未变化的行不付出 Model 构造开销
+        plan_by_key: Dict[tuple, Dict] = {}
+        duplicate_keys: List[tuple] = []
+        # 循环内的问题记录先收集，循环结束后汇总输出，避免逐行写日志
+        missing_conversion_methods: List[tuple] = []
+        # 热循环内频繁调用的方法及循环不变量绑定到局部变量，省去逐行的属性查找
+        get_compu_method = compu_method_map.get
+        normalize_address = self._normalize_address
+        a2l_file_id = self.a2l_file.id
+        module_id = module_fallback.id
+        work_package_id = self.default_work_package.id
+        updater = self.updater
+        normalize_number = self._normalize_characteristic_number
+        share_text = _intern_text
 
         for char_data in parsed_data.get("characteristics", []):
             name = char_data["name"]
-            conversion_method = compu_method_map.get(char_data.get("conversion_method"))
-            ecu_address = self._normalize_address(char_data.get("ecu_address"))
-            if conversion_method is None:
-                logging.error(
-                    "Characteristic 缺少转换方法: name=%s conversion_key=%s record=%s (A2L文件ID: %s)",
-                    name,
-                    char_data.get("conversion_method"),
-                    char_data,
-                    self.a2l_file.id,
-                )
+            # 换算方法名称只取一次：既用于查 id，也直接作为组合键的一部分
+            conversion_method_name = char_data.get("conversion_method")
+            conversion_method_id = get_compu_method(conversion_method_name)
+            if conversion_method_id is None:
+                missing_conversion_methods.append((name, conversion_method_name))
                 continue
+            ecu_address = char_data.get("ecu_address")
+            # 解析器给出的地址绝大多数已是 int，直接使用，省去一次函数调用
+            if type(ecu_address) is not int:
+                ecu_address = normalize_address(ecu_address)
             
             # 使用组合键进行判重（基于 unique_together）
-            # 注意：使用 conversion_method.name 而不是 conversion_method.id，因为 CompuMethod 采用"先删除后创建"策略，ID 会变化
-            conversion_method_name = conversion_method.name if conversion_method else ""
+            # 注意：使用 conversion_method 名称而不是 id，因为 CompuMethod 采用"先删除后创建"策略，ID 会变化
+            # compu_method_map 以名称为键，命中即说明名称就是解析数据中的 conversion_method
             key = (name, ecu_address, conversion_method_name)
-            if key in processed_keys:
-                logging.warning(
-                    "检测到重复的 Characteristic: name=%s, ecu_address=%s, conversion_method=%s (A2L文件ID: %s)，仅保留首次解析的记录",
-                    name,
-                    ecu_address,
-                    conversion_method_name,
-                    self.a2l_file.id,
-                )
+            if key in plan_by_key:
+                # 重复记录只收集组合键，循环结束后汇总输出一次
+                duplicate_keys.append(key)
                 continue
             
-            number_value = self._normalize_characteristic_number(
+            number_value = normalize_number(
                 char_data.get("number", 0),
                 name,
                 char_data,
             )
-            defaults = {
-                "long_identifier": char_data.get("long_identifier", ""),
-                "characteristic_type": char_data.get("characteristic_type", "VALUE"),
-                "ecu_address": ecu_address,
-                "record_layout": char_data.get("record_layout", ""),
-                "conversion_method": conversion_method,
-                "max_diff": char_data.get("max_diff", 0.0),
-                "lower_limit": char_data.get("lower_limit") or 0.0,
-                "upper_limit": char_data.get("upper_limit") or 0.0,
-                "number": number_value,
-                "module": module_fallback,
-                "work_package": self.default_work_package,  # 默认使用"未绑定"工作包，后续可手工绑定
-                "updater": self.updater,
-            }
+            plan_by_key[key] = dict(
+                a2l_file_id=a2l_file_id,
+                name=name,
+                long_identifier=share_text(char_data.get("long_identifier", "")),
+                characteristic_type=share_text(char_data.get("characteristic_type", "VALUE")),
+                ecu_address=ecu_address,
+                record_layout=share_text(char_data.get("record_layout", "")),
+                conversion_method_id=conversion_method_id,
+                max_diff=char_data.get("max_diff", 0.0),
+                lower_limit=char_data.get("lower_limit") or 0.0,
+                upper_limit=char_data.get("upper_limit") or 0.0,
+                number=number_value,
+                module_id=module_id,
+                work_package_id=work_package_id,  # 默认使用"未绑定"工作包，后续可手工绑定
+                updater=updater,
+            )
 
-            existing = existing_characteristics.get(key)
-            if existing:
-                # 更新现有记录
-                changed = False
-                for field, value in defaults.items():
-                    # 对于 ForeignKey 字段，比较时使用 field_id
-                    existing_value = self._safe_get_field_value(existing, field)
-                    # 如果 value 是对象，获取其 ID 用于比较
-                    value_for_compare = value.id if hasattr(value, 'id') else value
-                    if existing_value != value_for_compare:
-                        # 使用安全设置方法，对于 ForeignKey 字段会自动使用 field_id
-                        self._safe_set_field_value(existing, field, value)
-                        changed = True
-                if changed:
-                    to_update.append(existing)
-                processed_keys.add(key)
-            else:
-                # 创建新记录
-                to_create.append(Characteristic(a2l_file=self.a2l_file, name=name, **defaults))
-                processed_keys.add(key)
+        _log_collected(
+            logging.ERROR,
+            "Characteristic 缺少转换方法，已跳过 (name, conversion_key)",
+            missing_conversion_methods,
+            a2l_file_id,
+        )
+        _log_collected(
+            logging.WARNING,
+            "检测到重复的 Characteristic，仅保留首次解析的记录 (name, ecu_address, conversion_method)",
+            duplicate_keys,
+            a2l_file_id,
+        )
+
+        # 第二遍：每行只查一次现有记录，未命中为新建，命中且字段有变化为更新（保持解析顺序）
+        to_create: List[Characteristic] = []
+        append_create = to_create.append
+        # 按变化字段分组，每组只更新实际变化的列
+        to_update: Dict[Tuple[str, ...], List[Characteristic]] = {}
+        get_existing = existing_characteristics.get
+        field_names = _CHARACTERISTIC_UPDATE_FIELDS
+        # 现有行字典与计划字段字典的键同为 attname，用同一个取值器即可比较
+        get_values = itemgetter(*field_names)
+        for key, fields in plan_by_key.items():
+            existing = get_existing(key)
+            if existing is None:
+                append_create(Characteristic(**fields))
+                continue
+            # 更新现有记录：字段有变化时，以新构造的实例携带现有主键参与更新
+            current_values = get_values(existing)
+            new_values = get_values(fields)
+            if current_values != new_values:
+                changed_fields = tuple(
+                    name for name, current, new in zip(field_names, current_values, new_values) if current != new
+                )
+                to_update.setdefault(changed_fields, []).append(Characteristic(pk=existing["id"], **fields))
 
         return to_create, to_update
 
     def _prepare_measurements_data_with_existing(
         self,
         parsed_data: Dict,
-        compu_method_map: Dict[str, CompuMethod],
+        compu_method_map: Dict[str, int],
         module: Optional[A2LModule],
         existing_measurements: Dict,
-    ) -> tuple[List[Measurement], List[Measurement]]:
+    ) -> tuple[List[Measurement], Dict[Tuple[str, ...], List[Measurement]]]:
         """准备测量量数据（不执行数据库操作，可并行调用）
         
         基于 unique_together (a2l_file, name, ecu_address, conversion_method) 进行判重
         对于已存在的记录进行更新，对于新记录进行创建
         
         Args:
-            existing_measurements: 已存在的记录字典，key 为 (name, ecu_address, conversion_method_name)
+            existing_measurements: 已存在的记录字典，key 为 (name, ecu_address, conversion_method_name)，value 为 values() 取出的行字典
         """
-        module_fallback = self.default_module or module
-        if module_fallback is None:
-            module_fallback = self._find_existing_module()
+        module_fallback = self._module_fallback
         if module_fallback is None:
-            return [], []
-
-        to_create: List[Measurement] = []
-        to_update: List[Measurement] = []
-        processed_keys: set[tuple] = set()
+            return [], {}
+
+        # 第一遍：按组合键索引解析数据，顺带去重（重复时保留首次解析的记录）
+        # 值为构造实例所需的字段字典；实例只为需要写入的行创建，未变化的行不付出 Model 构造开销
+        plan_by_key: Dict[tuple, Dict] = {}
+        duplicate_keys: List[tuple] = []
+        # 循环内的问题记录先收集，循环结束后汇总输出，避免逐行写日志
+        missing_conversion_methods: List[tuple] = []
+        # 热循环内频繁调用的方法及循环不变量绑定到局部变量，省去逐行的属性查找
+        get_compu_method = compu_method_map.get
+        normalize_address = self._normalize_address
+        a2l_file_id = self.a2l_file.id
+        module_id = module_fallback.id
+        work_package_id = self.default_work_package.id
+        share_text = _intern_text
 
         for meas_data in parsed_data.get("measurements", []):
             name = meas_data["name"]
-            conversion_method = compu_method_map.get(meas_data.get("conversion_method"))
-            ecu_address = self._normalize_address(meas_data.get("ecu_address"))
-            if conversion_method is None:
-                logging.error(
-                    "Measurement 缺少转换方法: name=%s conversion_key=%s record=%s (A2L文件ID: %s)",
-                    name,
-                    meas_data.get("conversion_method"),
-                    meas_data,
-                    self.a2l_file.id,
-                )
+            # 换算方法名称只取一次：既用于查 id，也直接作为组合键的一部分
+            conversion_method_name = meas_data.get("conversion_method")
+            conversion_method_id = get_compu_method(conversion_method_name)
+            if conversion_method_id is None:
+                missing_conversion_methods.append((name, conversion_method_name))
                 continue
+            ecu_address = meas_data.get("ecu_address")
+            # 解析器给出的地址绝大多数已是 int，直接使用，省去一次函数调用
+            if type(ecu_address) is not int:
+                ecu_address = normalize_address(ecu_address)
             
             # 使用组合键进行判重（基于 unique_together）
-            # 注意：使用 conversion_method.name 而不是 conversion_method.id，因为 CompuMethod 采用"先删除后创建"策略，ID 会变化
-            conversion_method_name = conversion_method.name if conversion_method else ""
+            # 注意：使用 conversion_method 名称而不是 id，因为 CompuMethod 采用"先删除后创建"策略，ID 会变化
+            # compu_method_map 以名称为键，命中即说明名称就是解析数据中的 conversion_method
             key = (name, ecu_address, conversion_method_name)
-            if key in processed_keys:
-                logging.warning(
-                    "检测到重复的 Measurement: name=%s, ecu_address=%s, conversion_method=%s (A2L文件ID: %s)，仅保留首次解析的记录",
-                    name,
-                    ecu_address,
-                    conversion_method_name,
-                    self.a2l_file.id,
-                )
+            if key in plan_by_key:
+                # 重复记录只收集组合键，循环结束后汇总输出一次
+                duplicate_keys.append(key)
                 continue
             
-            defaults = {
-                "long_identifier": meas_data.get("long_identifier", ""),
-                "datatype": meas_data.get("datatype", "UBYTE"),
-                "conversion_method": conversion_method,
-                "resolution": meas_data.get("resolution", 0),
-                "accuracy": meas_data.get("accuracy", 0.0),
-                "lower_limit": meas_data.get("lower_limit") or 0.0,
-                "upper_limit": meas_data.get("upper_limit") or 0.0,
-                "ecu_address": ecu_address,
-                "module": module_fallback,
-                "work_package": self.default_work_package,  # 默认使用"未绑定"工作包，后续可手工绑定
-            }
+            plan_by_key[key] = dict(
+                a2l_file_id=a2l_file_id,
+                name=name,
+                long_identifier=share_text(meas_data.get("long_identifier", "")),
+                datatype=share_text(meas_data.get("datatype", "UBYTE")),
+                conversion_method_id=conversion_method_id,
+                resolution=meas_data.get("resolution", 0),
+                accuracy=meas_data.get("accuracy", 0.0),
+                lower_limit=meas_data.get("lower_limit") or 0.0,
+                upper_limit=meas_data.get("upper_limit") or 0.0,
+                ecu_address=ecu_address,
+                module_id=module_id,
+                work_package_id=work_package_id,  # 默认使用"未绑定"工作包，后续可手工绑定
+            )
 
-            existing = existing_measurements.get(key)
-            if existing:
-                # 更新现有记录
-                changed = False
-                for field, value in defaults.items():
-                    # 对于 ForeignKey 字段，比较时使用 field_id
-                    existing_value = self._safe_get_field_value(existing, field)
-                    # 如果 value 是对象，获取其 ID 用于比较
-                    value_for_compare = value.id if hasattr(value, 'id') else value
-                    if existing_value != value_for_compare:
-                        # 使用安全设置方法，对于 ForeignKey 字段会自动使用 field_id
-                        self._safe_set_field_value(existing, field, value)
-                        changed = True
-                if changed:
-                    to_update.append(existing)
-                processed_keys.add(key)
-            else:
-                # 创建新记录
-                to_create.append(Measurement(a2l_file=self.a2l_file, name=name, **defaults))
-                processed_keys.add(key)
+        _log_collected(
+            logging.ERROR,
+            "Measurement 缺少转换方法，已跳过 (name, conversion_key)",
+            missing_conversion_methods,
+            a2l_file_id,
+        )
+        _log_collected(
+            logging.WARNING,
+            "检测到重复的 Measurement，仅保留首次解析的记录 (name, ecu_address, conversion_method)",
+            duplicate_keys,
+            a2l_file_id,
+        )
+
+        # 第二遍：每行只查一次现有记录，未命中为新建，命中且字段有变化为更新（保持解析顺序）
+        to_create: List[Measurement] = []
+        append_create = to_create.append
+        # 按变化字段分组，每组只更新实际变化的列
+        to_update: Dict[Tuple[str, ...], List[Measurement]] = {}
+        get_existing = existing_measurements.get
+        field_names = _MEASUREMENT_UPDATE_FIELDS
+        # 现有行字典与计划字段字典的键同为 attname，用同一个取值器即可比较
+        get_values = itemgetter(*field_names)
+        for key, fields in plan_by_key.items():
+            existing = get_existing(key)
+            if existing is None:
+                append_create(Measurement(**fields))
+                continue
+            # 更新现有记录：字段有变化时，以新构造的实例携带现有主键参与更新
+            current_values = get_values(existing)
+            new_values = get_values(fields)
+            if current_values != new_values:
+                changed_fields = tuple(
+                    name for name, current, new in zip(field_names, current_values, new_values) if current != new
+                )
+                to_update.setdefault(changed_fields, []).append(Measurement(pk=existing["id"], **fields))
 
         return to_create, to_update
 
@@ -865,86 +958,87 @@ class A2LDataImporter:
         
         基于 unique_together (a2l_file, name, address, conversion_method) 进行判重
         """
-        created_count = 0
-        updated_count = 0
         skipped_errors = 0
         total = len(parsed_data.get("axis_pts", []))
-        
+        module_fallback = self._module_fallback
+        if module_fallback is None:
+            if total:
+                logging.warning("未能解析到默认的 A2LModule，AxisPts 入库被跳过")
+            return
+
+        # 一次性加载现有记录，按组合键索引，在内存中区分新增与更新
+        existing_by_key = {
+            (axis_pts.name, axis_pts.address, axis_pts.conversion_method): axis_pts
+            for axis_pts in AxisPts.objects.filter(a2l_file=self.a2l_file).only(
+                "id", "name", "address", "conversion_method", *_AXIS_PTS_UPDATE_FIELDS
+            )
+        }
+        # 同一组合键在文件中重复出现时，以最后一条为准
+        plan_by_key: Dict[tuple, AxisPts] = {}
+        normalize_address = self._normalize_address
+        a2l_file_id = self.a2l_file.id
+        module_id = module_fallback.id
         for axis_pts_data in parsed_data.get("axis_pts", []):
             name = axis_pts_data.get("name")
             if not name:
                 skipped_errors += 1
                 continue
                 
-            address = self._normalize_address(axis_pts_data.get("ecu_address", 0))
+            address = axis_pts_data.get("ecu_address", 0)
+            if type(address) is not int:
+                address = normalize_address(address)
             conversion_method = axis_pts_data.get("conversion_method", "")
+            plan_by_key[(name, address, conversion_method)] = AxisPts(
+                a2l_file_id=a2l_file_id,
+                name=name,
+                address=address,
+                conversion_method=conversion_method,
+                long_identifier=axis_pts_data.get("long_identifier", ""),
+                input_quantity=axis_pts_data.get("input_quantity", ""),
+                record_layout=axis_pts_data.get("record_layout", ""),
+                max_diff=axis_pts_data.get("max_diff", 0.0),
+                max_axis_points=axis_pts_data.get("max_axis_points", 0),
+                lower_limit=axis_pts_data.get("lower_limit") or 0.0,
+                upper_limit=axis_pts_data.get("upper_limit") or 0.0,
+                module_id=module_id,
+            )
 
-            try:
-                axis_pts, created = AxisPts.objects.update_or_create(
-                    a2l_file=self.a2l_file,
-                    name=name,
-                    address=address,
-                    conversion_method=conversion_method,
-                    defaults={
-                        "long_identifier": axis_pts_data.get("long_identifier", ""),
-                        "input_quantity": axis_pts_data.get("input_quantity", ""),
-                        "record_layout": axis_pts_data.get("record_layout", ""),
-                        "max_diff": axis_pts_data.get("max_diff", 0.0),
-                        "max_axis_points": axis_pts_data.get("max_axis_points", 0),
-                        "lower_limit": axis_pts_data.get("lower_limit") or 0.0,
-                        "upper_limit": axis_pts_data.get("upper_limit") or 0.0,
-                        "module": self.default_module or self._find_existing_module(),
-                    },
-                )
-                if created:
-                    stats["axis_pts"] += 1
-                    created_count += 1
-                else:
-                    updated_count += 1
-                    logging.debug(
-                        "更新已存在的 AxisPts: name=%s, address=%s, conversion_method=%s (A2L文件ID: %s)",
-                        name,
-                        address,
-                        conversion_method,
-                        self.a2l_file.id,
-                    )
-            except Exception as exc:
-                logging.warning(
-                    "入库 AXIS_PTS (name=%s, address=%s, conversion_method=%s) 失败: %s",
-                    name,
-                    address,
-                    conversion_method,
-                    exc,
-                )
-                skipped_errors += 1
+        to_create: List[AxisPts] = []
+        to_update: List[AxisPts] = []
+        for key, candidate in plan_by_key.items():
+            existing = existing_by_key.get(key)
+            if existing is None:
+                to_create.append(candidate)
+            elif self._assign_changed_fields(existing, candidate, AxisPts):
+                to_update.append(existing)
+        if to_create:
+            to_create.sort(key=_get_name)
+            AxisPts.objects.bulk_create(to_create, batch_size=1000)
+        if to_update:
+            to_update.sort(key=_get_pk)
+            AxisPts.objects.bulk_update(to_update, list(_AXIS_PTS_UPDATE_FIELDS), batch_size=500)
+        created_count = len(to_create)
+        stats["axis_pts"] += created_count
         
         logging.info(
             "AxisPts 入库完成: 总数=%d, 新增=%d, 更新=%d, 错误=%d (A2L文件ID: %s)",
             total,
             created_count,
-            updated_count,
+            total - skipped_errors - created_count,
             skipped_errors,
             self.a2l_file.id,
         )
 
     def _sync_axis_descrs(self, parsed_data: Dict, stats: Dict[str, int]) -> None:
-        # 先删除该 A2L 文件相关的所有 AxisDescr 记录，确保数据一致性
-        # 这样可以避免重复导入时出现数据不一致的问题
-        characteristics_ids = Characteristic.objects.filter(
-            a2l_file=self.a2l_file
-        ).values_list('id', flat=True)
-        deleted_count = AxisDescr.objects.filter(
-            characteristic_id__in=characteristics_ids
-        ).delete()[0]
-        if deleted_count > 0:
-            logging.info("删除该 A2L 文件相关的旧 AxisDescr 记录: %d 条 (A2L文件ID: %s)", deleted_count, self.a2l_file.id)
-        
-        created_count = 0
-        updated_count = 0
+        # 该 A2L 文件相关的旧 AxisDescr 记录已在 save() 中更新 Characteristic 之前删除，这里直接创建
+        to_create: List[AxisDescr] = []
         skipped_no_char_name = 0
-        skipped_no_characteristic = 0
-        skipped_errors = 0
+        # 循环内的问题记录先收集，循环结束后汇总输出，避免逐行写日志
+        missing_characteristics: List[str] = []
+        ambiguous_characteristics: List[tuple] = []
         total = len(parsed_data.get("axis_descrs", []))
+        characteristics_by_name = self._characteristics_by_name()
+        share_text = _intern_text
         
         for axis_descr in parsed_data.get("axis_descrs", []):
             char_name = axis_descr.get("characteristic_name")
@@ -952,70 +1046,62 @@ class A2LDataImporter:
                 skipped_no_char_name += 1
                 continue
             # 注意：由于 unique_together 包含 (a2l_file, name, ecu_address, conversion_method)，
-            # 同一个 A2L 文件中可能有多个同名的 Characteristic，这里使用 .first() 获取第一个匹配的记录
-            characteristics = Characteristic.objects.filter(
-                a2l_file=self.a2l_file, name=char_name
-            )
-            if not characteristics.exists():
-                logging.warning("AxisDescr 找不到对应的 Characteristic: %s (A2L文件ID: %s)", char_name, self.a2l_file.id)
-                skipped_no_characteristic += 1
+            # 同一个 A2L 文件中可能有多个同名的 Characteristic，这里取主键最小的记录
+            characteristics = characteristics_by_name.get(char_name)
+            if not characteristics:
+                missing_characteristics.append(char_name)
                 continue
-            if characteristics.count() > 1:
-                logging.warning(
-                    "AxisDescr 找到多个同名的 Characteristic: %s (A2L文件ID: %s, 共 %d 个)，使用第一个匹配的记录",
-                    char_name,
-                    self.a2l_file.id,
-                    characteristics.count(),
-                )
-            characteristic = characteristics.first()
+            if len(characteristics) > 1:
+                ambiguous_characteristics.append((char_name, len(characteristics)))
+            characteristic = characteristics[0]
             # 注意：axis_pts_ref_name 只是用于记录第一个引用的名称，不应该作为创建 AxisDescr 的必要条件
             # 即使没有 axis_pts_ref_name，也应该创建 AxisDescr，因为对应的 axis_pts_refs 可能仍然存在
             defaults = {
-                "input_quantity": axis_descr.get("input_quantity", ""),
-                "conversion_method": axis_descr.get("conversion_method", ""),
+                "input_quantity": share_text(axis_descr.get("input_quantity", "")),
+                "conversion_method": share_text(axis_descr.get("conversion_method", "")),
                 "max_axis_points": axis_descr.get("max_axis_points", 0),
                 "lower_limit": axis_descr.get("lower_limit") or 0.0,
                 "upper_limit": axis_descr.get("upper_limit") or 0.0,
-                "attribute": axis_descr.get("attribute", ""),
+                "attribute": share_text(axis_descr.get("attribute", "")),
             }
-            try:
-                # 由于已经删除了该 A2L 文件相关的所有旧记录，这里直接创建新记录
-                AxisDescr.objects.create(
-                    characteristic=characteristic,
-                    **defaults
-                )
-                stats["axis_descrs"] += 1
-                created_count += 1
-            except Exception as exc:
-                logging.warning("入库 AXIS_DESCR (char=%s) 失败: %s", char_name, exc)
-                skipped_errors += 1
-        processed_count = created_count + updated_count
+            # 由于已经删除了该 A2L 文件相关的所有旧记录，这里直接收集新记录，循环结束后批量创建
+            to_create.append(AxisDescr(characteristic=characteristic, **defaults))
+        if to_create:
+            AxisDescr.objects.bulk_create(to_create, batch_size=1000)
+        created_count = len(to_create)
+        stats["axis_descrs"] += created_count
+        _log_collected(logging.WARNING, "AxisDescr 找不到对应的 Characteristic", missing_characteristics, self.a2l_file.id)
+        _log_collected(
+            logging.WARNING,
+            "AxisDescr 找到多个同名的 Characteristic，使用第一个匹配的记录 (name, 个数)",
+            ambiguous_characteristics,
+            self.a2l_file.id,
+        )
         logging.info(
-            "AxisDescr 入库完成: 总数=%d, 处理=%d(新增=%d, 更新=%d), 跳过(无char_name)=%d, 跳过(无Characteristic)=%d, 错误=%d",
-            total, processed_count, created_count, updated_count, skipped_no_char_name, skipped_no_characteristic, skipped_errors
+            "AxisDescr 入库完成: 总数=%d, 新增=%d, 跳过(无char_name)=%d, 跳过(无Characteristic)=%d",
+            total, created_count, skipped_no_char_name, len(missing_characteristics)
         )
 
     def _sync_axis_pts_refs(self, parsed_data: Dict, stats: Dict[str, int]) -> None:
-        # 先删除该 A2L 文件相关的所有 AxisPtsRef 记录，确保数据一致性
-        # 这样可以避免重复导入时出现数据不一致的问题
-        characteristics_ids = Characteristic.objects.filter(
-            a2l_file=self.a2l_file
-        ).values_list('id', flat=True)
-        axis_descrs_ids = AxisDescr.objects.filter(
-            characteristic_id__in=characteristics_ids
-        ).values_list('id', flat=True)
-        deleted_count = AxisPtsRef.objects.filter(
-            axis_descr_id__in=axis_descrs_ids
-        ).delete()[0]
-        if deleted_count > 0:
-            logging.info("删除该 A2L 文件相关的旧 AxisPtsRef 记录: %d 条 (A2L文件ID: %s)", deleted_count, self.a2l_file.id)
-        
-        created_count = 0
+        # 该 A2L 文件相关的旧 AxisPtsRef 记录已在 save() 中更新 Characteristic 之前删除，这里直接创建
+        to_create: List[AxisPtsRef] = []
+        # 本次已收集的 AxisPtsRef 尚未写入数据库，按 (characteristic_id, axis_points) 记录其 AxisDescr 供后续匹配
+        pending_axis_descrs: Dict[tuple, AxisDescr] = {}
         skipped_no_data = 0
-        skipped_no_characteristic = 0
-        skipped_no_axis_descr = 0
-        skipped_errors = 0
+        # 循环内的问题记录先收集，循环结束后汇总输出，避免逐行写日志
+        missing_characteristics: List[str] = []
+        ambiguous_characteristics: List[tuple] = []
+        missing_axis_descrs: List[tuple] = []
         total = len(parsed_data.get("axis_pts_refs", []))
+        characteristics_by_name = self._characteristics_by_name()
+        # 一次性加载 AxisDescr，按主键顺序建立索引，保持与 .first() 相同的匹配结果
+        axis_descr_by_char_attr: Dict[tuple, AxisDescr] = {}
+        first_axis_descr_by_char: Dict[int, AxisDescr] = {}
+        for axis_descr in AxisDescr.objects.filter(characteristic__a2l_file=self.a2l_file).order_by("id").only(
+            "id", "characteristic_id", "attribute"
+        ):
+            axis_descr_by_char_attr.setdefault((axis_descr.characteristic_id, axis_descr.attribute), axis_descr)
+            first_axis_descr_by_char.setdefault(axis_descr.characteristic_id, axis_descr)
         
         for axis_ref in parsed_data.get("axis_pts_refs", []):
             char_name = axis_ref.get("characteristic_name")
@@ -1024,71 +1110,61 @@ class A2LDataImporter:
                 skipped_no_data += 1
                 continue
             # 注意：由于 unique_together 包含 (a2l_file, name, ecu_address, conversion_method)，
-            # 同一个 A2L 文件中可能有多个同名的 Characteristic，这里使用 .first() 获取第一个匹配的记录
-            characteristics = Characteristic.objects.filter(
-                a2l_file=self.a2l_file, name=char_name
-            )
-            if not characteristics.exists():
-                logging.warning("AxisPtsRef 找不到对应的 Characteristic: %s (A2L文件ID: %s)", char_name, self.a2l_file.id)
-                skipped_no_characteristic += 1
+            # 同一个 A2L 文件中可能有多个同名的 Characteristic，这里取主键最小的记录
+            characteristics = characteristics_by_name.get(char_name)
+            if not characteristics:
+                missing_characteristics.append(char_name)
                 continue
-            if characteristics.count() > 1:
-                logging.warning(
-                    "AxisPtsRef 找到多个同名的 Characteristic: %s (A2L文件ID: %s, 共 %d 个)，使用第一个匹配的记录",
-                    char_name,
-                    self.a2l_file.id,
-                    characteristics.count(),
-                )
-            characteristic = characteristics.first()
+            if len(characteristics) > 1:
+                ambiguous_characteristics.append((char_name, len(characteristics)))
+            characteristic = characteristics[0]
             # 通过 characteristic 和 attribute 查找对应的 AxisDescr
             # 如果 axis_ref 中有 attribute 信息，使用它来精确匹配
             attribute = axis_ref.get("attribute", "")
             axis_descr = None
             if attribute:
-                axis_descr = AxisDescr.objects.filter(
-                    characteristic=characteristic,
-                    attribute=attribute,
-                ).first()
+                axis_descr = axis_descr_by_char_attr.get((characteristic.pk, attribute))
+            pending_key = (characteristic.pk, axis_points)
             if not axis_descr:
-                # 如果没有 attribute 或通过 attribute 找不到，尝试通过已存在的 AxisPtsRef 关系查询
-                axis_descr = AxisDescr.objects.filter(
-                    characteristic=characteristic,
-                    axis_pts_ref__axis_points=axis_points,
-                ).first()
+                # 如果没有 attribute 或通过 attribute 找不到，尝试通过已收集的 AxisPtsRef 关系匹配
+                axis_descr = pending_axis_descrs.get(pending_key)
             if not axis_descr:
                 # 如果还是找不到，取第一个匹配的 AxisDescr（作为后备方案）
-                axis_descr = AxisDescr.objects.filter(
-                    characteristic=characteristic,
-                ).first()
+                axis_descr = first_axis_descr_by_char.get(characteristic.pk)
             if not axis_descr:
-                logging.warning(
-                    "AxisPtsRef 找不到对应的 AxisDescr: char=%s, axis_points=%s, attribute=%s (A2L文件ID: %s)",
-                    char_name,
-                    axis_points,
-                    attribute,
-                    self.a2l_file.id,
-                )
-                skipped_no_axis_descr += 1
+                missing_axis_descrs.append((char_name, axis_points, attribute))
                 continue
-            try:
-                # 由于已经删除了该 A2L 文件相关的所有旧记录，这里直接创建新记录
-                AxisPtsRef.objects.create(
-                    axis_descr=axis_descr,
-                    axis_points=axis_points,
-                )
-                stats["axis_pts_refs"] += 1
-                created_count += 1
-            except Exception as exc:
-                logging.warning(
-                    "入库 AXIS_PTS_REF (char=%s, axis=%s) 失败: %s",
-                    char_name,
-                    axis_points,
-                    exc,
-                )
-                skipped_errors += 1
+            # 由于已经删除了该 A2L 文件相关的所有旧记录，这里直接收集新记录，循环结束后批量创建
+            to_create.append(AxisPtsRef(axis_descr=axis_descr, axis_points=axis_points))
+            # 与按主键排序的 .first() 保持一致：同一组合保留主键最小的 AxisDescr
+            pending = pending_axis_descrs.get(pending_key)
+            if pending is None or axis_descr.pk < pending.pk:
+                pending_axis_descrs[pending_key] = axis_descr
+        if to_create:
+            AxisPtsRef.objects.bulk_create(to_create, batch_size=1000)
+        created_count = len(to_create)
+        stats["axis_pts_refs"] += created_count
+        _log_collected(logging.WARNING, "AxisPtsRef 找不到对应的 Characteristic", missing_characteristics, self.a2l_file.id)
+        _log_collected(
+            logging.WARNING,
+            "AxisPtsRef 找到多个同名的 Characteristic，使用第一个匹配的记录 (name, 个数)",
+            ambiguous_characteristics,
+            self.a2l_file.id,
+        )
+        _log_collected(
+            logging.WARNING,
+            "AxisPtsRef 找不到对应的 AxisDescr (char, axis_points, attribute)",
+            missing_axis_descrs,
+            self.a2l_file.id,
+        )
         logging.info(
-            "AxisPtsRef 入库完成: 总数=%d, 新增=%d, 跳过(无数据)=%d, 跳过(无Characteristic)=%d, 跳过(无AxisDescr)=%d, 错误=%d (A2L文件ID: %s)",
-            total, created_count, skipped_no_data, skipped_no_characteristic, skipped_no_axis_descr, skipped_errors, self.a2l_file.id
+            "AxisPtsRef 入库完成: 总数=%d, 新增=%d, 跳过(无数据)=%d, 跳过(无Characteristic)=%d, 跳过(无AxisDescr)=%d (A2L文件ID: %s)",
+            total,
+            created_count,
+            skipped_no_data,
+            len(missing_characteristics),
+            len(missing_axis_descrs),
+            self.a2l_file.id,
         )
 
     def _sync_axis_pts_x(
@@ -1103,7 +1179,7 @@ class A2LDataImporter:
         if not axis_pts_x_list:
             return
         
-        target_module = module or self.default_module or self._find_existing_module()
+        target_module = module or self._module_fallback
         if not target_module:
             logging.warning("未能解析到默认的 A2LModule，AxisPtsX 入库被跳过")
             return
@@ -1120,7 +1196,12 @@ class A2LDataImporter:
         # 重新创建所有 AxisPtsX
         # 由于 AxisPtsX 的 record_layout 已改为 ForeignKey，一个 RecordLayout 可以关联多个 AxisPtsX
         # 采用"先删除后创建"策略，不需要唯一约束，允许重复的 (record_layout, position, datatype) 组合
-        created_count = 0
+        # 目标 module 下的 RecordLayout 一次性查出；名称可能重复，按主键顺序保留第一条，与 .first() 一致
+        record_layouts_by_name: Dict[str, RecordLayout] = {}
+        for record_layout in RecordLayout.objects.filter(module=target_module).order_by("id").only("id", "name"):
+            record_layouts_by_name.setdefault(record_layout.name, record_layout)
+
+        to_create: List[AxisPtsX] = []
         skipped_count = 0
         for axis_pts_x in axis_pts_x_list:
             record_layout_name = axis_pts_x.get("record_layout_name")
@@ -1128,33 +1209,24 @@ class A2LDataImporter:
                 skipped_count += 1
                 continue
             
-            record_layout = RecordLayout.objects.filter(
-                module=target_module,
-                name=record_layout_name,
-            ).first()
+            record_layout = record_layouts_by_name.get(record_layout_name)
             if not record_layout:
                 skipped_count += 1
                 continue
             
-            try:
-                AxisPtsX.objects.create(
+            to_create.append(
+                AxisPtsX(
                     record_layout=record_layout,
                     position=axis_pts_x.get("position", 0),
                     datatype=axis_pts_x.get("datatype", ""),
                     index_incr=axis_pts_x.get("index_incr", ""),
                     addressing=axis_pts_x.get("addressing", ""),
                 )
-                stats["axis_pts_x"] += 1
-                created_count += 1
-            except Exception as exc:
-                logging.warning(
-                    "入库 AXIS_PTS_X (record_layout=%s, position=%s, datatype=%s) 失败: %s",
-                    record_layout_name,
-                    axis_pts_x.get("position", 0),
-                    axis_pts_x.get("datatype", ""),
-                    exc,
-                )
-                skipped_count += 1
+            )
+        if to_create:
+            AxisPtsX.objects.bulk_create(to_create, batch_size=5000)
+        created_count = len(to_create)
+        stats["axis_pts_x"] += created_count
         
         logging.info(
             "AxisPtsX 入库完成: 新增 %d 条, 跳过 %d 条 (A2L文件ID: %s)",
@@ -1178,59 +1250,53 @@ class A2LDataImporter:
         if target_module:
             modules_to_process.add(target_module)
         
+        # 该 A2L 文件的 module 一次性查出，按名称索引（同一 project 下名称唯一）
+        modules_by_name: Dict[str, A2LModule] = {}
+        if any(rl_data.get("module_name") for rl_data in parsed_data.get("record_layouts", [])):
+            modules_by_name = {
+                mod.name: mod for mod in A2LModule.objects.filter(project__a2l_file=self.a2l_file)
+            }
         for rl_data in parsed_data.get("record_layouts", []):
             if rl_data.get("module_name"):
-                module_by_name = A2LModule.objects.filter(
-                    project__a2l_file=self.a2l_file,
-                    name=rl_data.get("module_name"),
-                ).first()
+                module_by_name = modules_by_name.get(rl_data.get("module_name"))
                 if module_by_name:
                     modules_to_process.add(module_by_name)
         
-        # 先删除所有相关 module 的 AxisPtsX（因为 AxisPtsX 有 OneToOneField 关联到 RecordLayout）
-        for mod in modules_to_process:
-            # 获取该 module 的所有 RecordLayout
-            record_layouts = RecordLayout.objects.filter(module=mod)
-            # 删除这些 RecordLayout 关联的 AxisPtsX
-            axis_pts_x_deleted = AxisPtsX.objects.filter(record_layout__in=record_layouts).delete()[0]
+        # 先删除所有相关 module 的 AxisPtsX（因为 AxisPtsX 有外键关联到 RecordLayout），再删除 RecordLayout
+        # 所有 module 合并为一条 DELETE，不再逐个 module 执行
+        if modules_to_process:
+            module_ids = [mod.id for mod in modules_to_process]
+            module_names = sorted(mod.name for mod in modules_to_process)
+            axis_pts_x_deleted = AxisPtsX.objects.filter(record_layout__module_id__in=module_ids).delete()[0]
             if axis_pts_x_deleted > 0:
                 logging.info("删除该 Module 相关的旧 AxisPtsX 记录: %d 条 (Module: %s, A2L文件ID: %s)", 
-                           axis_pts_x_deleted, mod.name, self.a2l_file.id)
-        
-        # 然后删除所有相关 module 的 RecordLayout
-        total_deleted = 0
-        for mod in modules_to_process:
-            deleted_count = RecordLayout.objects.filter(module=mod).delete()[0]
+                           axis_pts_x_deleted, module_names, self.a2l_file.id)
+            deleted_count = RecordLayout.objects.filter(module_id__in=module_ids).delete()[0]
             if deleted_count > 0:
                 logging.info("删除该 Module 相关的旧 RecordLayout 记录: %d 条 (Module: %s, A2L文件ID: %s)", 
-                           deleted_count, mod.name, self.a2l_file.id)
-                total_deleted += deleted_count
+                           deleted_count, module_names, self.a2l_file.id)
         
-        # 重新创建所有 RecordLayout
-        created_count = 0
+        # 重新创建所有 RecordLayout：先收集，循环结束后批量写入
+        to_create: List[RecordLayout] = []
         skipped_count = 0
         for rl_data in parsed_data.get("record_layouts", []):
             target_module = module or self.default_module
             if not target_module and rl_data.get("module_name"):
-                target_module = A2LModule.objects.filter(
-                    project__a2l_file=self.a2l_file,
-                    name=rl_data.get("module_name"),
-                ).first()
+                target_module = modules_by_name.get(rl_data.get("module_name"))
             if not target_module:
                 skipped_count += 1
                 continue
 
-            try:
-                RecordLayout.objects.create(
-                    module=target_module,
-                    name=rl_data["name"],
-                )
-                stats["record_layouts"] += 1
-                created_count += 1
-                # logging.info("新增 RecordLayout: %s (Module: %s)", rl_data["name"], target_module.name)
-            except Exception as exc:
-                logging.warning("入库 RECORD_LAYOUT %s 失败: %s", rl_data.get("name"), exc)
+            if not rl_data.get("name"):
+                logging.warning("RECORD_LAYOUT 缺少名称，已跳过: %s", rl_data)
                 skipped_count += 1
+                continue
+            to_create.append(RecordLayout(module=target_module, name=rl_data["name"]))
+
+        if to_create:
+            RecordLayout.objects.bulk_create(to_create, batch_size=1000)
+        created_count = len(to_create)
+        stats["record_layouts"] += created_count
         
         if skipped_count > 0:
             logging.info("RecordLayout 入库完成: 新增 %d 条, 跳过 %d 条 (A2L文件ID: %s)", 
@@ -1249,8 +1315,11 @@ class A2LDataImporter:
             return None
 
     def _resolve_default_unbound_work_package(self) -> WorkPackage:
-        """获取或创建默认的"未绑定"工作包，用于暂时关联测量量/标定量，后续可手工绑定。"""
-        work_package, created = WorkPackage.objects.get_or_create(
+        """获取或创建默认的"未绑定"工作包，用于暂时关联测量量/标定量，后续可手工绑定。
+
+        每个导入器实例只在构造时调用一次，结果缓存在 ``self.default_work_package`` 上。
+        """
+        work_package, _ = WorkPackage.objects.get_or_create(
             name="未绑定",
             owner="system",
             deleted=False,  # 确保查找的是未删除的工作包
@@ -1260,11 +1329,7 @@ class A2LDataImporter:
                 "deleted": False,  # 创建时明确设置为未删除
             },
         )
-        # 如果找到的工作包被标记为删除，恢复它
-        if not created and work_package.deleted:
-            work_package.deleted = False
-            work_package.save(update_fields=['deleted'])
-            logging.info("恢复已删除的默认工作包: 未绑定 (ID: %s)", work_package.id)
+        # 查找条件已限定 deleted=False，取到的工作包不会处于删除状态，无需再额外保存
         return work_package
 
     def _find_existing_module(self) -> Optional[A2LModule]:
@@ -1287,12 +1352,8 @@ class A2LDataImporter:
             return int(value)
 
         if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                return 0
-            try:
-                return int(float(stripped))
-            except ValueError:
+            parsed = _parse_number_text(value)
+            if parsed is None:
                 logging.warning(
                     "Characteristic number 字段解析失败: name=%s raw=%r record=%s (A2L文件ID: %s)",
                     name,
@@ -1301,6 +1362,7 @@ class A2LDataImporter:
                     self.a2l_file.id,
                 )
                 return 0
+            return parsed
 
         extracted = getattr(value, "number", None)
         if extracted is not None:
@@ -1325,6 +1387,57 @@ class A2LDataImporter:
         )
         return 0
 
+    @staticmethod
+    def _assign_changed_fields(instance, source, model_class) -> bool:
+        """Copy the differing update-field values from source onto instance.
+
+        ``source`` is either an unsaved instance of the same model or a dict keyed by update field.
+        """
+        field_names, get_values, get_items = _UPDATE_VALUE_GETTERS[model_class]
+        if isinstance(source, dict):
+            new_values = get_items(source)
+        else:
+            new_values = get_values(source)
+        current_values = get_values(instance)
+        # 大多数记录未变化，整体比较一次即可跳过逐字段处理
+        if current_values == new_values:
+            return False
+        for name, current, new in zip(field_names, current_values, new_values):
+            if current != new:
+                setattr(instance, name, new)
+        return True
+
+    @staticmethod
+    def _query_coeffs(keys) -> Dict[tuple, Coeffs]:
+        """Fetch the Coeffs rows matching the given (a, b, c, d, e, f) tuples."""
+        if not keys:
+            return {}
+        columns = ("a", "b", "c", "d", "e", "f")
+        # 按各列取值集合过滤出候选集，再在内存中按完整组合精确匹配
+        candidates = Coeffs.objects.filter(
+            **{f"{column}__in": {key[index] for key in keys} for index, column in enumerate(columns)}
+        )
+        found: Dict[tuple, Coeffs] = {}
+        for coeffs in candidates:
+            key = (coeffs.a, coeffs.b, coeffs.c, coeffs.d, coeffs.e, coeffs.f)
+            if key in keys:
+                found[key] = coeffs
+        return found
+
+    def _resolve_coeffs(self, keys: set, explicit_keys: set, stats: Dict[str, int]) -> Dict[tuple, Coeffs]:
+        """Return Coeffs for every key, bulk creating the missing ones."""
+        coeffs_map = self._query_coeffs(keys)
+        missing = keys - coeffs_map.keys()
+        if missing:
+            Coeffs.objects.bulk_create(
+                [Coeffs(a=key[0], b=key[1], c=key[2], d=key[3], e=key[4], f=key[5]) for key in missing],
+                batch_size=1000,
+            )
+            # 仅统计解析数据中显式给出的系数，默认恒等系数不计入
+            stats["coeffs"] += len(missing & explicit_keys)
+            coeffs_map.update(self._query_coeffs(missing))
+        return coeffs_map
+
     @staticmethod
     def _build_coeffs_key(coeffs_data: Dict) -> tuple:
         return (
@@ -1336,22 +1449,28 @@ class A2LDataImporter:
             coeffs_data.get("f", 1.0),
         )
 
-    def _build_compu_method_map(self, existing_map: Dict[str, CompuMethod]) -> Dict[str, CompuMethod]:
-        compu_method_map = dict(existing_map)
-        for cm in CompuMethod.objects.filter(a2l_file=self.a2l_file):
-            compu_method_map.setdefault(cm.name, cm)
-        return compu_method_map
+    def _fill_missing_compu_method_names(self, id_to_name: Dict[int, str], existing_records: List[Dict]) -> None:
+        """Add names for conversion methods referenced by existing records but missing from the map."""
+        missing_ids = {
+            item["conversion_method_id"]
+            for item in existing_records
+            if item["conversion_method_id"] and item["conversion_method_id"] not in id_to_name
+        }
+        if missing_ids:
+            id_to_name.update(CompuMethod.objects.filter(id__in=missing_ids).values_list("id", "name"))
 
     @staticmethod
     def _normalize_address(value) -> int:
+        # 解析器给出的地址几乎都是 int，先用精确类型判断走最短路径
+        value_type = type(value)
+        if value_type is int:
+            return value
+        if value_type is str:
+            return _parse_address_text(value)
         if value is None:
             return 0
         if isinstance(value, str):
-            value = value.strip()
-            try:
-                return int(value, 16) if value.lower().startswith("0x") or value.lower().startswith("-0x") else int(value)
-            except ValueError:
-                return 0
+            return _parse_address_text(value)
         if isinstance(value, (int, float)):
             return int(value)
         return 0
@@ -15,12 +15,31 @@ CFG格式：
 - 从第5行开始，每行格式为：信号名称;周期值
 """
 
+import functools
+import io
+import itertools
 import os
+import re
 import logging
-import tempfile
+import mmap
 import time
-import xml.etree.ElementTree as ET
-from typing import List, Tuple, Optional
+import zipfile
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Iterator, List, Tuple, Optional
+
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as etree
+    LXML_AVAILABLE = False
+
+# 上传的文件不可信：lxml 默认会展开外部实体（XXE），必须显式关闭实体解析、DTD 加载和网络访问；
+# 标准库 ElementTree 本身不加载外部实体，也不支持这些参数
+_ITERPARSE_OPTIONS = (
+    {'resolve_entities': False, 'no_network': True, 'load_dtd': False}
+    if LXML_AVAILABLE else {}
+)
 
 try:
     import openpyxl
@@ -34,8 +53,131 @@ try:
 except ImportError:
     XLRD_AVAILABLE = False
 
+# 可选的高性能读取后端（Rust实现，可直接读取xls/xlsx/xlsb），未安装时使用openpyxl/xlrd
+try:
+    from python_calamine import CalamineWorkbook
+    CALAMINE_AVAILABLE = True
+except ImportError:
+    CALAMINE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Excel XML (SpreadsheetML) 命名空间及常用标签（Clark 记法，避免每次查找都解析命名空间映射）
+_SS_NS = 'urn:schemas-microsoft-com:office:spreadsheet'
+_TAG_WORKSHEET = f'{{{_SS_NS}}}Worksheet'
+_TAG_TABLE = f'{{{_SS_NS}}}Table'
+_TAG_ROW = f'{{{_SS_NS}}}Row'
+_TAG_CELL = f'{{{_SS_NS}}}Cell'
+_TAG_DATA = f'{{{_SS_NS}}}Data'
+_ATTR_INDEX = f'{{{_SS_NS}}}Index'
+
+# 周期列中最常见的X标记取值，命中时无需再做标准化
+_X_SET = frozenset(("X", "x"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _normalize_header_cell(value: str) -> str:
+    """标准化表头单元格（表头行很小且各文件基本一致，结果缓存；限制容量，避免长期运行时无限增长）"""
+    if not value:
+        return ""
+    # 去除空格并转换为大写
+    return str(value).strip().upper()
+
+
+# 周期列表头关键字（标准化为大写后匹配）及其在列索引元组中的位置
+_PERIOD_HEADER_RE = re.compile(r"(10MSRSTR|100MSRSTR|POLLING_100MS|POLLING_500MS|POLLING_1S)")
+_PERIOD_HEADER_SLOTS = {
+    "10MSRSTR": 0,
+    "100MSRSTR": 1,
+    "POLLING_100MS": 2,
+    "POLLING_500MS": 3,
+    "POLLING_1S": 4,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_columns(normalized_header: Tuple[str, ...]) -> Tuple[Optional[int], ...]:
+    """
+    根据标准化后的表头解析列索引（批量转换同一表头格式的文件时直接命中缓存）
+    
+    Returns:
+        (signal_name_idx, col_10ms_idx, col_100ms_idx, col_poll_100_idx, col_poll_500_idx, col_poll_1s_idx)
+    """
+    signal_name_idx = None
+    # 依次为 10msRStr、100msRStr、Polling_100ms、Polling_500ms、Polling_1s 列的索引
+    period_cols = [None] * len(_PERIOD_HEADER_SLOTS)
+    
+    for idx, col_name in enumerate(normalized_header):
+        # 查找"名称"列（取第一个匹配的列）
+        if signal_name_idx is None and ("名称" in col_name or col_name == "NAME"):
+            signal_name_idx = idx
+        
+        # 查找周期相关列
+        match = _PERIOD_HEADER_RE.search(col_name)
+        if match:
+            period_cols[_PERIOD_HEADER_SLOTS[match.group(1)]] = idx
+    
+    # 如果找不到名称列，默认使用第一列
+    return (signal_name_idx if signal_name_idx is not None else 0, *period_cols)
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_x_mark(value: str) -> bool:
+    """判断单元格值标准化后是否为X标记（周期列取值种类很少，同一取值只计算一次）"""
+    if not value:
+        return False
+    return str(value).strip().upper() == "X"
+
+
+# xlsx 工作簿中记录当前活动工作表（openpyxl 的 wb.active）的属性
+_ACTIVE_TAB_RE = re.compile(rb'<(?:\w+:)?workbookView\b[^>]*?\bactiveTab="(\d+)"')
+# Excel 日期序列号的起点（1900 日期系统）
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+
+
+def _xlsx_active_sheet_index(path: str) -> int:
+    """读取xlsx工作簿的活动工作表下标（与openpyxl的wb.active一致），无法读取时返回0"""
+    try:
+        with zipfile.ZipFile(path) as zf:
+            workbook_xml = zf.read('xl/workbook.xml')
+    except (KeyError, zipfile.BadZipFile):
+        return 0
+    match = _ACTIVE_TAB_RE.search(workbook_xml)
+    return int(match.group(1)) if match else 0
+
+
+def _calamine_cell_as_openpyxl(value) -> str:
+    """将calamine单元格值转为与openpyxl读取结果一致的字符串"""
+    if value is None or value == "":
+        return ""
+    # calamine 的数值统一为浮点数，openpyxl 对整数值返回 int
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    # openpyxl 对日期格式的单元格统一返回 datetime
+    if isinstance(value, date) and not isinstance(value, datetime):
+        value = datetime.combine(value, dt_time())
+    return str(value)
+
+
+def _calamine_cell_as_xlrd(value) -> str:
+    """将calamine单元格值转为与xlrd读取结果一致的字符串"""
+    if value is None or value == "":
+        return ""
+    # xlrd 的布尔值为 1/0，数值和日期均为浮点数（日期为序列号）
+    if isinstance(value, bool):
+        return str(int(value))
+    if isinstance(value, datetime):
+        value = (value - _EXCEL_EPOCH) / timedelta(days=1)
+    elif isinstance(value, date):
+        value = float((value - _EXCEL_EPOCH.date()).days)
+    elif isinstance(value, dt_time):
+        value = (value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6) / 86400
+    elif isinstance(value, timedelta):
+        value = value / timedelta(days=1)
+    elif isinstance(value, int):
+        value = float(value)
+    return str(value)
+
 
 class ExcelToCfgConverter:
     """Excel转CFG工具类"""
@@ -51,6 +193,11 @@ class ExcelToCfgConverter:
     # Excel列名映射（期望的列名）
     EXPECTED_COLUMNS = ["名称", "角色", "10msRStr", "100msRStr", "Polling_100ms", "Polling_500ms", "Polling_1s"]
     
+    # 周期查找表：10msRStr/100msRStr/Polling_100ms/Polling_500ms/Polling_1s 五列的X标记
+    # 依次拼成5位掩码（10msRStr为最高位）；10ms位命中为0，其余任意一位命中为1，全未命中为NO_PERIOD
+    NO_PERIOD = 0xFF
+    PERIOD_LUT = bytes(0 if m & 0b10000 else (1 if m & 0b01111 else 0xFF) for m in range(32))
+    
     def __init__(self, excel_path: str):
         """
         初始化转换器
@@ -63,25 +210,13 @@ class ExcelToCfgConverter:
         
         self.excel_path = excel_path
         self.file_ext = os.path.splitext(excel_path)[1].lower()
+        # 文件格式探测结果缓存（None表示尚未探测）
+        self._format_cache = None
         
         if self.file_ext not in ['.xls', '.xlsx']:
             raise ValueError(f"不支持的文件格式: {self.file_ext}，仅支持.xls和.xlsx")
         
-        # 检查库的可用性（在运行时检查，因为模块导入时可能还未安装）
-        global OPENPYXL_AVAILABLE, XLRD_AVAILABLE
-        try:
-            import openpyxl  # type: ignore[import]
-            OPENPYXL_AVAILABLE = True
-        except ImportError:
-            OPENPYXL_AVAILABLE = False
-        
-        # 动态检查 xlrd 是否可用（不再强制校验版本号，兼容已安装的环境）
-        try:
-            import xlrd as _xlrd  # noqa: F401
-            XLRD_AVAILABLE = True
-        except ImportError:
-            XLRD_AVAILABLE = False
-        
+        # 库的可用性以模块导入时的检测结果为准（读取时使用的也是模块级导入的 openpyxl / xlrd）
         # 优先使用openpyxl，因为它可以读取.xlsx和XML格式的.xls文件
         if not OPENPYXL_AVAILABLE:
             if self.file_ext == '.xlsx':
@@ -92,108 +227,147 @@ class ExcelToCfgConverter:
                     raise ImportError("需要安装openpyxl或xlrd库来处理.xls文件: pip install openpyxl 或 pip install xlrd")
     
     def _is_xml_format(self) -> bool:
-        """检测文件是否为XML格式"""
+        """检测文件是否为XML格式（结果缓存在实例上）"""
+        if self._format_cache is not None:
+            return self._format_cache
+        
         try:
             with open(self.excel_path, 'rb') as f:
                 header_bytes = f.read(200)
-                header = header_bytes.decode('utf-8', errors='ignore')
-                # 去掉 UTF-8 BOM 和首尾空白
-                header = header.lstrip('\ufeff').strip()
-                return header.startswith('<?xml') or header.startswith('<Workbook')
         except Exception:
             return False
+        
+        if header_bytes[:4] in (b'PK\x03\x04', b'\xd0\xcf\x11\xe0'):
+            # zip(xlsx) 或 OLE(旧版二进制xls) 容器，不需要再解码判断
+            is_xml = False
+        else:
+            header = header_bytes.decode('utf-8', errors='ignore')
+            # 去掉 UTF-8 BOM 和首尾空白
+            header = header.lstrip('\ufeff').strip()
+            is_xml = header.startswith('<?xml') or header.startswith('<Workbook')
+        
+        self._format_cache = is_xml
+        return is_xml
     
-    def _read_excel_xml(self) -> List[List[str]]:
-        """直接解析XML格式的Excel文件"""
+    def _iter_excel_xml(self) -> Iterator[List[str]]:
+        """直接解析XML格式的Excel文件（流式解析，逐行产出第一个Worksheet的数据）"""
+        # 标签常量绑定为局部变量，减少逐单元格的全局查找
+        tag_row = _TAG_ROW
+        tag_cell = _TAG_CELL
+        tag_data = _TAG_DATA
+        attr_index = _ATTR_INDEX
         try:
-            tree = ET.parse(self.excel_path)
-            root = tree.getroot()
+            worksheet_found = False
+            table_found = False
             
-            # Excel XML命名空间
-            ns = {
-                'ss': 'urn:schemas-microsoft-com:office:spreadsheet',
-                'html': 'http://www.w3.org/TR/REC-html40'
-            }
+            # 通过内存映射读取文件，由操作系统页缓存负责按需加载，避免把整个文件读入Python缓冲区
+            with open(self.excel_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                # 同时监听start事件，在产出第一行之前就能确认Worksheet/Table结构
+                for event, elem in etree.iterparse(mm, events=('start', 'end'), **_ITERPARSE_OPTIONS):
+                    tag = elem.tag
+                    if event == 'start':
+                        if tag == _TAG_TABLE and worksheet_found:
+                            table_found = True
+                        elif tag == _TAG_WORKSHEET:
+                            worksheet_found = True
+                        continue
+                    if tag == tag_row:
+                        if not table_found:
+                            raise ValueError("未找到Worksheet元素" if not worksheet_found else "未找到Table元素")
+                        # 处理带有Index属性的单元格
+                        row_data = []
+                        current_col = 0
+                        
+                        for cell in elem.iterfind(tag_cell):
+                            # 检查是否有Index属性（从1开始）
+                            index_attr = cell.get(attr_index)
+                            if index_attr:
+                                target_col = int(index_attr) - 1  # 转换为0基索引
+                                # 填充中间的空列
+                                while len(row_data) < target_col:
+                                    row_data.append("")
+                                current_col = target_col
+                            
+                            # 获取单元格值
+                            data_elem = cell.find(tag_data)
+                            if data_elem is not None:
+                                cell_value = data_elem.text if data_elem.text else ""
+                            else:
+                                cell_value = ""
+                            
+                            # 如果当前列已经有数据，扩展列表
+                            if current_col < len(row_data):
+                                row_data[current_col] = cell_value
+                            else:
+                                row_data.append(cell_value)
+                            
+                            current_col += 1
+                        
+                        yield row_data
+                        
+                        # 释放已处理的行，避免整棵树常驻内存
+                        elem.clear()
+                        if LXML_AVAILABLE:
+                            while elem.getprevious() is not None:
+                                del elem.getparent()[0]
+                    elif tag == _TAG_WORKSHEET:
+                        # 只读取第一个Worksheet
+                        break
             
-            # 查找第一个Worksheet
-            worksheet = root.find('.//ss:Worksheet', ns)
-            if worksheet is None:
+            if not worksheet_found:
                 raise ValueError("未找到Worksheet元素")
-            
-            # 查找Table
-            table = worksheet.find('ss:Table', ns)
-            if table is None:
+            if not table_found:
                 raise ValueError("未找到Table元素")
-            
-            data = []
-            for row in table.findall('ss:Row', ns):
-                # 处理带有Index属性的单元格
-                row_data = []
-                current_col = 0
-                
-                for cell in row.findall('ss:Cell', ns):
-                    # 检查是否有Index属性（从1开始）
-                    index_attr = cell.get('{urn:schemas-microsoft-com:office:spreadsheet}Index')
-                    if index_attr:
-                        target_col = int(index_attr) - 1  # 转换为0基索引
-                        # 填充中间的空列
-                        while len(row_data) < target_col:
-                            row_data.append("")
-                        current_col = target_col
-                    
-                    # 获取单元格值
-                    data_elem = cell.find('ss:Data', ns)
-                    if data_elem is not None:
-                        cell_value = data_elem.text if data_elem.text else ""
-                    else:
-                        cell_value = ""
-                    
-                    # 如果当前列已经有数据，扩展列表
-                    if current_col < len(row_data):
-                        row_data[current_col] = cell_value
-                    else:
-                        row_data.append(cell_value)
-                    
-                    current_col += 1
-                
-                data.append(row_data)
-            
-            return data
-        except ET.ParseError as e:
+        except etree.ParseError as e:
             raise ValueError(f"XML解析失败: {e}")
     
-    def _read_excel_xlsx(self) -> List[List[str]]:
+    def _iter_workbook_rows(self, wb) -> Iterator[List[str]]:
+        """逐行产出openpyxl工作簿第一个工作表的数据，读取结束后关闭工作簿"""
+        try:
+            # 获取第一个工作表
+            ws = wb.active
+            for row in ws.iter_rows(values_only=True):
+                # 将None转换为空字符串，并转换为字符串列表
+                yield [str(cell) if cell is not None else "" for cell in row]
+        finally:
+            # read_only 模式下必须显式关闭，释放底层 zip 句柄
+            wb.close()
+    
+    def _iter_excel_xml_with_fallback(self) -> Iterator[List[str]]:
+        """流式解析XML格式的Excel文件，解析失败（包括中途失败）时改用openpyxl完整读取"""
+        yielded = 0
+        try:
+            for row_data in self._iter_excel_xml():
+                yield row_data
+                yielded += 1
+        except Exception as e:
+            logger.warning(f"XML解析失败，尝试使用openpyxl: {e}")
+            # 如果XML解析失败，直接把文件内容交给openpyxl读取（内存中处理，无需临时文件）
+            try:
+                with open(self.excel_path, 'rb') as src:
+                    buf = io.BytesIO(src.read())
+                wb = openpyxl.load_workbook(buf, data_only=True, read_only=True)
+            except Exception:
+                raise ValueError(f"无法读取Excel文件: {e}")
+            # 跳过流式解析已经产出的行，从失败处继续
+            yield from itertools.islice(self._iter_workbook_rows(wb), yielded, None)
+    
+    def _iter_excel_xlsx(self) -> Iterator[List[str]]:
         """读取.xlsx格式的Excel文件"""
         # 如果是.xls文件但实际是XML格式，先尝试直接解析XML
         if self.file_ext == '.xls' and self._is_xml_format():
+            rows = self._iter_excel_xml_with_fallback()
             try:
-                return self._read_excel_xml()
-            except Exception as e:
-                logger.warning(f"XML解析失败，尝试使用openpyxl: {e}")
-                # 如果XML解析失败，尝试将文件复制为.xlsx格式让openpyxl读取
-                try:
-                    with tempfile.NamedTemporaryFile(mode='w+b', suffix='.xlsx', delete=False) as tmp:
-                        with open(self.excel_path, 'rb') as src:
-                            tmp.write(src.read())
-                        tmp_path = tmp.name
-                    
-                    try:
-                        wb = openpyxl.load_workbook(tmp_path, data_only=True)
-                        ws = wb.active
-                        data = []
-                        for row in ws.iter_rows(values_only=True):
-                            row_data = [str(cell) if cell is not None else "" for cell in row]
-                            data.append(row_data)
-                        return data
-                    finally:
-                        if os.path.exists(tmp_path):
-                            os.unlink(tmp_path)
-                except Exception:
-                    raise ValueError(f"无法读取Excel文件: {e}")
+                # 预读第一行，文件无法读取时仍可在产出数据前抛出异常，交由调用方回退到xlrd
+                first_row = next(rows)
+            except StopIteration:
+                return iter(())
+            return itertools.chain((first_row,), rows)
         
         # 正常读取.xlsx文件
         try:
-            wb = openpyxl.load_workbook(self.excel_path, data_only=True)
+            # read_only 模式按行流式读取，不构建完整的单元格对象图
+            wb = openpyxl.load_workbook(self.excel_path, data_only=True, read_only=True)
         except Exception as e:
             if self.file_ext == '.xls':
                 # 对于旧版二进制 .xls 文件，openpyxl 无法处理，提示用户使用 xlrd 或转为 .xlsx
@@ -204,45 +378,54 @@ class ExcelToCfgConverter:
                 )
             raise
         
-        # 获取第一个工作表
-        ws = wb.active
-        
-        data = []
-        for row in ws.iter_rows(values_only=True):
-            # 将None转换为空字符串，并转换为字符串列表
-            row_data = [str(cell) if cell is not None else "" for cell in row]
-            data.append(row_data)
-        
-        return data
+        return self._iter_workbook_rows(wb)
     
-    def _read_excel_xls(self) -> List[List[str]]:
+    def _iter_excel_xls(self) -> Iterator[List[str]]:
         """读取.xls格式的Excel文件"""
         wb = xlrd.open_workbook(self.excel_path)
         # 获取第一个工作表
         ws = wb.sheet_by_index(0)
         
-        data = []
-        for row_idx in range(ws.nrows):
-            row_data = []
-            for col_idx in range(ws.ncols):
-                cell_value = ws.cell_value(row_idx, col_idx)
-                row_data.append(str(cell_value) if cell_value else "")
-            data.append(row_data)
-        
-        return data
+        # 整行取值；数值0也是有效内容，只有空单元格才转为空字符串
+        return (
+            ["" if cell_value is None or cell_value == "" else str(cell_value) for cell_value in ws.row_values(row_idx)]
+            for row_idx in range(ws.nrows)
+        )
+    
+    def _iter_excel_calamine(self) -> Iterator[List[str]]:
+        """使用python-calamine读取Excel文件（自动识别xls/xlsx格式）"""
+        # 工作表选择和单元格取值与未安装calamine时的读取后端保持一致：
+        # .xlsx 对应 openpyxl（活动工作表），.xls 对应 xlrd（第一个工作表）
+        if self.file_ext == '.xlsx':
+            sheet_index = _xlsx_active_sheet_index(self.excel_path)
+            to_text = _calamine_cell_as_openpyxl
+        else:
+            sheet_index = 0
+            to_text = _calamine_cell_as_xlrd
+        ws = CalamineWorkbook.from_path(self.excel_path).get_sheet_by_index(sheet_index)
+        # 保留表头前的空白区域，保证列索引与openpyxl/xlrd读取结果一致
+        sheet_rows = ws.to_python(skip_empty_area=False)
+        return ([to_text(cell_value) for cell_value in row] for row in sheet_rows)
     
-    def _read_excel(self) -> List[List[str]]:
-        """读取Excel文件内容"""
+    def _iter_excel_rows(self) -> Iterator[List[str]]:
+        """逐行读取Excel文件内容"""
+        # 安装了python-calamine时优先使用（XML格式的.xls由内置的流式解析处理）
+        if CALAMINE_AVAILABLE and not (self.file_ext == '.xls' and self._is_xml_format()):
+            try:
+                return self._iter_excel_calamine()
+            except Exception as e:
+                logger.warning(f"calamine读取Excel文件失败，改用openpyxl/xlrd: {e}")
+        
         # 优先尝试使用openpyxl（支持.xlsx和XML格式的.xls）
         if OPENPYXL_AVAILABLE:
             try:
-                return self._read_excel_xlsx()
+                return self._iter_excel_xlsx()
             except Exception as e:
                 # 如果openpyxl读取失败且是.xls文件，尝试使用xlrd
                 if self.file_ext == '.xls':
                     if XLRD_AVAILABLE:
                         logger.warning(f"openpyxl读取 .xls 文件失败，尝试使用 xlrd: {e}")
-                        return self._read_excel_xls()
+                        return self._iter_excel_xls()
                     # 没有可用的 xlrd，给出清晰的提示
                     raise ValueError(
                         "无法读取旧版 .xls 格式的 Excel 文件：openpyxl 不支持该格式，"
@@ -254,19 +437,13 @@ class ExcelToCfgConverter:
         else:
             # 如果没有openpyxl，只能使用xlrd读取.xls
             if self.file_ext == '.xls':
-                return self._read_excel_xls()
+                return self._iter_excel_xls()
             else:
                 raise ImportError("需要安装openpyxl库来处理.xlsx文件: pip install openpyxl")
     
     def _normalize_cell_value(self, value: str) -> str:
         """标准化单元格值，用于匹配X标记"""
-        if not value:
-            return ""
-        # 去除空格并转换为大写，用于匹配X
-        # 处理可能的None值
-        if value is None:
-            return ""
-        return str(value).strip().upper()
+        return _normalize_header_cell(value)
     
     def _find_column_indices(
         self,
@@ -284,47 +461,14 @@ class ExcelToCfgConverter:
         Returns:
             (col_10ms_idx, col_100ms_idx, col_poll_100_idx, col_poll_500_idx, col_poll_1s_idx)
         """
-        col_10ms_idx = None
-        col_100ms_idx = None
-        col_poll_100_idx = None
-        col_poll_500_idx = None
-        col_poll_1s_idx = None
-        
-        # 标准化表头行
-        normalized_header = [self._normalize_cell_value(cell) for cell in header_row]
-        
-        # 查找列索引
-        for idx, col_name in enumerate(normalized_header):
-            if "10MSRSTR" in col_name or col_name == "10MSRSTR":
-                col_10ms_idx = idx
-            elif "100MSRSTR" in col_name or col_name == "100MSRSTR":
-                col_100ms_idx = idx
-            elif "POLLING_100MS" in col_name or col_name == "POLLING_100MS":
-                col_poll_100_idx = idx
-            elif "POLLING_500MS" in col_name or col_name == "POLLING_500MS":
-                col_poll_500_idx = idx
-            elif "POLLING_1S" in col_name or col_name == "POLLING_1S":
-                col_poll_1s_idx = idx
-        
-        return (
-            col_10ms_idx,
-            col_100ms_idx,
-            col_poll_100_idx,
-            col_poll_500_idx,
-            col_poll_1s_idx,
-        )
+        # 标准化表头行（同一表头的解析结果会被缓存）
+        normalized_header = tuple(_normalize_header_cell(cell) for cell in header_row)
+        return _resolve_columns(normalized_header)[1:]
     
     def _find_signal_name_column(self, header_row: List[str]) -> Optional[int]:
         """查找信号名称列的索引（通常是第一列"名称"）"""
-        normalized_header = [self._normalize_cell_value(cell) for cell in header_row]
-        
-        # 查找"名称"列
-        for idx, col_name in enumerate(normalized_header):
-            if "名称" in col_name or col_name == "名称" or col_name == "NAME":
-                return idx
-        
-        # 如果找不到，默认使用第一列
-        return 0
+        normalized_header = tuple(_normalize_header_cell(cell) for cell in header_row)
+        return _resolve_columns(normalized_header)[0]
     
     def parse_excel(self) -> Tuple[List[Tuple[str, int]], int]:
         """
@@ -335,12 +479,13 @@ class ExcelToCfgConverter:
             周期值：0表示10ms，1表示100ms
             总信号数：Excel中所有有效的信号名称数量（包括没有周期标记的）
         """
-        data = self._read_excel()
+        rows = self._iter_excel_rows()
+        header_row = next(rows, None)
+        first_data_row = next(rows, None)
         
-        if len(data) < 2:
+        if header_row is None or first_data_row is None:
             raise ValueError("Excel文件至少需要包含表头和数据行")
         
-        header_row = data[0]
         signal_name_col = self._find_signal_name_column(header_row)
         (
             col_10ms_idx,
@@ -355,18 +500,38 @@ class ExcelToCfgConverter:
             raise ValueError("未找到10msRStr或100msRStr列，请检查Excel文件格式")
         
         signals = []
+        add_signal = signals.append
         total_signals_count = 0  # Excel中的总信号数
         
+        # 循环外预先绑定局部变量；只保留实际存在的周期列及其在掩码中的位
+        x_set = _X_SET
+        is_x_mark = _is_x_mark
+        period_lut = self.PERIOD_LUT
+        no_period = self.NO_PERIOD
+        period_cols = tuple(
+            (col_idx, 1 << shift)
+            for col_idx, shift in (
+                (col_10ms_idx, 4),
+                (col_100ms_idx, 3),
+                (col_poll_100_idx, 2),
+                (col_poll_500_idx, 1),
+                (col_poll_1s_idx, 0),
+            )
+            if col_idx is not None
+        )
+        
         # 从第二行开始处理数据
-        for row_idx, row in enumerate(data[1:], start=2):
-            if not row:
+        for row_idx, row in enumerate(itertools.chain((first_data_row,), rows), start=2):
+            # 每行只计算一次行长度
+            rl = len(row)
+            if not rl:
                 continue
             
             # 获取信号名称
-            if signal_name_col is None or signal_name_col >= len(row):
+            if signal_name_col is None or signal_name_col >= rl:
                 continue
             
-            signal_name_raw = row[signal_name_col] if signal_name_col < len(row) else ""
+            signal_name_raw = row[signal_name_col]
             # 保持原始信号名称的大小写，只去除首尾空格
             signal_name = str(signal_name_raw).strip() if signal_name_raw else ""
             
@@ -380,40 +545,18 @@ class ExcelToCfgConverter:
             # 周期判定规则：
             # - 如果 10msRStr 列有 X，则为 0（10ms）
             # - 否则，只要 100msRStr / Polling_100ms / Polling_500ms / Polling_1s 任意一列有 X，则为 1（100ms）
-            period = None
-            
-            # 10msRStr
-            if col_10ms_idx is not None and col_10ms_idx < len(row):
-                cell_value = self._normalize_cell_value(row[col_10ms_idx])
-                if cell_value == "X":
-                    period = 0  # 10ms
-            
-            # 100msRStr & Polling_* 统统当作 100ms
-            if period is None:
-                # 100msRStr
-                if col_100ms_idx is not None and col_100ms_idx < len(row):
-                    cell_value = self._normalize_cell_value(row[col_100ms_idx])
-                    if cell_value == "X":
-                        period = 1
-                # Polling_100ms
-                if period is None and col_poll_100_idx is not None and col_poll_100_idx < len(row):
-                    cell_value = self._normalize_cell_value(row[col_poll_100_idx])
-                    if cell_value == "X":
-                        period = 1
-                # Polling_500ms
-                if period is None and col_poll_500_idx is not None and col_poll_500_idx < len(row):
-                    cell_value = self._normalize_cell_value(row[col_poll_500_idx])
-                    if cell_value == "X":
-                        period = 1
-                # Polling_1s
-                if period is None and col_poll_1s_idx is not None and col_poll_1s_idx < len(row):
-                    cell_value = self._normalize_cell_value(row[col_poll_1s_idx])
-                    if cell_value == "X":
-                        period = 1
+            mask = 0
+            for col_idx, bit in period_cols:
+                if col_idx < rl:
+                    cell_value = row[col_idx]
+                    # 周期列绝大多数是空单元格，先排除空值再做X判定
+                    if cell_value and (cell_value in x_set or is_x_mark(cell_value)):
+                        mask |= bit
+            period = period_lut[mask]
             
             # 如果找到了周期标记，添加到结果中
-            if period is not None:
-                signals.append((signal_name, period))
+            if period != no_period:
+                add_signal((signal_name, period))
             # else:
             #     # 如果两个周期列都没有X，记录警告但继续处理
             #     logger.warning(f"第{row_idx}行的信号'{signal_name}'未找到周期标记（10msRStr或100msRStr列中的X）")
@@ -432,20 +575,24 @@ class ExcelToCfgConverter:
         """
         # 记录转换开始时间
         start_time = time.time()
-        start_time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(start_time))
+        start_time_str = datetime.fromtimestamp(start_time).isoformat(sep=' ', timespec='seconds')
         
         # 解析Excel文件
         signals, total_excel_signals = self.parse_excel()
         signals_with_period = len(signals)
         signals_without_period = max(total_excel_signals - signals_with_period, 0)
         
-        # 转换前：打印Excel中的信号数统计
-        print(f"[转换前] Excel文件中找到 {total_excel_signals} 个有效信号")
-        print(f"[转换前] 其中 {signals_with_period} 个信号存在周期标记（有 X，将被转换）")
-        print(f"[转换前] 其中 {signals_without_period} 个信号不存在周期标记（无 X，不转换）")
-        print(f"[转换开始时间] {start_time_str}")
+        # 转换过程的统计信息汇总为一份报告，最后一次性输出
+        report = [
+            # 转换前：Excel中的信号数统计
+            f"[转换前] Excel文件中找到 {total_excel_signals} 个有效信号",
+            f"[转换前] 其中 {signals_with_period} 个信号存在周期标记（有 X，将被转换）",
+            f"[转换前] 其中 {signals_without_period} 个信号不存在周期标记（无 X，不转换）",
+            f"[转换开始时间] {start_time_str}",
+        ]
         
         if not signals:
+            print("\n".join(report))
             raise ValueError("未找到任何有效的信号数据（没有找到带周期标记的信号）")
         
         # 生成输出文件路径
@@ -455,26 +602,22 @@ class ExcelToCfgConverter:
             output_path = os.path.join(output_dir, f"{base_name}.cfg")
         
         # 写入CFG文件
-        written_signals_count = 0
+        # 先拼好全部信号行，头部和信号行各一次性写入
+        signal_lines = [f"{signal_name};{period}\n" for signal_name, period in signals]
         with open(output_path, 'w', encoding='utf-8') as f:
-            # 写入固定头部
-            for line in self.CFG_HEADER:
-                f.write(line + '\n')
-            
-            # 写入信号数据
-            for signal_name, period in signals:
-                f.write(f"{signal_name};{period}\n")
-                written_signals_count += 1
+            f.write('\n'.join(self.CFG_HEADER) + '\n')
+            f.writelines(signal_lines)
+        written_signals_count = len(signal_lines)
         
         # 记录转换结束时间
         end_time = time.time()
-        end_time_str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(end_time))
+        end_time_str = datetime.fromtimestamp(end_time).isoformat(sep=' ', timespec='seconds')
         elapsed_time = end_time - start_time
         
-        # 转换后：验证并打印写入的信号数
-        print(f"[转换后] CFG文件中成功写入 {written_signals_count} 个信号")
-        print(f"[转换结束时间] {end_time_str}")
-        print(f"[转换耗时] {elapsed_time:.3f} 秒")
+        # 转换后：写入的信号数
+        report.append(f"[转换后] CFG文件中成功写入 {written_signals_count} 个信号")
+        report.append(f"[转换结束时间] {end_time_str}")
+        report.append(f"[转换耗时] {elapsed_time:.3f} 秒")
         
         # 验证转换过程中没有丢失信号
         if written_signals_count != len(signals):
@@ -482,11 +625,13 @@ class ExcelToCfgConverter:
                 f"信号数量不匹配！解析得到 {len(signals)} 个信号，但只写入了 {written_signals_count} 个信号。"
                 f"转换过程中可能丢失了 {len(signals) - written_signals_count} 个信号！"
             )
+            print("\n".join(report))
             logger.error(error_msg)
             raise ValueError(error_msg)
         
         # 验证成功
-        print(f"[验证成功] 转换过程中没有丢失信号，所有 {written_signals_count} 个信号都已成功写入CFG文件")
+        report.append(f"[验证成功] 转换过程中没有丢失信号，所有 {written_signals_count} 个信号都已成功写入CFG文件")
+        print("\n".join(report))
         
         logger.info(f"成功转换Excel文件，生成CFG文件: {output_path}，共{written_signals_count}个信号，耗时{elapsed_time:.3f}秒")
         
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import binascii
 import dataclasses
+import functools
 import logging
+import mmap
 import os
+import re
 import struct
 import sys
 from bisect import bisect_right
+from operator import itemgetter
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 # 确保 Django 环境已初始化（用于直接运行脚本时）
@@ -109,37 +114,59 @@ class IntelHexFile:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"HEX 文件不存在: {file_path}")
         self.file_path = file_path
-        self._records: List[HexRecord] = []
+        # DATA 记录按起始地址排序后以并列数组（SoA）保存，下标一一对应
         self._record_starts: List[int] = []
+        self._record_ends: List[int] = []
+        self._record_datas: List[bytes] = []
+        self._record_line_nos: List[int] = []
+        self._record_offset_addrs: List[int] = []
+        self._record_checksums: List[int] = []
+        # 上一次 fetch_bytes 结束时所在的记录下标，按地址顺序读取时可直接命中
+        self._lookup_hint = 0
+        # 同一地址范围（如多个 CURVE/MAP 共用的轴）会被重复读取，记录数据不可变，可直接缓存结果
+        self._cached_fetch = functools.lru_cache(maxsize=4096)(self._fetch_bytes_uncached)
         self._load()
 
     def _load(self) -> None:
         current_upper = 0
-        with open(self.file_path, "r", encoding="utf-8") as hex_file:
-            for idx, raw_line in enumerate(hex_file, start=1):
+        entries: List[Tuple[int, int, int, bytes, int]] = []
+        if os.path.getsize(self.file_path) == 0:
+            # 空文件无法做内存映射，也没有任何记录
+            return
+        # 以只读内存映射方式按字节行读取，省去逐行文本解码
+        with open(self.file_path, "rb") as hex_file, mmap.mmap(
+            hex_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped:
+            for idx, raw_line in enumerate(iter(mapped.readline, b""), start=1):
                 line = raw_line.strip()
                 if not line:
                     continue
-                if not line.startswith(":"):
-                    raise HexParseError(f"第 {idx} 行不是有效的 Intel HEX 记录：{line[:20]}...")
+                if not line.startswith(b":"):
+                    raise HexParseError(
+                        f"第 {idx} 行不是有效的 Intel HEX 记录：{line[:20].decode(errors='replace')}..."
+                    )
 
                 payload = line[1:]
                 if len(payload) < 10 or len(payload) % 2 != 0:
-                    raise HexParseError(f"第 {idx} 行长度不符合 HEX 规则：{line}")
+                    raise HexParseError(f"第 {idx} 行长度不符合 HEX 规则：{line.decode(errors='replace')}")
 
-                byte_count = int(payload[0:2], 16)
-                offset_addr = int(payload[2:6], 16)
-                record_type = int(payload[6:8], 16)
-                data_hex = payload[8:-2]
-                checksum = int(payload[-2:], 16)
-                data_bytes = bytes.fromhex(data_hex) if data_hex else b""
+                # 整行一次性解码，再按字节位置取各字段
+                try:
+                    raw = binascii.unhexlify(payload)
+                except binascii.Error as e:
+                    raise HexParseError(f"第 {idx} 行包含非十六进制字符：{line.decode(errors='replace')}") from e
+                byte_count = raw[0]
+                offset_addr = (raw[1] << 8) | raw[2]
+                record_type = raw[3]
+                data_bytes = raw[4:-1]
+                checksum = raw[-1]
 
                 if len(data_bytes) != byte_count:
-                    raise HexParseError(f"第 {idx} 行的数据长度与声明不一致：{line}")
+                    raise HexParseError(f"第 {idx} 行的数据长度与声明不一致：{line.decode(errors='replace')}")
 
                 if record_type == 0x04:  # Extended Linear Address
                     if byte_count != 2:
-                        raise HexParseError(f"第 {idx} 行的扩展地址段长度错误：{line}")
+                        raise HexParseError(f"第 {idx} 行的扩展地址段长度错误：{line.decode(errors='replace')}")
                     current_upper = int.from_bytes(data_bytes, "big")
                     continue
 
@@ -148,26 +175,46 @@ class IntelHexFile:
                     continue
 
                 base_address = (current_upper << 16) + offset_addr
-                self._records.append(
-                    HexRecord(
-                        line_no=idx,
-                        byte_count=byte_count,
-                        offset_addr=offset_addr,
-                        record_type=record_type,
-                        data=data_bytes,
-                        checksum=checksum,
-                        base_address=base_address,
-                    )
-                )
-
-        self._records.sort(key=lambda record: record.base_address)
-        self._record_starts = [record.base_address for record in self._records]
+                entries.append((base_address, idx, offset_addr, data_bytes, checksum))
+
+        self._set_records(entries)
+
+    def _set_records(self, entries: List[Tuple[int, int, int, bytes, int]]) -> None:
+        """按起始地址排序 (base_address, line_no, offset_addr, data, checksum) 并拆分为并列数组。"""
+        if not entries:
+            return
+        entries.sort(key=itemgetter(0))
+        starts, line_nos, offset_addrs, datas, checksums = zip(*entries)
+        self._record_starts = list(starts)
+        self._record_ends = [start + len(data) for start, data in zip(starts, datas)]
+        self._record_datas = list(datas)
+        self._record_line_nos = list(line_nos)
+        self._record_offset_addrs = list(offset_addrs)
+        self._record_checksums = list(checksums)
 
     def iter_records(self) -> Iterable[HexRecord]:
-        return iter(self._records)
+        for base_address, data, line_no, offset_addr, checksum in zip(
+            self._record_starts,
+            self._record_datas,
+            self._record_line_nos,
+            self._record_offset_addrs,
+            self._record_checksums,
+        ):
+            yield HexRecord(
+                line_no=line_no,
+                byte_count=len(data),
+                offset_addr=offset_addr,
+                record_type=0x00,
+                data=data,
+                checksum=checksum,
+                base_address=base_address,
+            )
 
     def fetch_bytes(self, address: int, size: int) -> Tuple[bytes, int]:
         """Fetch a continuous range of bytes starting at the absolute address."""
+        return self._cached_fetch(address, size)
+
+    def _fetch_bytes_uncached(self, address: int, size: int) -> Tuple[bytes, int]:
         if size <= 0:
             raise ValueError("size 必须大于 0")
 
@@ -176,29 +223,42 @@ class IntelHexFile:
         chunks: List[bytes] = []
         first_line = -1
 
-        idx = bisect_right(self._record_starts, cursor) - 1
-        idx = max(idx, 0)
+        starts = self._record_starts
+        ends = self._record_ends
+        record_count = len(starts)
 
-        while remaining > 0 and idx < len(self._records):
-            record = self._records[idx]
-            if cursor < record.base_address:
+        hint = self._lookup_hint
+        if record_count and starts[hint] <= cursor and (hint + 1 == record_count or cursor < starts[hint + 1]):
+            # 命中上次所在的记录，结果与二分查找一致，省去一次查找
+            idx = hint
+        else:
+            idx = bisect_right(starts, cursor) - 1
+            idx = max(idx, 0)
+
+        while remaining > 0 and idx < record_count:
+            base_address = starts[idx]
+            end_address = ends[idx]
+            if cursor < base_address:
                 break
-            if cursor >= record.end_address:
+            if cursor >= end_address:
                 idx += 1
                 continue
 
-            offset = cursor - record.base_address
-            take = min(remaining, record.byte_count - offset)
+            offset = cursor - base_address
+            take = min(remaining, end_address - cursor)
             if first_line == -1:
-                first_line = record.line_no
-            chunks.append(record.data[offset : offset + take])
+                first_line = self._record_line_nos[idx]
+            chunks.append(self._record_datas[idx][offset : offset + take])
 
             cursor += take
             remaining -= take
 
-            if cursor >= record.end_address:
+            if cursor >= end_address:
                 idx += 1
 
+        if record_count:
+            self._lookup_hint = min(idx, record_count - 1)
+
         if remaining > 0:
             raise KeyError(f"地址 0x{address:X} (长度 {size}) 不在 HEX 数据的连续范围内")
 
@@ -238,7 +298,7 @@ class RecordLayoutDecoder:
             raise KeyError("record_layout 不能为空")
         self.record_layout = record_layout
         self.struct_format = self._resolve_struct(record_layout)
-        self._struct = struct.Struct(self.struct_format)
+        self._struct = _struct_for(self.struct_format)
 
     @staticmethod
     def _resolve_struct(record_layout: str) -> str:
@@ -247,17 +307,10 @@ class RecordLayoutDecoder:
         按关键字长度降序匹配，确保更长的关键字（如 FLOAT32_IEEE）优先于短的关键字（如 FLOAT32）。
         这样可以正确处理 Scalar_FLOAT32_IEEE、Array_FLOAT32_IEEE 等标准类型名称。
         """
-        upper_layout = record_layout.upper()
-        # 按关键字长度降序排序，优先匹配更长的关键字
-        sorted_items = sorted(
-            RecordLayoutDecoder._STRUCT_MAP.items(),
-            key=lambda x: len(x[0]),
-            reverse=True
-        )
-        for keyword, fmt in sorted_items:
-            if keyword in upper_layout:
-                return fmt
-        raise KeyError(f"暂不支持的 Record Layout: {record_layout}")
+        fmt = _resolve_struct_cached(record_layout.upper())
+        if fmt is None:
+            raise KeyError(f"暂不支持的 Record Layout: {record_layout}")
+        return fmt
 
     @property
     def element_size(self) -> int:
@@ -272,10 +325,42 @@ class RecordLayoutDecoder:
         expected = self.element_size * count
         if len(data) != expected:
             raise ValueError(f"需要 {expected} 字节，但收到 {len(data)} 字节")
-        return [
-            self.decode(data[i : i + self.element_size])
-            for i in range(0, expected, self.element_size)
-        ]
+        # 用带重复次数的格式（如 "<16f"）一次性解包整段数据，避免逐元素切片和 unpack
+        return list(_struct_for(f"{self.struct_format[0]}{count}{self.struct_format[1:]}").unpack(data))
+
+
+# 按关键字长度降序排序（只在导入时排序一次），优先匹配更长的关键字
+_SORTED_LAYOUT_KEYWORDS: List[Tuple[str, str]] = sorted(
+    RecordLayoutDecoder._STRUCT_MAP.items(),
+    key=lambda x: len(x[0]),
+    reverse=True
+)
+
+
+_LAYOUT_KEYWORD_RANK: Dict[str, int] = {
+    keyword: rank for rank, (keyword, _) in enumerate(_SORTED_LAYOUT_KEYWORDS)
+}
+# 零宽前瞻 + 长关键字在前的分支：一次扫描找出每个位置上能匹配的最长关键字
+_LAYOUT_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(re.escape(keyword) for keyword, _ in _SORTED_LAYOUT_KEYWORDS) + "))"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_struct_cached(upper_layout: str) -> Optional[str]:
+    """按大写的 Record Layout 名称解析 struct 格式，结果缓存；不支持时返回 None。"""
+    matches = _LAYOUT_KEYWORD_RE.findall(upper_layout)
+    if not matches:
+        return None
+    # 多个关键字同时出现时，仍按“关键字越长越优先”的规则选取
+    keyword = min(matches, key=_LAYOUT_KEYWORD_RANK.__getitem__)
+    return RecordLayoutDecoder._STRUCT_MAP[keyword]
+
+
+@functools.lru_cache(maxsize=256)
+def _struct_for(fmt: str) -> struct.Struct:
+    """按格式字符串缓存编译好的 struct.Struct 对象。"""
+    return struct.Struct(fmt)
 
 
 def _normalize_characteristic_names(names: Optional[Sequence[str]]) -> Optional[List[str]]:
@@ -384,9 +469,56 @@ def _fetch_characteristics_from_db(
     ]
 
 
+class _AxisPtsIndex:
+    """某个 A2L 文件下全部 AxisPts 的内存索引。
+
+    批量解析时代替逐个 ``.first()`` 查询：首次使用时一次性按主键顺序加载，
+    ``get`` 对应 ``name__iexact``，``find_containing`` 对应 ``name__icontains``。
+    """
+
+    def __init__(self, a2l_file_id: int) -> None:
+        self.a2l_file_id = a2l_file_id
+        self._loaded = False
+        self._axis_pts: List[Tuple[str, AxisPts]] = []
+        self._by_name: Dict[str, AxisPts] = {}
+
+    def _load(self) -> None:
+        for axis_pts in AxisPts.objects.filter(a2l_file_id=self.a2l_file_id).order_by("pk"):
+            lower_name = axis_pts.name.lower()
+            self._axis_pts.append((lower_name, axis_pts))
+            # 同名时保留主键最小的一条，与 .first() 结果一致
+            self._by_name.setdefault(lower_name, axis_pts)
+        self._loaded = True
+
+    def get(self, name: Optional[str]) -> Optional[AxisPts]:
+        if name is None:
+            return None
+        if not self._loaded:
+            self._load()
+        return self._by_name.get(name.lower())
+
+    def find_containing(self, fragment: str) -> Optional[AxisPts]:
+        if not self._loaded:
+            self._load()
+        fragment = fragment.lower()
+        return next((axis_pts for lower_name, axis_pts in self._axis_pts if fragment in lower_name), None)
+
+
+def _get_axis_pts_by_name(
+    a2l_file_id: int,
+    name: Optional[str],
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
+) -> Optional[AxisPts]:
+    """在指定 A2L 文件中按名称（忽略大小写）查找 AxisPts，有索引时直接查内存。"""
+    if axis_pts_index is not None:
+        return axis_pts_index.get(name)
+    return AxisPts.objects.filter(a2l_file_id=a2l_file_id, name__iexact=name).first()
+
+
 def _guess_axis_pts_by_name(
     a2l_file_id: int,
     characteristic_name: str,
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
 ) -> Optional[AxisPts]:
     """Fallback: 根据名称猜测 CURVE 对应的 AxisPts 定义。"""
     name_parts = characteristic_name.split("_")
@@ -401,22 +533,19 @@ def _guess_axis_pts_by_name(
         "".join(name_parts[:-1]) + "Rng" if len(name_parts) > 1 else None,
     }
     for candidate in filter(None, candidates):
-        axis_pts = AxisPts.objects.filter(
-            a2l_file_id=a2l_file_id, name__iexact=candidate
-        ).first()
+        axis_pts = _get_axis_pts_by_name(a2l_file_id, candidate, axis_pts_index)
         if axis_pts:
             return axis_pts
     base = "_".join(name_parts[:-1]) if len(name_parts) > 1 else characteristic_name
-    axis_pts = AxisPts.objects.filter(
-        a2l_file_id=a2l_file_id, name__icontains=base
-    ).first()
-    if axis_pts:
-        return axis_pts
-    axis_pts = AxisPts.objects.filter(
-        a2l_file_id=a2l_file_id, name__icontains=base.replace("_", "")
-    ).first()
-    if axis_pts:
-        return axis_pts
+    for fragment in (base, base.replace("_", "")):
+        if axis_pts_index is not None:
+            axis_pts = axis_pts_index.find_containing(fragment)
+        else:
+            axis_pts = AxisPts.objects.filter(
+                a2l_file_id=a2l_file_id, name__icontains=fragment
+            ).first()
+        if axis_pts:
+            return axis_pts
     return None
 
 
@@ -424,6 +553,7 @@ def _fetch_curve_axis_definition(
     a2l_id: int,
     characteristic_name: str,
     characteristic_id: Optional[int] = None,
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
 ) -> Optional[Dict[str, object]]:
     """获取 CURVE 类型的 X 轴 AxisPts 定义。
     
@@ -431,6 +561,7 @@ def _fetch_curve_axis_definition(
         a2l_id: A2L 文件 ID
         characteristic_name: 标定量名称
         characteristic_id: 标定量 ID（可选，如果提供则优先使用，避免同名不同地址的记录冲突）
+        axis_pts_index: 当前 A2L 文件的 AxisPts 内存索引（可选，批量解析时复用以减少查询）
     """
     # 如果提供了 characteristic_id，优先使用 ID 查询（更准确）
     if characteristic_id:
@@ -461,15 +592,16 @@ def _fetch_curve_axis_definition(
         logger.debug("CURVE %s (ID=%s) 通过 characteristic_id 未找到 AxisDescr，尝试通过 name 查找", 
                     characteristic_name, characteristic.id)
         # 查找所有同名的 Characteristic（可能由于 unique_together 包含 ecu_address 和 conversion_method 而有多个）
-        same_name_chars = Characteristic.objects.filter(
-            a2l_file_id=a2l_id,
-            name__iexact=characteristic_name,
-            characteristic_type="CURVE",
+        # 直接取出 ID 列表，一次查询同时完成存在性判断和 ID 收集
+        char_ids = list(
+            Characteristic.objects.filter(
+                a2l_file_id=a2l_id,
+                name__iexact=characteristic_name,
+                characteristic_type="CURVE",
+            ).values_list('id', flat=True)
         )
         
-        if same_name_chars.exists():
-            # 收集所有同名 Characteristic 的 ID
-            char_ids = list(same_name_chars.values_list('id', flat=True))
+        if char_ids:
             logger.debug("CURVE %s 找到 %d 个同名的 Characteristic (IDs: %s)", 
                        characteristic_name, len(char_ids), char_ids)
             
@@ -501,17 +633,14 @@ def _fetch_curve_axis_definition(
             or AxisPtsRef.objects.filter(axis_descr_id=axis_descr.id).first()
         )
         if axis_pts_ref:
-            axis_pts = AxisPts.objects.filter(
-                a2l_file_id=a2l_id,
-                name__iexact=axis_pts_ref.axis_points,
-            ).first()
+            axis_pts = _get_axis_pts_by_name(a2l_id, axis_pts_ref.axis_points, axis_pts_index)
             if not axis_pts:
                 axis_pts = AxisPts.objects.filter(
                     name__iexact=axis_pts_ref.axis_points
                 ).first()
 
     if axis_pts is None:
-        axis_pts = _guess_axis_pts_by_name(a2l_id, characteristic_name)
+        axis_pts = _guess_axis_pts_by_name(a2l_id, characteristic_name, axis_pts_index)
 
     if axis_pts is None:
         return None
@@ -528,6 +657,7 @@ def _fetch_map_axis_definitions(
     a2l_id: int,
     characteristic_name: str,
     characteristic_id: Optional[int] = None,
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
 ) -> Optional[Dict[str, Dict[str, object]]]:
     """获取 MAP 类型的 X 轴和 Y 轴 AxisPts 定义。
     
@@ -537,6 +667,7 @@ def _fetch_map_axis_definitions(
         a2l_id: A2L 文件 ID
         characteristic_name: 标定量名称
         characteristic_id: 标定量 ID（可选，如果提供则优先使用，避免同名不同地址的记录冲突）
+        axis_pts_index: 当前 A2L 文件的 AxisPts 内存索引（可选，批量解析时复用以减少查询）
     
     Returns:
         包含 'x_axis' 和 'y_axis' 键的字典，如果未找到则返回 None
@@ -571,15 +702,16 @@ def _fetch_map_axis_definitions(
         logger.debug("MAP %s (ID=%s) 通过 characteristic_id 未找到 AxisDescr，尝试通过 name 查找", 
                     characteristic_name, characteristic.id)
         # 查找所有同名的 Characteristic（可能由于 unique_together 包含 ecu_address 和 conversion_method 而有多个）
-        same_name_chars = Characteristic.objects.filter(
-            a2l_file_id=a2l_id,
-            name__iexact=characteristic_name,
-            characteristic_type="MAP",
+        # 直接取出 ID 列表，一次查询同时完成存在性判断和 ID 收集
+        char_ids = list(
+            Characteristic.objects.filter(
+                a2l_file_id=a2l_id,
+                name__iexact=characteristic_name,
+                characteristic_type="MAP",
+            ).values_list('id', flat=True)
         )
         
-        if same_name_chars.exists():
-            # 收集所有同名 Characteristic 的 ID
-            char_ids = list(same_name_chars.values_list('id', flat=True))
+        if char_ids:
             logger.debug("MAP %s 找到 %d 个同名的 Characteristic (IDs: %s)", 
                        characteristic_name, len(char_ids), char_ids)
             
@@ -687,10 +819,7 @@ def _fetch_map_axis_definitions(
         #             characteristic_name, axis_pts_name, a2l_id, axis_pts_ref.id)
         
         # 优先在当前 A2L 文件中查找
-        axis_pts = AxisPts.objects.filter(
-            a2l_file_id=a2l_id,
-            name__iexact=axis_pts_name,
-        ).first()
+        axis_pts = _get_axis_pts_by_name(a2l_id, axis_pts_name, axis_pts_index)
         
         if not axis_pts:
             # 如果当前 A2L 文件中没找到，尝试在其他 A2L 文件中查找（向后兼容）
@@ -1156,6 +1285,7 @@ def parse_hex_curve(
     characteristic_name: str,
     characteristic_id: Optional[int] = None,
     hex_file_obj: Optional["IntelHexFile"] = None,
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
 ) -> Optional[Dict[str, object]]:
     """解析 CURVE 类型，返回 X/Y 坐标和值列表。
     
@@ -1165,6 +1295,7 @@ def parse_hex_curve(
         characteristic_name: 标定量名称
         characteristic_id: 标定量 ID（可选，如果提供则优先使用，避免同名不同地址的记录冲突）
         hex_file_obj: HEX 文件对象（可选，用于复用已打开的文件）
+        axis_pts_index: AxisPts 内存索引（可选，批量解析时复用以减少查询）
     """
     # 如果提供了 characteristic_id，优先使用 ID 查询（更准确）
     if characteristic_id:
@@ -1192,7 +1323,7 @@ def parse_hex_curve(
         logger.warning("标定量 %s 不是 CURVE 类型", characteristic_name)
         return None
 
-    axis_definition = _fetch_curve_axis_definition(a2l_id, characteristic_name, characteristic_id)
+    axis_definition = _fetch_curve_axis_definition(a2l_id, characteristic_name, characteristic_id, axis_pts_index)
     if not axis_definition:
         logger.warning("CURVE %s 未找到 X 轴定义", characteristic_name)
         return None
@@ -1305,6 +1436,7 @@ def parse_hex_map(
     characteristic_name: str,
     characteristic_id: Optional[int] = None,
     hex_file_obj: Optional["IntelHexFile"] = None,
+    axis_pts_index: Optional[_AxisPtsIndex] = None,
 ) -> Optional[Dict[str, object]]:
     """解析 MAP 类型，返回 X/Y 轴和二维矩阵数据。
     
@@ -1322,6 +1454,7 @@ def parse_hex_map(
         characteristic_name: 标定量名称
         characteristic_id: 标定量 ID（可选，如果提供则优先使用，避免同名不同地址的记录冲突）
         hex_file_obj: HEX 文件对象（可选，用于复用已打开的文件）
+        axis_pts_index: AxisPts 内存索引（可选，批量解析时复用以减少查询）
     """
     # 如果提供了 characteristic_id，优先使用 ID 查询（更准确）
     if characteristic_id:
@@ -1350,7 +1483,7 @@ def parse_hex_map(
         return None
 
     # 获取 X 轴和 Y 轴定义（MAP 有两个轴，CURVE 只有一个 X 轴）
-    axis_definitions = _fetch_map_axis_definitions(a2l_id, characteristic_name, characteristic_id)
+    axis_definitions = _fetch_map_axis_definitions(a2l_id, characteristic_name, characteristic_id, axis_pts_index)
     if not axis_definitions:
         logger.warning("MAP %s 未找到 X/Y 轴定义", characteristic_name)
         return None
@@ -1553,6 +1686,8 @@ def parse_and_save_all_characteristics(
     except FileNotFoundError:
         logger.error("HEX 文件不存在: %s", hex_path)
         raise
+    # CURVE/MAP 的轴点按名称查找，整批共用一份 AxisPts 索引，避免逐个查询数据库
+    axis_pts_index = _AxisPtsIndex(a2l_id)
     
     for characteristic in characteristics:
         char_name = characteristic.name
@@ -1653,6 +1788,7 @@ def parse_and_save_all_characteristics(
                     characteristic_name=char_name,
                     characteristic_id=characteristic.id,  # 传入 characteristic ID，避免同名不同地址的记录冲突
                     hex_file_obj=shared_hex_file,
+                    axis_pts_index=axis_pts_index,
                 )
                 if result:
                     # CURVE 类型需要存储 Y 轴数据（主数据）和 X 轴数据（可选）
@@ -1689,6 +1825,7 @@ def parse_and_save_all_characteristics(
                     characteristic_name=char_name,
                     characteristic_id=characteristic.id,  # 传入 characteristic ID，避免同名不同地址的记录冲突
                     hex_file_obj=shared_hex_file,
+                    axis_pts_index=axis_pts_index,
                 )
                 if result:
                     # MAP 类型需要存储 Z 数据（二维矩阵），保持多维结构